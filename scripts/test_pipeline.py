@@ -7,6 +7,7 @@ This does NOT validate financial correctness. It only ensures:
 - scoring coverage is above a minimum threshold
 - zero scores are allowed (common for crypto in bear trends) but non-crypto zero scores can be limited
 - UI contract matches expected schema (prevents the UI from silently breaking)
+- the UI's pyarrow CSV reader (if installed) returns the same frame as pandas
 
 Usage:
   python scripts/test_pipeline.py
@@ -112,6 +113,24 @@ def main() -> int:
                 for m in msgs[:8]:
                     problems.append(f"  - {m}")
 
+    # reader gate: the pyarrow fast path must give the same frame as pd.read_csv
+    wl_path = Path(args.watchlist)
+    if wl_path.exists():
+        try:
+            from scanner.ui.generator import _PACSV, _read_watchlist_csv
+        except Exception as e:
+            problems.append(f"could not import UI CSV reader: {e}")
+        else:
+            if _PACSV is not None:
+                try:
+                    pd.testing.assert_frame_equal(
+                        _read_watchlist_csv(wl_path),
+                        pd.read_csv(wl_path, float_precision="round_trip"),
+                        check_exact=True,
+                    )
+                except AssertionError as e:
+                    problems.append(f"pyarrow CSV reader differs from pandas: {str(e).splitlines()[0]}")
+
     # briefing gate (deterministic, offline)
     try:
         from scanner.reports.briefing import build_briefing_from_csv, validate_briefing_json, write_briefing_outputs
@@ -19,3 +19,11 @@ def artifacts_dir() -> Path:
     p = project_root() / "artifacts"
     p.mkdir(parents=True, exist_ok=True)
     return p
+
+
+def cache_dir() -> Path:
+    """
+    Lokaler Build-Cache (gitignored, nicht unter artifacts/, das CI committet).
+    Wird nicht angelegt; Schreiber erzeugen ihre Unterordner selbst.
+    """
+    return project_root() / ".cache"
@@ -10,13 +10,17 @@ Design goals
 - Testable: stable output JSON + light validation.
 """
 
+import asyncio
+import functools
+import gzip
 import json
+import math
 import os
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Final
 
 import pandas as pd
 
@@ -717,6 +721,21 @@ def validate_briefing_json(briefing: dict[str, Any]) -> tuple[bool, list[str]]:
     return len(errs) == 0, errs
 
 
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write via a temp file + rename so readers never see a truncated file."""
+    tmp = path.with_name(path.name + ".tmp")
+    # O_BINARY (Windows only) keeps newlines untranslated
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
 def write_briefing_outputs(
     *,
     briefing: dict[str, Any],
@@ -729,12 +748,12 @@ def write_briefing_outputs(
     p_txt = output_dir / "briefing.txt"
     p_ai = output_dir / "briefing_ai.txt"
 
-    p_json.write_text(json.dumps(briefing, ensure_ascii=False, indent=2), encoding="utf-8")
-    p_txt.write_text(render_briefing_txt(briefing), encoding="utf-8")
+    _atomic_write_bytes(p_json, json.dumps(briefing, ensure_ascii=False, indent=2).encode("utf-8"))
+    _atomic_write_bytes(p_txt, render_briefing_txt(briefing).encode("utf-8"))
 
     out = {"json": p_json, "txt": p_txt}
     if write_ai and ai_text:
-        p_ai.write_text(ai_text.strip() + "\n", encoding="utf-8")
+        _atomic_write_bytes(p_ai, (ai_text.strip() + "\n").encode("utf-8"))
         out["ai_txt"] = p_ai
     return out
 
@@ -743,122 +762,137 @@ def write_briefing_outputs(
 # Optional AI enhancement
 # ---------------------------
 
+_SYSTEM_PROMPT: Final[str] = (
+    "Du bist ein Assistenzsystem für ein privates Trading-Research-Dashboard. "
+    "WICHTIG: Keine Anlageberatung, keine Kauf-/Verkaufsempfehlungen. "
+    "Nutze ausschließlich die Informationen aus dem JSON (briefing.json). "
+    "Rechne keine Scores neu und erfinde keine Daten. "
+    "Schreibe auf Deutsch, kurz, präzise, nachvollziehbar. "
+    "Baue am Ende einen kurzen Disclaimer ein: privat/experimentell, keine Anlageberatung."
+)
+
+_USER_PREFIX: Final[str] = (
+    "Bitte erstelle eine sprachlich glatte Kurz-Zusammenfassung (Briefing) für die Top-Werte.\n\n"
+    "Format:\n"
+    "- Titelzeile: 'Scanner_vNext Briefing (AI)'\n"
+    "- Danach pro Asset: 3–6 Bulletpoints (Warum oben, Chancen/Risiken kurz, Datenqualität, Regime-Hinweis).\n"
+    "- Optional: 3–6 generische 'Nächste Checks' (keine Beratung).\n\n"
+    "Input JSON:\n"
+)
+
+# Sticky endpoint choice per (api_base, model): "responses" or "chat".
+# Accounts without Responses access skip the failing probe after the first call.
+_ENDPOINT_CACHE: dict[tuple[str, str], str] = {}
+
+# Request bodies above this size are sent gzip-compressed.
+_GZIP_MIN_BYTES: Final[int] = 4096
+
+# Only the official API is known to accept gzip request bodies; OPENAI_API_BASE
+# proxies and self-hosted servers (vLLM, Ollama, LiteLLM, ...) often answer 400/415.
+_GZIP_HOSTS: Final[frozenset[str]] = frozenset({"api.openai.com"})
+
 
 def _extract_output_text(resp: dict[str, Any]) -> str:
     # Try common fields first
-    if isinstance(resp.get("output_text"), str) and resp["output_text"].strip():
-        return resp["output_text"].strip()
+    if isinstance(t := resp.get("output_text"), str) and (t := t.strip()):
+        return t
 
     out = resp.get("output")
     if not isinstance(out, list):
         return ""
-    parts: list[str] = []
-    for item in out:
-        if not isinstance(item, dict):
-            continue
-        if item.get("type") != "message":
-            continue
-        content = item.get("content")
-        if not isinstance(content, list):
-            continue
-        for c in content:
-            if not isinstance(c, dict):
+    parts = [
+        c["text"].strip()
+        for item in out
+        if isinstance(item, dict) and item.get("type") == "message" and isinstance(item.get("content"), list)
+        for c in item["content"]
+        if isinstance(c, dict) and c.get("type") == "output_text" and isinstance(c.get("text"), str) and c["text"].strip()
+    ]
+    return "\n".join(parts)
+
+
+# Meta fields the model never needs for the prose briefing.
+_SLIM_DROP_META: Final[frozenset[str]] = frozenset({"schema_version", "source_csv"})
+
+
+def _slim_value(v: Any) -> Any:
+    if isinstance(v, float):
+        return round(v, 4) if math.isfinite(v) else None
+    if isinstance(v, dict):
+        out = {}
+        for k, x in v.items():
+            if str(k).startswith(("raw_", "debug_")):
                 continue
-            if c.get("type") == "output_text" and isinstance(c.get("text"), str):
-                parts.append(c.get("text"))
-    return "\n".join([p.strip() for p in parts if p and p.strip()]).strip()
-
+            x = _slim_value(x)
+            if x is None or x == "" or x == [] or x == {}:
+                continue
+            out[k] = x
+        return out
+    if isinstance(v, (list, tuple)):
+        return [x for x in (_slim_value(x) for x in v) if x is not None and x != "" and x != [] and x != {}]
+    return v
 
-def generate_ai_briefing_text(
-    briefing_json: dict[str, Any],
-    *,
-    model: str,
-    api_key: str | None = None,
-    api_base: str | None = None,
-    timeout_s: int = 30,
-) -> str:
-    """Generate an AI-enhanced German briefing from briefing.json.
 
-    Uses OpenAI API via plain HTTP (stdlib) to avoid adding dependencies.
+def _slim_briefing(briefing_json: dict[str, Any]) -> dict[str, Any]:
+    """Compact copy of briefing.json for the AI prompt (input tokens are paid).
 
-    We try the newer Responses API first and fall back to Chat Completions if
-    the endpoint isn't available in the user's account/environment.
+    Drops empty values, raw_/debug_ keys and bookkeeping meta, and rounds floats
+    to 4 decimals. briefing.json on disk is untouched.
     """
+    slim = _slim_value(briefing_json)
+    meta = slim.get("meta")
+    if isinstance(meta, dict):
+        slim["meta"] = {k: v for k, v in meta.items() if k not in _SLIM_DROP_META}
+    return slim
+
+
+def _max_output_tokens(user: str) -> int:
+    # ~4 chars per token for German text + JSON; answer budget ~1/3 of the input.
+    # 800 is the floor (enough for 3 assets x 3-6 bullets + checks + disclaimer); only scale up.
+    approx_input_tokens = len(user) // 4
+    return min(1600, max(800, approx_input_tokens // 3))
+
 
+@dataclass(frozen=True)
+class _AIRequest:
+    endpoint_key: tuple[str, str]
+    headers: dict[str, str]
+    url_responses: str
+    payload_responses: dict[str, Any]
+    url_chat: str
+    payload_chat: dict[str, Any]
+
+
+def _resolve_api(api_key: str | None, api_base: str | None) -> tuple[str, str]:
     api_key = api_key or os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY not set")
 
     api_base = (api_base or os.getenv("OPENAI_API_BASE") or "https://api.openai.com/v1").rstrip("/")
-    url_responses = f"{api_base}/responses"
-    url_chat = f"{api_base}/chat/completions"
-
-    system = (
-        "Du bist ein Assistenzsystem für ein privates Trading-Research-Dashboard. "
-        "WICHTIG: Keine Anlageberatung, keine Kauf-/Verkaufsempfehlungen. "
-        "Nutze ausschließlich die Informationen aus dem JSON (briefing.json). "
-        "Rechne keine Scores neu und erfinde keine Daten. "
-        "Schreibe auf Deutsch, kurz, präzise, nachvollziehbar. "
-        "Baue am Ende einen kurzen Disclaimer ein: privat/experimentell, keine Anlageberatung."
-    )
+    return api_key, api_base
+
+
+def _briefing_prompt(briefing_json: dict[str, Any]) -> str:
+    return _USER_PREFIX + json.dumps(_slim_briefing(briefing_json), ensure_ascii=False, separators=(",", ":"))
 
-    user = (
-        "Bitte erstelle eine sprachlich glatte Kurz-Zusammenfassung (Briefing) für die Top-Werte.\n\n"
-        "Format:\n"
-        "- Titelzeile: 'Scanner_vNext Briefing (AI)'\n"
-        "- Danach pro Asset: 3–6 Bulletpoints (Warum oben, Chancen/Risiken kurz, Datenqualität, Regime-Hinweis).\n"
-        "- Optional: 3–6 generische 'Nächste Checks' (keine Beratung).\n\n"
-        "Input JSON:\n" + json.dumps(briefing_json, ensure_ascii=False)
-    )
+
+def _build_ai_request(system: str, user: str, *, model: str, api_key: str, api_base: str) -> _AIRequest:
+    max_out = _max_output_tokens(user)
 
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
 
-    # stdlib HTTP to keep deps minimal
-    import urllib.error
-    import urllib.request
-
-    def _post_json(url: str, payload: dict[str, Any]) -> tuple[int, str]:
-        body = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(url, data=body, headers=headers, method="POST")
-        try:
-            with urllib.request.urlopen(req, timeout=timeout_s) as resp:
-                raw = resp.read().decode("utf-8", errors="replace")
-                return int(getattr(resp, "status", 200)), raw
-        except urllib.error.HTTPError as e:  # noqa: PERF203
-            raw = e.read().decode("utf-8", errors="replace") if getattr(e, "fp", None) else ""
-            return int(getattr(e, "code", 500)), raw
-        except Exception as e:  # network errors
-            raise RuntimeError(f"OpenAI API request failed: {e}")
-
-    # 1) Try Responses API
     payload_responses = {
         "model": model,
         "instructions": system,
         "input": user,
         "temperature": 0.0,
         "top_p": 1.0,
-        "max_output_tokens": 800,
+        "max_output_tokens": max_out,
         "text": {"format": {"type": "text"}},
+        "stream": True,
     }
-    status, raw = _post_json(url_responses, payload_responses)
-    if status < 400:
-        try:
-            data = json.loads(raw)
-        except Exception as e:
-            raise RuntimeError(f"OpenAI Responses API returned invalid JSON: {e}")
-        text = _extract_output_text(data)
-        if not text:
-            raise RuntimeError("OpenAI response had no text output")
-        return text.strip() + "\n"
-
-    # 2) Fallback: Chat Completions API (older but widely supported)
-    # Only fallback for endpoint-ish failures; otherwise raise.
-    if status not in (404, 405):
-        raise RuntimeError(f"OpenAI API error {status}: {raw[:400]}")
-
     payload_chat = {
         "model": model,
         "messages": [
@@ -867,20 +901,232 @@ def generate_ai_briefing_text(
         ],
         "temperature": 0.0,
         "top_p": 1.0,
-        "max_tokens": 800,
+        "max_tokens": max_out,
     }
-    status2, raw2 = _post_json(url_chat, payload_chat)
-    if status2 >= 400:
-        raise RuntimeError(f"OpenAI API error {status2}: {raw2[:400]}")
+    return _AIRequest(
+        endpoint_key=(api_base, model),
+        headers=headers,
+        url_responses=f"{api_base}/responses",
+        payload_responses=payload_responses,
+        url_chat=f"{api_base}/chat/completions",
+        payload_chat=payload_chat,
+    )
+
+
+def _encode_body(url: str, payload: dict[str, Any], headers: dict[str, str]) -> tuple[bytes, dict[str, str]]:
+    import urllib.parse
+
+    body = json.dumps(payload).encode("utf-8")
+    if len(body) > _GZIP_MIN_BYTES and urllib.parse.urlsplit(url).hostname in _GZIP_HOSTS:
+        # level 1 is several times faster than the default and compresses JSON nearly as well
+        return gzip.compress(body, compresslevel=1), dict(headers, **{"Content-Encoding": "gzip"})
+    return body, headers
+
+
+def _read_body(resp: Any) -> bytes:
+    raw = resp.read()
+    if (resp.headers.get("Content-Encoding") or "").lower() == "gzip":
+        raw = gzip.decompress(raw)
+    return raw
+
+
+def _post_json(url: str, payload: dict[str, Any], *, headers: dict[str, str], timeout_s: int) -> tuple[int, bytes]:
+    # stdlib HTTP to keep deps minimal.
+    # The body stays bytes: json.loads parses it directly, errors decode only the snippet they show.
+    import http.client
+    import urllib.error
+    import urllib.request
+
+    body, headers = _encode_body(url, payload, headers)
+    req = urllib.request.Request(url, data=body, headers=dict(headers, **{"Accept-Encoding": "gzip"}), method="POST")
     try:
-        data2 = json.loads(raw2)
-        choices = data2.get("choices")
+        with urllib.request.urlopen(req, timeout=timeout_s) as resp:
+            return int(getattr(resp, "status", 200)), _read_body(resp)
+    except urllib.error.HTTPError as e:  # noqa: PERF203
+        return int(getattr(e, "code", 500)), (_read_body(e) if getattr(e, "fp", None) else b"")
+    except (http.client.HTTPException, OSError) as e:  # network errors (URLError/timeouts are OSError)
+        raise RuntimeError(f"OpenAI API request failed: {e}")
+
+
+def _post_sse_text(
+    url: str,
+    payload: dict[str, Any],
+    *,
+    headers: dict[str, str],
+    timeout_s: int,
+    on_delta: Callable[[str], None] | None = None,
+) -> tuple[int, str]:
+    """POST a streaming Responses request and collect the output_text deltas.
+
+    Returns ``(status, text)``. For HTTP errors the raw error body is returned
+    instead of text, mirroring :func:`_post_json`. A plain JSON 2xx reply (server
+    ignored ``stream``) is parsed like a non-streaming response.
+    """
+    import http.client
+    import urllib.error
+    import urllib.request
+
+    body, headers = _encode_body(url, payload, headers)
+    req = urllib.request.Request(
+        url, data=body, headers=dict(headers, Accept="text/event-stream"), method="POST"
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=timeout_s) as resp:
+            status = int(getattr(resp, "status", 200))
+            if "text/event-stream" not in (resp.headers.get("Content-Type") or "").lower():
+                # Some OPENAI_API_BASE targets ignore "stream": true and answer with plain JSON.
+                try:
+                    data = json.loads(_read_body(resp))
+                except ValueError as e:
+                    raise RuntimeError(f"OpenAI Responses API returned invalid JSON: {e}")
+                return status, _extract_output_text(data) if isinstance(data, dict) else ""
+            parts: list[str] = []
+            completed = False
+            for line in resp:
+                if not line.startswith(b"data:"):
+                    continue
+                data = line[5:].strip()
+                if not data or data == b"[DONE]":
+                    continue
+                try:
+                    ev = json.loads(data)
+                except ValueError:
+                    continue
+                typ = ev.get("type")
+                if typ == "response.output_text.delta" and isinstance(ev.get("delta"), str):
+                    parts.append(ev["delta"])
+                    if on_delta is not None:
+                        on_delta(ev["delta"])
+                elif typ == "response.completed":
+                    if not parts and isinstance(ev.get("response"), dict):
+                        parts.append(_extract_output_text(ev["response"]))
+                    completed = True
+                    break
+                elif typ == "response.incomplete":
+                    # Hit max_output_tokens (or similar): don't return/cache a cut-off briefing.
+                    raise RuntimeError(f"OpenAI response incomplete: {data[:400].decode('utf-8', errors='replace')}")
+                elif typ in ("error", "response.failed"):
+                    raise RuntimeError(f"OpenAI stream error: {data[:400].decode('utf-8', errors='replace')}")
+            if not completed:
+                # Dropped connection or early close: don't return/cache a truncated briefing.
+                raise RuntimeError("OpenAI stream ended before response.completed")
+            return status, "".join(parts)
+    except urllib.error.HTTPError as e:  # noqa: PERF203
+        raw = e.read().decode("utf-8", errors="replace") if getattr(e, "fp", None) else ""
+        return int(getattr(e, "code", 500)), raw
+    except (http.client.HTTPException, OSError) as e:  # network errors (URLError/timeouts are OSError)
+        raise RuntimeError(f"OpenAI API request failed: {e}")
+
+
+def _responses_text(text: str) -> str:
+    text = text.strip()
+    if not text:
+        raise RuntimeError("OpenAI response had no text output")
+    return text + "\n"
+
+
+def _parse_chat_raw(raw: bytes) -> str:
+    try:
+        data = json.loads(raw)
+        choices = data.get("choices")
         if not isinstance(choices, list) or not choices:
             raise RuntimeError("missing choices")
+        finish_reason = choices[0].get("finish_reason")
         msg = choices[0].get("message") or {}
-        text2 = msg.get("content")
-        if not isinstance(text2, str) or not text2.strip():
+        text = msg.get("content")
+        if not isinstance(text, str) or not text.strip():
             raise RuntimeError("no message.content")
-        return text2.strip() + "\n"
     except Exception as e:
         raise RuntimeError(f"OpenAI Chat Completions returned unexpected JSON: {e}")
+    if finish_reason == "length":
+        raise RuntimeError("OpenAI Chat Completions output truncated (finish_reason=length)")
+    return text.strip() + "\n"
+
+
+@functools.lru_cache(maxsize=128)
+def _call_openai(
+    system: str,
+    user: str,
+    model: str,
+    api_base: str,
+    api_key: str,
+    timeout_s: int,
+    on_delta: Callable[[str], None] | None = None,
+) -> str:
+    req = _build_ai_request(system, user, model=model, api_key=api_key, api_base=api_base)
+
+    # 1) Try Responses API (SSE stream), unless this endpoint is known to be missing
+    if _ENDPOINT_CACHE.get(req.endpoint_key) != "chat":
+        status, raw = _post_sse_text(
+            req.url_responses, req.payload_responses, headers=req.headers, timeout_s=timeout_s, on_delta=on_delta
+        )
+        if status < 400:
+            _ENDPOINT_CACHE[req.endpoint_key] = "responses"
+            return _responses_text(raw)
+
+        # 2) Fallback: Chat Completions API (older but widely supported)
+        # Only fallback for endpoint-ish failures; otherwise raise.
+        if status not in (404, 405):
+            raise RuntimeError(f"OpenAI API error {status}: {raw[:400]}")
+        _ENDPOINT_CACHE[req.endpoint_key] = "chat"
+
+    status2, raw2 = _post_json(req.url_chat, req.payload_chat, headers=req.headers, timeout_s=timeout_s)
+    if status2 >= 400:
+        raise RuntimeError(f"OpenAI API error {status2}: {raw2[:400].decode('utf-8', errors='replace')}")
+    return _parse_chat_raw(raw2)
+
+
+def generate_ai_briefing_text(
+    briefing_json: dict[str, Any],
+    *,
+    model: str,
+    api_key: str | None = None,
+    api_base: str | None = None,
+    timeout_s: int = 30,
+    on_delta: Callable[[str], None] | None = None,
+) -> str:
+    """Generate an AI-enhanced German briefing from briefing.json.
+
+    Uses OpenAI API via plain HTTP (stdlib) to avoid adding dependencies.
+
+    We try the newer Responses API first (streamed; ``on_delta`` receives text
+    chunks as they arrive) and fall back to Chat Completions if the endpoint
+    isn't available in the user's account/environment.
+    """
+
+    api_key, api_base = _resolve_api(api_key, api_base)
+    user = _briefing_prompt(briefing_json)
+
+    # Identical prompts within one process are answered from memory; streamed
+    # calls (on_delta) always go to the API so the callback sees the text.
+    call = _call_openai if on_delta is None else _call_openai.__wrapped__
+    return call(_SYSTEM_PROMPT, user, model, api_base, api_key, timeout_s, on_delta)
+
+
+async def agenerate_ai_briefing_text(
+    briefing_json: dict[str, Any],
+    *,
+    model: str,
+    api_key: str | None = None,
+    api_base: str | None = None,
+    timeout_s: int = 30,
+    on_delta: Callable[[str], None] | None = None,
+) -> str:
+    """Async variant of :func:`generate_ai_briefing_text`.
+
+    The blocking stdlib HTTP call runs in a worker thread, so several briefings
+    can be awaited together, e.g.
+    ``await asyncio.gather(*(agenerate_ai_briefing_text(b, model=m) for b in briefings))``.
+    """
+
+    # Delegates to the sync call: it shares _call_openai's in-process cache and the sequential
+    # Responses -> Chat order (Chat only after a 404/405), so one request is billed per briefing.
+    return await asyncio.to_thread(
+        generate_ai_briefing_text,
+        briefing_json,
+        model=model,
+        api_key=api_key,
+        api_base=api_base,
+        timeout_s=timeout_s,
+        on_delta=on_delta,
+    )
@@ -2,7 +2,7 @@
 
 """Static UI generator (Phase B2 MVP).
 
-Creates a single self-contained HTML file with:
+Creates the dashboard HTML page with:
 - Preset switcher (CORE/SCORED/TOP/...)
 - Search filter
 - Sortable table
@@ -16,16 +16,24 @@ Run
 Output
 ------
   artifacts/ui/index.html
+  artifacts/ui/app.css    (stylesheet linked by index.html; copy it along with the page)
+  artifacts/ui/help.html  (help page linked from the header)
 """
 
 import argparse
-import html
+import functools
+import gzip
+import hashlib
 import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 import sys
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 # Fix for running directly from ui directory
@@ -39,7 +47,7 @@ from scanner._version import __version__, __build__
 from scanner.data.io.paths import project_root
 from scanner.data.schema.contract import validate_csv
 from scanner.presets.load import load_presets
-from scanner.data.io.paths import artifacts_dir
+from scanner.data.io.paths import artifacts_dir, cache_dir
 
 
 DEFAULT_COLUMNS = [
@@ -107,6 +115,99 @@ DEFAULT_COLUMNS = [
 ]
 
 
+def _try_import_orjson():
+    try:
+        import orjson  # type: ignore
+
+        return orjson
+    except Exception:
+        return None
+
+
+_ORJSON = _try_import_orjson()
+
+
+def _try_import_pyarrow_csv():
+    try:
+        import pyarrow.csv as pacsv  # type: ignore
+
+        return pacsv
+    except Exception:
+        return None
+
+
+_PACSV = _try_import_pyarrow_csv()
+
+
+# Date-like watchlist columns, read as text up front so Arrow never infers date32/timestamp.
+_CSV_TEXT_COLUMNS = ("market_date", "MarketDate")
+
+
+def _read_watchlist_csv(csv_path: Path) -> pd.DataFrame:
+    """Read the watchlist CSV, via Arrow's multithreaded reader when pyarrow is installed.
+
+    Arrow infers more than pd.read_csv does, so date/time columns are pinned to
+    strings (a second read only if an unexpected one shows up) and all-empty
+    columns become float64 NaN. pandas parses floats round-trip exact, as Arrow
+    does, so both paths give the same frame (scripts/test_pipeline.py checks
+    this). Header-only files, duplicate headers and any Arrow failure use pandas.
+    """
+    if _PACSV is not None:
+        try:
+            import pyarrow as pa  # type: ignore
+
+            text_cols = {c: pa.string() for c in _CSV_TEXT_COLUMNS}
+            for _ in range(2):
+                convert = _PACSV.ConvertOptions(strings_can_be_null=True, column_types=text_cols)
+                table = _PACSV.read_csv(csv_path, convert_options=convert)
+                temporal = [f.name for f in table.schema if pa.types.is_temporal(f.type)]
+                if not temporal:
+                    break
+                text_cols.update((c, pa.string()) for c in temporal)
+            names = table.column_names
+            if table.num_rows and not temporal and len(set(names)) == len(names):
+                for i, field in enumerate(table.schema):
+                    if pa.types.is_null(field.type):
+                        table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+                return table.to_pandas()
+        except Exception:
+            pass
+    return pd.read_csv(csv_path, float_precision="round_trip")
+
+
+def _try_import_brotli():
+    try:
+        import brotli  # type: ignore
+
+        return brotli
+    except Exception:
+        return None
+
+
+_BROTLI = _try_import_brotli()
+
+
+def _jdumps(obj: Any) -> str:
+    """Compact JSON for the embedded <script type="application/json"> blocks.
+
+    Uses orjson when installed (much faster for large record lists), stdlib json otherwise.
+    """
+    if _ORJSON is not None:
+        try:
+            return _ORJSON.dumps(obj, option=_ORJSON.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+# Same output as html.escape(s, quote=True), but a single C-level translate pass.
+_HTML_ESC = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+
+
+def _esc(s: str) -> str:
+    return s.translate(_HTML_ESC)
+
+
 def _repair_mojibake_text(text: str) -> str:
     """Best-effort repair for common UTF-8/cp1252 mojibake sequences."""
     if not text:
@@ -143,77 +244,189 @@ def _repair_mojibake_text(text: str) -> str:
     return out
 
 
-def _to_json_records(df: pd.DataFrame) -> list[dict[str, Any]]:
-    # Ensure JSON-safe primitives (no numpy types)
-    out: list[dict[str, Any]] = []
-    for _, r in df.iterrows():
-        row: dict[str, Any] = {}
-        for k, v in r.items():
-            if pd.isna(v):
-                row[k] = None
-            elif isinstance(v, (bool, int, float, str)):
-                row[k] = v
-            else:
-                # pandas / numpy scalars
-                try:
-                    row[k] = v.item()  # type: ignore[attr-defined]
-                except Exception:
-                    row[k] = str(v)
-        out.append(row)
+# Significant digits kept for floats in the embedded JSON (float32-like precision).
+_JSON_FLOAT_DIGITS = 7
+
+# Smaller magnitudes (incl. subnormals) are left as-is: their 10**-exp scale would
+# overflow to inf and inf * ~0 turns the value into NaN.
+_JSON_FLOAT_MIN_ABS = 1e-300
+
+
+def _quantize_floats(values: np.ndarray, digits: int = _JSON_FLOAT_DIGITS) -> np.ndarray:
+    """Round to ``digits`` significant digits, never coarser than whole units.
+
+    Values such as 37.42090677261349 serialize as 37.42091, roughly halving the
+    numeric text in the payload; integers stay exact, NaN/inf/0 and magnitudes
+    below _JSON_FLOAT_MIN_ABS are untouched.
+    """
+    out = values.copy()
+    mask = np.isfinite(values) & (np.abs(values) >= _JSON_FLOAT_MIN_ABS)
+    if not mask.any():
+        return out
+    x = values[mask]
+    exp = np.minimum(np.floor(np.log10(np.abs(x))).astype(np.int64) - (digits - 1), 0)
+    scale = 10.0 ** -exp
+    out[mask] = np.round(x * scale) / scale
     return out
 
 
+def _json_column(s: pd.Series) -> list[Any]:
+    """One column as JSON-safe Python values, converted with a single per-dtype call.
+
+    numpy bool/int columns cannot hold NaN and ``tolist()`` already yields Python
+    scalars; float columns are quantized (see _quantize_floats) and map NaN -> None. Everything else (strings,
+    nullable extension dtypes, objects) is boxed and masked.
+    """
+    kind = s.dtype.kind if isinstance(s.dtype, np.dtype) else ""
+    if kind in ("b", "i", "u"):
+        return s.to_numpy().tolist()
+    if kind == "f":
+        return [None if v != v else v for v in _quantize_floats(s.to_numpy(dtype=np.float64)).tolist()]
+    return s.astype(object).where(s.notna(), None).tolist()
+
+
+def _to_json_table(df: pd.DataFrame) -> dict[str, Any]:
+    """Columnar payload for the UI: column names once plus one value list per column.
+
+    Ensures JSON-safe primitives (no numpy types); NaN/NA cells become None.
+    Column-major keeps the parsed array count at ``len(cols)`` instead of one
+    array per row; the browser rebuilds the row objects from ``cols`` + ``data``.
+    """
+    return {
+        "cols": [str(c) for c in df.columns],
+        "n": int(len(df)),
+        "data": [_json_column(df[c]) for c in df.columns],
+    }
+
+
+# Column order of the <noscript> fallback table.
+_FALLBACK_COLUMNS = ("ticker", "name", "price", "score", "confidence", "cycle", "trend_ok", "liquidity_ok", "score_status", "is_crypto")
+
+
 def _render_fallback_tbody(df: pd.DataFrame, limit: int = 250) -> str:
-    """Pre-render a simple tbody so the page isn't blank if JS fails.
+    """Pre-render a simple tbody so the page isn't blank without JS.
 
-    JS will replace this immediately on successful load.
+    The rows are emitted inside <noscript>, so JS-enabled browsers never build
+    DOM for them; ``limit <= 0`` drops the rows entirely.
     """
+    if limit <= 0:
+        return '<tr><td colspan="10" class="muted">JavaScript ist deaktiviert.</td></tr>'
     if df.empty:
         return '<tr><td colspan="10" class="muted">Keine Daten.</td></tr>'
 
-    work = df.copy()
+    work = df
     if "score" in work.columns:
         work = work.sort_values(by="score", ascending=False, na_position="last")
     work = work.head(limit)
 
-    def esc(v: Any) -> str:
-        s = "" if v is None or (isinstance(v, float) and pd.isna(v)) else str(v)
-        return html.escape(s)
-
-    rows: list[str] = []
-    for _, r in work.iterrows():
-        price = r.get("price")
-        if price is None or (isinstance(price, float) and pd.isna(price)):
-            price = r.get("Akt. Kurs")
-
-        rows.append(
-            "<tr>"
-            f'<td class="mono">{esc(r.get("ticker"))}</td>'
-            f'<td>{esc(r.get("name"))}</td>'
-            f'<td class="mono right">{esc(price)}</td>'
-            f'<td class="mono right">{esc(r.get("score"))}</td>'
-            f'<td class="mono right hide-sm">{esc(r.get("confidence"))}</td>'
-            f'<td class="mono right hide-sm">{esc(r.get("cycle"))}</td>'
-            f'<td class="mono">{esc(r.get("trend_ok"))}</td>'
-            f'<td class="mono">{esc(r.get("liquidity_ok"))}</td>'
-            f'<td class="mono">{esc(r.get("score_status"))}</td>'
-            f'<td class="mono hide-sm">{"CRYPTO" if bool(r.get("is_crypto")) else "STOCK"}</td>'
-            "</tr>"
-        )
+    # Align the display columns once (missing ones become empty), then escape the
+    # whole block (per column: DataFrame.map needs pandas 2.1) and unpack rows positionally.
+    text = work.reindex(columns=list(_FALLBACK_COLUMNS))
+    if "price" not in work.columns and "Akt. Kurs" in work.columns:
+        text["price"] = work["Akt. Kurs"]
+    elif "Akt. Kurs" in work.columns:
+        text["price"] = work["price"].where(work["price"].notna(), work["Akt. Kurs"])
+    text = text.astype(object).where(text.notna(), "").astype(str).apply(lambda s: s.map(_esc))
+
+    if "is_crypto" in work.columns:
+        text["is_crypto"] = np.where(work["is_crypto"].astype(bool), "CRYPTO", "STOCK")
+    else:
+        text["is_crypto"] = "STOCK"
+
+    rows = [
+        "<tr>"
+        f'<td class="mono">{t}</td>'
+        f"<td>{nm}</td>"
+        f'<td class="mono right">{p}</td>'
+        f'<td class="mono right">{sc}</td>'
+        f'<td class="mono right hide-sm">{cf}</td>'
+        f'<td class="mono right hide-sm">{cy}</td>'
+        f'<td class="mono">{tr}</td>'
+        f'<td class="mono">{lq}</td>'
+        f'<td class="mono">{st}</td>'
+        f'<td class="mono hide-sm">{c}</td>'
+        "</tr>"
+        for t, nm, p, sc, cf, cy, tr, lq, st, c in text.itertuples(index=False, name=None)
+    ]
     return "".join(rows)
 
 
+def _validation_key(csv_path: Path, contract_path: Path) -> list[int | str] | None:
+    """Identity of (CSV path + stat, contract path + content hash); None if either cannot be read."""
+    try:
+        cs = csv_path.stat()
+        contract_digest = hashlib.sha256(contract_path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+    return [str(csv_path.resolve()), cs.st_mtime_ns, cs.st_size, str(contract_path.resolve()), contract_digest]
+
+
+def _is_validated(marker: Path, key: list[int | str] | None) -> bool:
+    if key is None:
+        return False
+    try:
+        return json.loads(marker.read_text(encoding="utf-8")).get("key") == key
+    except (OSError, ValueError, AttributeError):
+        return False
+
+
+def _mark_validated(marker: Path, key: list[int | str] | None) -> None:
+    # Best-effort cache; a failed write only means the next build validates again.
+    if key is None:
+        return
+    try:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.write_text(json.dumps({"key": key}), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _write_precompressed(path: Path, data: bytes) -> None:
+    """Write <path>.gz (and <path>.br if brotli is installed) for static servers.
+
+    gzip mtime is pinned to 0 so unchanged pages produce byte-identical archives.
+    """
+    path.with_name(path.name + ".gz").write_bytes(gzip.compress(data, compresslevel=6, mtime=0))
+    if _BROTLI is not None:
+        path.with_name(path.name + ".br").write_bytes(_BROTLI.compress(data, quality=6))
+
+
+def _scan_dir(path: Path) -> dict[str, os.DirEntry]:
+    """Regular files in ``path`` by name (single scandir); {} if the directory is missing."""
+    try:
+        with os.scandir(path) as it:
+            return {e.name: e for e in it if e.is_file()}
+    except OSError:
+        return {}
+
+
+def _read_text_lenient(entry: os.DirEntry) -> str:
+    return Path(entry.path).read_text(encoding="utf-8", errors="replace")
+
+
+def _resolve(p: str | Path) -> Path:
+    """Resolve a relative path against the project root; absolute paths pass through."""
+    p = Path(p)
+    return p if p.is_absolute() else project_root() / p
+
+
+# Text columns trimmed/blank-filled for display before rendering.
+_DISPLAY_STRING_COLUMNS = ("ticker", "ticker_display", "yahoo_symbol", "YahooSymbol", "symbol", "name", "sector", "country", "currency", "score_status")
+
+
 def build_ui(
     *,
     csv_path: str | Path,
     out_html: str | Path,
     contract_path: str | Path,
     columns: list[str] | None = None,
+    fallback_rows: int = 20,
+    precompress: bool = False,
 ) -> Path:
     root = project_root()
-    csv_path = (root / csv_path) if not Path(csv_path).is_absolute() else Path(csv_path)
-    out_html = (root / out_html) if not Path(out_html).is_absolute() else Path(out_html)
-    contract_path = (root / contract_path) if not Path(contract_path).is_absolute() else Path(contract_path)
+    csv_path = _resolve(csv_path)
+    out_html = _resolve(out_html)
+    contract_path = _resolve(contract_path)
 
     # If the default ALL view is requested but not yet generated, fall back gracefully.
     if not csv_path.exists():
@@ -231,16 +444,22 @@ def build_ui(
             if c.exists():
                 csv_path = c
                 break
-    # Validate contract (fail fast)
-    res = validate_csv(csv_path, contract_path)
-    if not res.ok:
-        msg = "\n".join(["Contract validation failed:"] + [" - " + e for e in res.errors])
-        raise RuntimeError(msg)
-
-    df = pd.read_csv(csv_path)
+    # Validate contract (fail fast); skipped when CSV and contract are unchanged since the last pass
+    # The marker lives in the local cache, not next to the output: CI commits artifacts/.
+    # Same-named CSVs from different directories get separate markers.
+    csv_tag = hashlib.sha256(str(csv_path.resolve()).encode("utf-8")).hexdigest()[:12]
+    validated_marker = cache_dir() / "ui" / f"validated_{csv_path.name}_{csv_tag}.json"
+    validation_key = _validation_key(csv_path, contract_path)
+    if not _is_validated(validated_marker, validation_key):
+        res = validate_csv(csv_path, contract_path)
+        if not res.ok:
+            msg = "\n".join(["Contract validation failed:"] + [" - " + e for e in res.errors])
+            raise RuntimeError(msg)
+        _mark_validated(validated_marker, validation_key)
+
+    df = _read_watchlist_csv(csv_path)
 
     # Ticker Normalizer: Ensure ticker_display is always a real ticker (not ISIN)
-    import re
     isin_pattern = re.compile(r'^[A-Z]{2}[A-Z0-9]{9}[0-9]$')
     
     def normalize_ticker_fields(row):
@@ -272,31 +491,34 @@ def build_ui(
 
     cols = columns or DEFAULT_COLUMNS
     # Keep only columns that exist (UI should not crash if optional fields are missing)
-    keep = [c for c in cols if c in df.columns]
-    df = df[keep].copy()
+    # Column selection already yields a new frame (pandas CoW), so no .copy() needed.
+    df_cols = set(df.columns)
+    keep = [c for c in cols if c in df_cols]
+    df = df[keep]
+    df_cols = set(keep)
+
+    # Mild normalization for display (single assign instead of per-column write-backs)
+    string_cols = [c for c in _DISPLAY_STRING_COLUMNS if c in df_cols]
+    df = df.assign(**{c: df[c].astype("string").fillna("").str.strip() for c in string_cols})
 
-    # Mild normalization for display
-    for c in ("ticker", "ticker_display", "yahoo_symbol", "YahooSymbol", "symbol", "name", "sector", "country", "currency", "score_status"):
-        if c in df.columns:
-            df[c] = df[c].astype("string").fillna("").str.strip()
+    data_table = _to_json_table(df)
+    fallback_tbody_html = _render_fallback_tbody(df, limit=fallback_rows)
+    presets = _cached_presets()
 
-    data_records = _to_json_records(df)
-    fallback_tbody_html = _render_fallback_tbody(df)
-    presets = load_presets()
+    # One directory listing of artifacts/reports replaces the per-file exists() probes below.
+    reports_dir = artifacts_dir() / "reports"
+    reports = _scan_dir(reports_dir)
 
     # Optional daily briefing text (generated by scripts/generate_briefing.py)
     # Prefer AI-enhanced version if present.
     briefing_text = ""
     briefing_source = ""
     try:
-        reports_dir = artifacts_dir() / "reports"
-        bp_ai = reports_dir / "briefing_ai.txt"
-        bp = reports_dir / "briefing.txt"
-        if bp_ai.exists():
-            briefing_text = bp_ai.read_text(encoding="utf-8", errors="replace")
+        if "briefing_ai.txt" in reports:
+            briefing_text = _read_text_lenient(reports["briefing_ai.txt"])
             briefing_source = "artifacts/reports/briefing_ai.txt"
-        elif bp.exists():
-            briefing_text = bp.read_text(encoding="utf-8", errors="replace")
+        elif "briefing.txt" in reports:
+            briefing_text = _read_text_lenient(reports["briefing.txt"])
             briefing_source = "artifacts/reports/briefing.txt"
     except Exception:
         briefing_text = ""
@@ -310,22 +532,16 @@ def build_ui(
     brief_realities_text = ""
     brief_realities_source = ""
     try:
-        reports_dir = artifacts_dir() / "reports"
-        hp = reports_dir / "history_delta.json"
-        sp = reports_dir / "segment_monitor.json"
-        rp = reports_dir / "reality_check.json"
-        mp = reports_dir / "macro_chain_signal.json"
-        brp = reports_dir / "briefing_realities.txt"
-        if hp.exists():
-            history_delta = json.loads(hp.read_text(encoding="utf-8", errors="replace") or "{}")
-        if sp.exists():
-            segment_monitor = json.loads(sp.read_text(encoding="utf-8", errors="replace") or "{}")
-        if rp.exists():
-            reality_check = json.loads(rp.read_text(encoding="utf-8", errors="replace") or "{}")
-        if mp.exists():
-            macro_chain_signal = json.loads(mp.read_text(encoding="utf-8", errors="replace") or "{}")
-        if brp.exists():
-            brief_realities_text = brp.read_text(encoding="utf-8", errors="replace")
+        if "history_delta.json" in reports:
+            history_delta = json.loads(_read_text_lenient(reports["history_delta.json"]) or "{}")
+        if "segment_monitor.json" in reports:
+            segment_monitor = json.loads(_read_text_lenient(reports["segment_monitor.json"]) or "{}")
+        if "reality_check.json" in reports:
+            reality_check = json.loads(_read_text_lenient(reports["reality_check.json"]) or "{}")
+        if "macro_chain_signal.json" in reports:
+            macro_chain_signal = json.loads(_read_text_lenient(reports["macro_chain_signal.json"]) or "{}")
+        if "briefing_realities.txt" in reports:
+            brief_realities_text = _read_text_lenient(reports["briefing_realities.txt"])
             brief_realities_source = "artifacts/reports/briefing_realities.txt"
     except Exception:
         history_delta = {}
@@ -340,11 +556,10 @@ def build_ui(
     run_src = ''
     run_universe = ''
     try:
-        reports_dir = artifacts_dir() / 'reports'
-        bj = reports_dir / 'briefing.json'
+        bj = reports.get('briefing.json')
         meta = {}
-        if bj.exists():
-            obj = json.loads(bj.read_text(encoding='utf-8', errors='replace') or '{}')
+        if bj is not None:
+            obj = json.loads(_read_text_lenient(bj) or '{}')
             meta = (obj.get('meta') or {}) if isinstance(obj, dict) else {}
         ga = str((meta.get('generated_at') or '')).strip()
         if ga:
@@ -360,8 +575,8 @@ def build_ui(
         if uc is not None:
             run_universe = str(uc)
         if not run_at:
-            fp = bj if bj.exists() else (reports_dir / 'briefing.txt')
-            if fp.exists():
+            fp = bj if bj is not None else reports.get('briefing.txt')
+            if fp is not None:
                 dt = datetime.fromtimestamp(fp.stat().st_mtime, tz=timezone.utc)
                 run_at = dt.strftime('%Y-%m-%d %H:%MZ')
     except Exception:
@@ -369,8 +584,8 @@ def build_ui(
         run_src = run_src or ''
         run_universe = run_universe or ''
 
-    html = _render_html(
-        data_records=data_records,
+    html_out = _render_html(
+        data_table=data_table,
         presets=presets,
         source_csv=str(csv_path),
         version=__version__,
@@ -390,362 +605,358 @@ def build_ui(
     )
 
     out_html.parent.mkdir(parents=True, exist_ok=True)
-    html = _repair_mojibake_text(html)
-    out_html.write_text(html, encoding="utf-8-sig")
+    html_out = _repair_mojibake_text(html_out)
+    html_bytes = html_out.encode("utf-8-sig")
+    out_html.write_bytes(html_bytes)
+    if precompress:
+        # Opt-in: CI commits artifacts/, and a binary copy per run would only bloat history.
+        _write_precompressed(out_html, html_bytes)
+    _write_app_css(out_html.parent / "app.css")
 
-    # Help / project description page (static)
-    help_path = out_html.parent / "help.html"
-    help_html = _render_help_html(version=__version__, build=__build__)
-    help_html = _repair_mojibake_text(help_html)
-    help_path.write_text(help_html, encoding="utf-8-sig")
+    # Help / project description page (static; rewritten only when its content changes)
+    _write_help_html(out_html.parent / "help.html", version=__version__, build=__build__)
 
     return out_html
 
 
-def _render_html(*, data_records: list[dict[str, Any]], presets: dict[str, Any], source_csv: str, version: str, build: str, briefing_text: str, briefing_source: str, history_delta: dict[str, Any], segment_monitor: dict[str, Any], reality_check: dict[str, Any], macro_chain_signal: dict[str, Any], briefing_realities_text: str, briefing_realities_source: str, run_at: str, run_src: str, run_universe: str, fallback_tbody_html: str) -> str:
-    data_json = json.dumps(data_records, ensure_ascii=False)
-    presets_json = json.dumps(presets, ensure_ascii=False)
-    briefing_json = json.dumps({"text": briefing_text, "source": briefing_source}, ensure_ascii=False)
-    history_delta_json = json.dumps(history_delta or {}, ensure_ascii=False)
-    segment_monitor_json = json.dumps(segment_monitor or {}, ensure_ascii=False)
-    reality_check_json = json.dumps(reality_check or {}, ensure_ascii=False)
-    macro_chain_json = json.dumps(macro_chain_signal or {}, ensure_ascii=False)
-    briefing_realities_json = json.dumps({"text": briefing_realities_text, "source": briefing_realities_source}, ensure_ascii=False)
+def _warm_worker() -> None:
+    # Per-process warm-up for build_many: presets are read once per worker, not per job.
+    _cached_presets()
 
-    # Server-side preset <option> fallback (so UI isn't empty if JS fails)
-    preset_labels = {
-        "ALL": "Alle Werte",
-        "CORE": "bersicht",
-        "SCORED": "Bewertet",
-        "TOP": "Top",
-        "TOP_RELAXED": "Top (entspannt)",
-        "AVOID": "Vermeiden",
-        "BROKEN": "Fehler/NA",
-    }
-    names = list((presets or {}).keys())
-    names.sort(key=lambda k: (0 if k == "ALL" else (1 if k == "CORE" else 2), k))
-    opts = []
-    for n in names:
-        desc = str(((presets.get(n, {}) or {}).get("description", ""))).strip()
-        label = preset_labels.get(n, n)
-        txt = f"{label} ({n})" + (f"  {desc}" if desc else "")
-        opts.append(f'<option value="{html.escape(n)}">{html.escape(txt)}</option>')
-    preset_options_html = "\n".join(opts)
-
-    # NOTE: We intentionally avoid Python f-strings for the HTML template because the
-    # embedded CSS/JS contains many curly braces. We inject values via simple tokens.
-    template = """<!doctype html>
-<html lang="de">
-<head>
-  <meta charset="utf-8"/>
-  <meta name="viewport" content="width=device-width, initial-scale=1"/>
-  <title>Scanner_vNext  Research Dashboard</title>
-  <style>
-    :root {
-      --bg: #0b0f14;
-      --card: rgba(17,24,39,.72);
-      --muted: #94a3b8;
-      --text: #e5e7eb;
-      --accent: #60a5fa;
-      --good: #34d399;
-      --warn: #fbbf24;
-      --bad: #fb7185;
-      --chip: rgba(31,41,55,.85);
-      --border: #243244;
-      --shadow: 0 10px 30px rgba(0,0,0,.35);
-      --mono: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", "Courier New", monospace;
-      --sans: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial, "Apple Color Emoji", "Segoe UI Emoji";
-      --w-ticker: 110px;
-      --w-name: 220px;
-      --w-price: 130px;
-      --w-score: 170px;
-      --w-dscore: 96px;
-      --w-conf: 70px;
-      --w-cycle: 70px;
-      --w-trend: 70px;
-      --w-liq: 70px;
-      --w-status: 104px;
-      --w-class: 80px;
-    }
-    * { box-sizing: border-box; }
-    body { margin: 0; font-family: var(--sans); background: radial-gradient(1000px 600px at 10% 0%, rgba(96,165,250,.12), transparent 60%), radial-gradient(800px 500px at 90% 10%, rgba(52,211,153,.10), transparent 55%), var(--bg); color: var(--text); }
-    header { padding: 16px 18px; border-bottom: 1px solid var(--border); background: rgba(17,24,39,.72); backdrop-filter: blur(10px); position: sticky; top: 0; z-index: 50; }
-    .title { display: flex; align-items: baseline; gap: 12px; flex-wrap: wrap; }
-    .title h1 { margin: 0; font-size: 18px; font-weight: 700; }
-    .meta { color: var(--muted); font-family: var(--mono); font-size: 12px; }
-    .helpLink { color: var(--accent); text-decoration: none; }
-    .helpLink:hover { text-decoration: underline; }
-
-    .wrap { max-width: 1400px; margin: 0 auto; padding: 18px; }
-    .panel { background: var(--card); border: 1px solid var(--border); border-radius: 14px; box-shadow: var(--shadow); }
-
-    /* Briefing box (passive text; must not influence scoring) */
-    .briefingBox { border: 1px solid rgba(148,163,184,.15); background: rgba(15,23,42,.35); border-radius: 12px; padding: 10px; min-width: 0; }
-    .cardHeader { display:flex; align-items:center; justify-content:space-between; gap:10px; }
-    .cardTitle { font-weight: 700; }
-    .cardActions { display:flex; align-items:center; justify-content:flex-end; gap:8px; flex-wrap:nowrap; position:relative; }
-    .briefHead { display:flex; align-items:center; justify-content: space-between; gap: 10px; margin-bottom: 6px; }
-    .briefingBox .muted { margin-bottom: 8px; }
-    .briefingText { margin: 0; padding: 10px; border-radius: 10px; border: 1px solid rgba(148,163,184,.12); background: rgba(15,23,42,.55); white-space: pre-wrap; max-height: 300px; overflow: auto; font-family: inherit; line-height: 1.50; font-size: 12px; max-width: 100%; overflow-x: hidden; overflow-wrap: anywhere; word-break: break-word; }
-    @media (min-width: 980px) { .briefingText { max-height: 520px; } }
-
-    /* Passive report boxes (History Delta / Segment / Reality) */
-    .reportText { margin: 0; padding: 10px; border-radius: 10px; border: 1px solid rgba(148,163,184,.12); background: rgba(15,23,42,.55); white-space: pre-wrap; max-height: 200px; overflow: auto; font-family: inherit; line-height: 1.50; font-size: 12px; max-width: 100%; overflow-x: hidden; overflow-wrap: anywhere; word-break: break-word; }
-    @media (min-width: 980px) { .reportText { max-height: 180px; } }
-
-
-    .controls { display: grid; grid-template-columns: 220px 1fr 220px 220px auto; gap: 12px; padding: 14px; align-items: center; }
-    .controls label { font-size: 12px; color: var(--muted); }
-    select, input { width: 100%; background: #0f172a; border: 1px solid var(--border); color: var(--text); padding: 10px 12px; border-radius: 10px; outline: none; }
-    input::placeholder { color: #64748b; }
-    .count { justify-self: end; color: var(--muted); font-size: 12px; font-family: var(--mono); }
-
-    .kpis { padding: 0 14px 10px 14px; display:flex; flex-wrap: wrap; gap: 6px; align-items: center; }
-    .kpis .label { color: var(--muted); font-size: 12px; font-family: var(--mono); flex: 0 0 60px; margin-right: 0; }
-
-    .clusters { padding: 0 14px 10px 14px; display:flex; flex-wrap: wrap; gap: 6px; align-items: center; }
-    .clusters .label { color: var(--muted); font-size: 12px; font-family: var(--mono); flex: 0 0 60px; margin-right: 0; }
-    .clusters .chip { padding: 4px 8px; font-size: 11px; line-height: 1.4; }
-
-    .pillars { padding: 0 14px 10px 14px; display:flex; flex-wrap: wrap; gap: 6px; align-items: center; }
-    .pillars .label { color: var(--muted); font-size: 12px; font-family: var(--mono); flex: 0 0 60px; margin-right: 0; }
-    .pillars .chip { padding: 4px 8px; font-size: 11px; line-height: 1.4; }
-
-    .disclaimer {
-      margin: 0 0 12px 0;
-      padding: 10px 14px;
-      border: 1px solid rgba(251,191,36,.35);
-      background: rgba(251,191,36,.08);
-      border-radius: 14px;
-      display:flex;
-      gap: 12px;
-      align-items: center;
-      justify-content: space-between;
-    }
-    .disclaimer b { font-weight: 800; }
-    .disclaimer .txt { color: rgba(226,232,240,.95); line-height: 1.35; font-size: 13px; }
-    .disclaimer .btn { white-space: nowrap; }
-    @media (max-width: 860px) {
-      .disclaimer { flex-direction: column; align-items: flex-start; }
-    }
+
+def build_many(jobs: list[dict[str, Any]], *, max_workers: int | None = None) -> list[Path]:
+    """Run several ``build_ui`` jobs (each a dict of its keyword arguments) in parallel.
+
+    JSON/HTML building is GIL-bound, so jobs fan out to a process pool. help.html and
+    app.css are written once per output directory up front so workers only see
+    up-to-date files. Results keep the order of ``jobs``.
+    """
+    if not jobs:
+        return []
+    if len(jobs) == 1:
+        return [build_ui(**jobs[0])]
+
+    out_dirs = {_resolve(job["out_html"]).parent for job in jobs}
+    for out_dir in out_dirs:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        _write_help_html(out_dir / "help.html", version=__version__, build=__build__)
+        _write_app_css(out_dir / "app.css")
+
+    workers = min(len(jobs), max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker) as ex:
+        futures = [ex.submit(build_ui, **job) for job in jobs]
+        return [f.result() for f in futures]
+
+
+# Dashboard stylesheet, written once as app.css next to the HTML (see _write_app_css)
+# instead of being inlined into every generated page.
+_APP_CSS = """:root {
+  --bg: #0b0f14;
+  --card: rgba(17,24,39,.72);
+  --muted: #94a3b8;
+  --text: #e5e7eb;
+  --accent: #60a5fa;
+  --good: #34d399;
+  --warn: #fbbf24;
+  --bad: #fb7185;
+  --chip: rgba(31,41,55,.85);
+  --border: #243244;
+  --shadow: 0 10px 30px rgba(0,0,0,.35);
+  --mono: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", "Courier New", monospace;
+  --sans: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial, "Apple Color Emoji", "Segoe UI Emoji";
+  --w-ticker: 110px;
+  --w-name: 220px;
+  --w-price: 130px;
+  --w-score: 170px;
+  --w-dscore: 96px;
+  --w-conf: 70px;
+  --w-cycle: 70px;
+  --w-trend: 70px;
+  --w-liq: 70px;
+  --w-status: 104px;
+  --w-class: 80px;
+}
+* { box-sizing: border-box; }
+body { margin: 0; font-family: var(--sans); background: radial-gradient(1000px 600px at 10% 0%, rgba(96,165,250,.12), transparent 60%), radial-gradient(800px 500px at 90% 10%, rgba(52,211,153,.10), transparent 55%), var(--bg); color: var(--text); }
+header { padding: 16px 18px; border-bottom: 1px solid var(--border); background: rgba(17,24,39,.72); backdrop-filter: blur(10px); position: sticky; top: 0; z-index: 50; }
+.title { display: flex; align-items: baseline; gap: 12px; flex-wrap: wrap; }
+.title h1 { margin: 0; font-size: 18px; font-weight: 700; }
+.meta { color: var(--muted); font-family: var(--mono); font-size: 12px; }
+.helpLink { color: var(--accent); text-decoration: none; }
+.helpLink:hover { text-decoration: underline; }
+
+.wrap { max-width: 1400px; margin: 0 auto; padding: 18px; }
+.panel { background: var(--card); border: 1px solid var(--border); border-radius: 14px; box-shadow: var(--shadow); }
+
+/* Briefing box (passive text; must not influence scoring) */
+.briefingBox { border: 1px solid rgba(148,163,184,.15); background: rgba(15,23,42,.35); border-radius: 12px; padding: 10px; min-width: 0; }
+.cardHeader { display:flex; align-items:center; justify-content:space-between; gap:10px; }
+.cardTitle { font-weight: 700; }
+.cardActions { display:flex; align-items:center; justify-content:flex-end; gap:8px; flex-wrap:nowrap; position:relative; }
+.briefHead { display:flex; align-items:center; justify-content: space-between; gap: 10px; margin-bottom: 6px; }
+.briefingBox .muted { margin-bottom: 8px; }
+.briefingText { margin: 0; padding: 10px; border-radius: 10px; border: 1px solid rgba(148,163,184,.12); background: rgba(15,23,42,.55); white-space: pre-wrap; max-height: 300px; overflow: auto; font-family: inherit; line-height: 1.50; font-size: 12px; max-width: 100%; overflow-x: hidden; overflow-wrap: anywhere; word-break: break-word; }
+@media (min-width: 980px) { .briefingText { max-height: 520px; } }
+
+/* Passive report boxes (History Delta / Segment / Reality) */
+.reportText { margin: 0; padding: 10px; border-radius: 10px; border: 1px solid rgba(148,163,184,.12); background: rgba(15,23,42,.55); white-space: pre-wrap; max-height: 200px; overflow: auto; font-family: inherit; line-height: 1.50; font-size: 12px; max-width: 100%; overflow-x: hidden; overflow-wrap: anywhere; word-break: break-word; }
+@media (min-width: 980px) { .reportText { max-height: 180px; } }
+
+
+.controls { display: grid; grid-template-columns: 220px 1fr 220px 220px auto; gap: 12px; padding: 14px; align-items: center; }
+.controls label { font-size: 12px; color: var(--muted); }
+select, input { width: 100%; background: #0f172a; border: 1px solid var(--border); color: var(--text); padding: 10px 12px; border-radius: 10px; outline: none; }
+input::placeholder { color: #64748b; }
+.count { justify-self: end; color: var(--muted); font-size: 12px; font-family: var(--mono); }
+
+.kpis { padding: 0 14px 10px 14px; display:flex; flex-wrap: wrap; gap: 6px; align-items: center; }
+.kpis .label { color: var(--muted); font-size: 12px; font-family: var(--mono); flex: 0 0 60px; margin-right: 0; }
+
+.clusters { padding: 0 14px 10px 14px; display:flex; flex-wrap: wrap; gap: 6px; align-items: center; }
+.clusters .label { color: var(--muted); font-size: 12px; font-family: var(--mono); flex: 0 0 60px; margin-right: 0; }
+.clusters .chip { padding: 4px 8px; font-size: 11px; line-height: 1.4; }
+
+.pillars { padding: 0 14px 10px 14px; display:flex; flex-wrap: wrap; gap: 6px; align-items: center; }
+.pillars .label { color: var(--muted); font-size: 12px; font-family: var(--mono); flex: 0 0 60px; margin-right: 0; }
+.pillars .chip { padding: 4px 8px; font-size: 11px; line-height: 1.4; }
+
+.disclaimer {
+  margin: 0 0 12px 0;
+  padding: 10px 14px;
+  border: 1px solid rgba(251,191,36,.35);
+  background: rgba(251,191,36,.08);
+  border-radius: 14px;
+  display:flex;
+  gap: 12px;
+  align-items: center;
+  justify-content: space-between;
+}
+.disclaimer b { font-weight: 800; }
+.disclaimer .txt { color: rgba(226,232,240,.95); line-height: 1.35; font-size: 13px; }
+.disclaimer .btn { white-space: nowrap; }
+@media (max-width: 860px) {
+  .disclaimer { flex-direction: column; align-items: flex-start; }
+}
   .filters { display:flex; gap: 8px; flex-wrap: wrap; align-items: center; padding: 0 14px 14px 14px; }
-    .fbtn { background: #0f172a; border: 1px solid var(--border); color: var(--text); padding: 6px 10px; border-radius: 999px; cursor: pointer; font-size: 12px; }
-    .fbtn:hover { border-color: rgba(96,165,250,.45); }
-    .fbtn.active { border-color: rgba(96,165,250,.60); box-shadow: 0 0 0 2px rgba(96,165,250,.14) inset; }
-    .fsep { flex: 1; }
-    .hintbtn { margin-left: 10px; color: var(--muted); font-size: 12px; display:inline-flex; align-items:center; gap:6px; cursor: pointer; user-select:none; border: 1px solid rgba(148,163,184,.20); background: rgba(148,163,184,.06); padding: 6px 10px; border-radius: 999px; }
-    .hintbtn:hover { border-color: rgba(148,163,184,.35); }
-    .hintbtn .i { width: 18px; height: 18px; display:inline-flex; align-items:center; justify-content:center; border-radius: 999px; border: 1px solid rgba(148,163,184,.20); background: rgba(148,163,184,.08); font-weight: 700; font-size: 12px; color: #cbd5e1; }
-
-    .popover { position: absolute; z-index: 60; min-width: 280px; max-width: 420px; padding: 12px 12px; border-radius: 14px; border: 1px solid rgba(255,255,255,.12); background: rgba(15,23,42,.98); box-shadow: 0 20px 60px rgba(0,0,0,.55); color: var(--text); display:none; }
-    .popover.show { display:block; }
-    .popover .title { font-weight: 700; margin-bottom: 6px; }
-    .popover .close { float:right; }
-    .popover ul { margin: 8px 0 0 16px; padding: 0; }
-    .popover li { margin: 6px 0; color: var(--muted); }
-
-    a.yf { color: var(--text); text-decoration: none; border-bottom: 1px solid rgba(96,165,250,.22); }
-    a.yf:hover { color: #bfdbfe; border-bottom-color: rgba(96,165,250,.60); }
-
-    table { border-collapse: collapse; }
-    .table-wrap { overflow: auto; max-height: 72vh; }
-    #tbl { table-layout: fixed; width: max-content; min-width: 100%; }
-    #tbl col.col-ticker { width: var(--w-ticker); }
-    #tbl col.col-name   { width: var(--w-name); }
-    #tbl col.col-price  { width: var(--w-price); }
-    #tbl col.col-score  { width: var(--w-score); }
-    #tbl col.col-dscore { width: var(--w-dscore); }
-    #tbl col.col-conf   { width: var(--w-conf); }
-    #tbl col.col-cycle  { width: var(--w-cycle); }
-    #tbl col.col-trend  { width: var(--w-trend); }
-    #tbl col.col-liq    { width: var(--w-liq); }
-    #tbl col.col-status { width: var(--w-status); }
-    #tbl col.col-class  { width: var(--w-class); }
-
-    /* Sticky first columns (Ticker + Name) inside the scroll container */
-    #tbl thead th:nth-child(1),
-    #tbl tbody td:nth-child(1) { position: sticky; left: 0; z-index: 6; }
-    #tbl thead th:nth-child(2),
-    #tbl tbody td:nth-child(2) { position: sticky; left: var(--w-ticker); z-index: 5; }
-
-    /* Ensure sticky cells are opaque */
-    #tbl thead th:nth-child(1),
-    #tbl thead th:nth-child(2) { z-index: 12; }
-    #tbl tbody td:nth-child(1),
-    #tbl tbody td:nth-child(2) { background: rgba(11,15,20,.96); }
-
-    /* Sticky text columns: allow 2 lines, but ellipsis on the main line */
-    #tbl th:nth-child(1), #tbl th:nth-child(2) { white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
-    #tbl td:nth-child(1), #tbl td:nth-child(2) { overflow: hidden; }
-    .tickerMain, .row-title .name { white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
-    /* Table header is sticky *inside the table scroll container* (not the whole page).
-       Therefore top should be 0, otherwise it will "float" too low and hide the first row. */
-    thead th { position: sticky; top: 0; background: #0f172a; border-bottom: 1px solid var(--border); border-right: 1px solid rgba(36,50,68,.45); padding: 10px 10px; text-align: left; font-size: 12px; color: #cbd5e1; cursor: pointer; user-select: none; }
-    tbody td { border-bottom: 1px solid rgba(36,50,68,.55); border-right: 1px solid rgba(36,50,68,.35); padding: 10px 10px; font-size: 13px; vertical-align: middle; }
-    tbody tr:hover td { background: rgba(96,165,250,.07); }
-
-    thead th:last-child, tbody td:last-child { border-right: none; }
-
-
-    .mono { font-family: var(--mono); }
-    .muted { color: var(--muted); }
-    .deltaUp { color: var(--good); }
-    .deltaDown { color: var(--bad); }
-    .deltaFlat { color: var(--muted); }
-    .row-title { display:flex; flex-direction:column; gap:2px; }
-    .name { font-size: 13px; }
-    .sub { font-size: 11px; color: var(--muted); }
-
-    .priceCell { display:flex; flex-direction:column; gap:2px; }
-    .priceMain { font-family: var(--mono); }
-    .chg { font-size: 11px; }
-    .chg.pos { color: var(--good); }
-    .chg.neg { color: var(--bad); }
-    .chg.flat { color: var(--muted); }
-
-    .tickerCell { display:flex; flex-direction:column; gap:2px; }
-    .tickerMain { display:flex; align-items:center; gap:8px; }
-    .tinychip { display:inline-flex; align-items:center; padding: 2px 6px; border-radius: 999px; font-size: 10px; border: 1px solid rgba(148,163,184,.18); background: rgba(148,163,184,.08); color: #cbd5e1; }
-
-    .chip { display:inline-flex; align-items:center; gap:6px; padding: 4px 8px; border-radius: 999px; background: var(--chip); border: 1px solid rgba(148,163,184,.15); font-size: 11px; }
-    .chip.good { border-color: rgba(52,211,153,.25); color: #a7f3d0; }
-    .chip.warn { border-color: rgba(251,191,36,.25); color: #fde68a; }
-    .chip.bad  { border-color: rgba(251,113,133,.25); color: #fecdd3; }
-    .chip.blue { border-color: rgba(96,165,250,.25); color: #bfdbfe; }
-
-
-    /* Encoded recommendation signal pill (private code) */
-    .sig { display:inline-flex; align-items:center; justify-content:center; min-width: 28px; padding: 2px 8px; border-radius: 999px; font-size: 10px; border: 1px solid rgba(148,163,184,.15); background: rgba(148,163,184,.10); color: #e2e8f0; }
-    .sig.good { border-color: rgba(52,211,153,.25); color: #a7f3d0; background: rgba(52,211,153,.08); }
-    .sig.warn { border-color: rgba(251,191,36,.25); color: #fde68a; background: rgba(251,191,36,.08); }
-    .sig.bad  { border-color: rgba(251,113,133,.25); color: #fecdd3; background: rgba(251,113,133,.08); }
-    .sig.blue { border-color: rgba(96,165,250,.25); color: #bfdbfe; background: rgba(96,165,250,.08); }
-
-    /* Bucket matrix (Score  Risk) */
-    .matrixPanel { padding: 12px 14px 14px; border-top: 1px solid var(--border); }
-    .matrixHead { display:flex; justify-content: space-between; align-items:flex-end; gap: 12px; margin-bottom: 10px; }
-    .matrixTitle { font-weight: 700; }
-    .matrixLayout { display: grid; grid-template-columns: 1fr; gap: 12px; grid-auto-rows: minmax(0, 1fr); }
-    @media (min-width: 980px) { .matrixLayout { grid-template-columns: minmax(0, .70fr) minmax(0, 1.30fr); align-items: stretch; grid-auto-rows: minmax(0, 1fr); } }
-    .leftStack { display:flex; flex-direction:column; gap: 24px; min-width: 0; height: 100%; }
-    .rightStack { display:flex; flex-direction:column; gap: 12px; min-width: 0; height: 100%; min-height: 0; }
-    .rightTopGrid { display:grid; grid-template-columns: 1fr; gap: 12px; align-items: stretch; min-width: 0; height: 100%; min-height: 0; }
-    .briefingRealityContent { max-height: 320px; overflow: auto; min-height: 0; }
-    .briefingRealitySplit { display: grid; grid-template-columns: minmax(0, 0.85fr) minmax(0, 1.15fr); gap: 12px; }
-    .briefingRealitySection { display: flex; flex-direction: column; }
-    .sectionTitle { font-weight: 600; font-size: 12px; color: var(--text); margin-bottom: 6px; padding-bottom: 4px; border-bottom: 1px solid rgba(148,163,184,.15); }
-    .briefingRealitySection .briefingText,
-    .briefingRealitySection .reportText { max-height: none; margin: 0; }
-    @media (min-width: 980px) { .briefingRealityContent { max-height: 280px; } }
-        @media (max-width: 1200px) { 
-      .briefingRealitySplit { grid-template-columns: 1fr; }
-    }
-    #segmentBox { flex: 1 1 auto; min-height: 0; }
-    #segmentText { height: 100%; overflow-y: auto; overflow-x: hidden; }
-    
-    /* Segment Monitor layout: fill remaining height under Briefing, align with Heatmap */
-    #segmentBox .cardBody { display:flex; flex-direction:column; min-height:0; }
-    .card.is-collapsed #segmentBox .cardBody { display:none; }
-    #segmentText { flex: 1 1 auto; min-height:0; }
-    .segmentTables { height: 100%; }
-
-    /* Mega-Trend Signal (compact table) */
-    #macroChainText { margin-top: 8px; max-height: 220px; overflow: auto; }
-    .macroTbl { width: 100%; border-collapse: collapse; font-size: 12px; line-height: 1.35; }
-    .macroTbl th, .macroTbl td { padding: 8px 8px; border-bottom: 1px solid rgba(36,50,68,.55); text-align: left; vertical-align: top; }
-    .macroTbl th { white-space: nowrap; background: rgba(15,23,42,.55); color: #cbd5e1; font-weight: 600; position: sticky; top: 0; z-index: 1; }
-    .macroTbl tr:hover td { background: rgba(96,165,250,.07); }
-    .macroTbl td:nth-child(1) { width: 22%; font-weight: 600; }
-    .macroTbl td:nth-child(2) { width: 12%; }
-    .macroTbl td:nth-child(3) { width: 12%; white-space: nowrap; }
-    .macroTbl td:nth-child(4) { width: 12%; white-space: nowrap; }
-    .macroTbl td:nth-child(5) { width: 42%; color: #cbd5e1; }
-    .macroStat { font-family: var(--mono); font-size: 11px; color: #cbd5e1; white-space: nowrap; }
-    .macroBadge { display:inline-flex; align-items:center; justify-content:center; padding: 3px 8px; border-radius: 999px; font-size: 10px; border: 1px solid rgba(148,163,184,.20); background: rgba(148,163,184,.08); color: #cbd5e1; text-transform: lowercase; }
-    .macroBadge.inactive { border-color: rgba(148,163,184,.25); color: #cbd5e1; }
-    .macroBadge.early { border-color: rgba(96,165,250,.35); color: #bfdbfe; background: rgba(96,165,250,.10); }
-    .macroBadge.building { border-color: rgba(251,191,36,.35); color: #fde68a; background: rgba(251,191,36,.10); }
-    .macroBadge.confirmed { border-color: rgba(52,211,153,.35); color: #a7f3d0; background: rgba(52,211,153,.10); }
-    .macroBadge.extended { border-color: rgba(16,185,129,.45); color: #86efac; background: rgba(16,185,129,.16); }
-    .macroHint { font-size: 11px; color: #cbd5e1; }
-
-    /* Segment Monitor table: aligned with dashboard table style */
-    .segmentTable { table-layout: fixed; width: 100%; border-collapse: collapse; font-size: 13px; line-height: 1.35; }
-    .segmentTable th, .segmentTable td { padding: 8px 8px; border-bottom: 1px solid rgba(36,50,68,.55); text-align: left; }
-    .segmentTable th { white-space: nowrap; background: rgba(15,23,42,.55); color: #cbd5e1; font-weight: 600; position: sticky; top: 0; z-index: 1; }
-    .segmentTable tr:hover td { background: rgba(96,165,250,.07); }
-    .segmentTable td { white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
-    .segmentTable th:nth-child(1), .segmentTable td:nth-child(1) { width: 40%; }
-    .segmentTable th:nth-child(2), .segmentTable td:nth-child(2) { width: 14%; }
-    .segmentTable th:nth-child(3), .segmentTable td:nth-child(3) { width: 12%; }
-    .segmentTable th:nth-child(4), .segmentTable td:nth-child(4) { width: 12%; }
-    .segmentTable th:nth-child(5), .segmentTable td:nth-child(5) { width: 12%; }
-    .segmentTable th:nth-child(6), .segmentTable td:nth-child(6) { width: 4.5em; }
-
-    /* Movers (Market Context)  1D + 1Y lines like old screenshot */
-    .moversList { font-family: var(--mono); font-size: 11px; display:flex; flex-direction: column; gap: 8px; }
-    .moversItem { display:grid; grid-template-columns: minmax(0, 1fr) auto; gap: 10px; align-items: start; }
-    .moversItem .sym { white-space: nowrap; overflow: hidden; text-overflow: ellipsis; max-width: 220px; }
-    .moversItem .mvVals { display:flex; flex-direction:column; gap: 2px; align-items: flex-end; }
-    .moversItem .mvLine { white-space: nowrap; }
-    .moversItem .mvLine.pos { color: var(--good); }
-    .moversItem .mvLine.neg { color: var(--bad); }
-    .moversItem .mvLine.flat { color: var(--muted); }
+.fbtn { background: #0f172a; border: 1px solid var(--border); color: var(--text); padding: 6px 10px; border-radius: 999px; cursor: pointer; font-size: 12px; }
+.fbtn:hover { border-color: rgba(96,165,250,.45); }
+.fbtn.active { border-color: rgba(96,165,250,.60); box-shadow: 0 0 0 2px rgba(96,165,250,.14) inset; }
+.fsep { flex: 1; }
+.hintbtn { margin-left: 10px; color: var(--muted); font-size: 12px; display:inline-flex; align-items:center; gap:6px; cursor: pointer; user-select:none; border: 1px solid rgba(148,163,184,.20); background: rgba(148,163,184,.06); padding: 6px 10px; border-radius: 999px; }
+.hintbtn:hover { border-color: rgba(148,163,184,.35); }
+.hintbtn .i { width: 18px; height: 18px; display:inline-flex; align-items:center; justify-content:center; border-radius: 999px; border: 1px solid rgba(148,163,184,.20); background: rgba(148,163,184,.08); font-weight: 700; font-size: 12px; color: #cbd5e1; }
+
+.popover { position: absolute; z-index: 60; min-width: 280px; max-width: 420px; padding: 12px 12px; border-radius: 14px; border: 1px solid rgba(255,255,255,.12); background: rgba(15,23,42,.98); box-shadow: 0 20px 60px rgba(0,0,0,.55); color: var(--text); display:none; }
+.popover.show { display:block; }
+.popover .title { font-weight: 700; margin-bottom: 6px; }
+.popover .close { float:right; }
+.popover ul { margin: 8px 0 0 16px; padding: 0; }
+.popover li { margin: 6px 0; color: var(--muted); }
+
+a.yf { color: var(--text); text-decoration: none; border-bottom: 1px solid rgba(96,165,250,.22); }
+a.yf:hover { color: #bfdbfe; border-bottom-color: rgba(96,165,250,.60); }
+
+table { border-collapse: collapse; }
+.table-wrap { overflow: auto; max-height: 72vh; }
+#tbl tbody tr.vspacer td { padding: 0; border: 0; background: none; position: static; }
+#tbl tbody tr:not(.vspacer) { cursor: pointer; }
+#tbl { table-layout: fixed; width: max-content; min-width: 100%; }
+#tbl col.col-ticker { width: var(--w-ticker); }
+#tbl col.col-name   { width: var(--w-name); }
+#tbl col.col-price  { width: var(--w-price); }
+#tbl col.col-score  { width: var(--w-score); }
+#tbl col.col-dscore { width: var(--w-dscore); }
+#tbl col.col-conf   { width: var(--w-conf); }
+#tbl col.col-cycle  { width: var(--w-cycle); }
+#tbl col.col-trend  { width: var(--w-trend); }
+#tbl col.col-liq    { width: var(--w-liq); }
+#tbl col.col-status { width: var(--w-status); }
+#tbl col.col-class  { width: var(--w-class); }
+
+/* Sticky first columns (Ticker + Name) inside the scroll container */
+#tbl thead th:nth-child(1),
+#tbl tbody td:nth-child(1) { position: sticky; left: 0; z-index: 6; }
+#tbl thead th:nth-child(2),
+#tbl tbody td:nth-child(2) { position: sticky; left: var(--w-ticker); z-index: 5; }
+
+/* Ensure sticky cells are opaque */
+#tbl thead th:nth-child(1),
+#tbl thead th:nth-child(2) { z-index: 12; }
+#tbl tbody td:nth-child(1),
+#tbl tbody td:nth-child(2) { background: rgba(11,15,20,.96); }
+
+/* Sticky text columns: allow 2 lines, but ellipsis on the main line */
+#tbl th:nth-child(1), #tbl th:nth-child(2) { white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+#tbl td:nth-child(1), #tbl td:nth-child(2) { overflow: hidden; }
+.tickerMain, .row-title .name { white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+/* Table header is sticky *inside the table scroll container* (not the whole page).
+   Therefore top should be 0, otherwise it will "float" too low and hide the first row. */
+thead th { position: sticky; top: 0; background: #0f172a; border-bottom: 1px solid var(--border); border-right: 1px solid rgba(36,50,68,.45); padding: 10px 10px; text-align: left; font-size: 12px; color: #cbd5e1; cursor: pointer; user-select: none; }
+tbody td { border-bottom: 1px solid rgba(36,50,68,.55); border-right: 1px solid rgba(36,50,68,.35); padding: 10px 10px; font-size: 13px; vertical-align: middle; }
+tbody tr:hover td { background: rgba(96,165,250,.07); }
+
+thead th:last-child, tbody td:last-child { border-right: none; }
+
+
+.mono { font-family: var(--mono); }
+.muted { color: var(--muted); }
+.deltaUp { color: var(--good); }
+.deltaDown { color: var(--bad); }
+.deltaFlat { color: var(--muted); }
+.row-title { display:flex; flex-direction:column; gap:2px; }
+.name { font-size: 13px; }
+.sub { font-size: 11px; color: var(--muted); }
+
+.priceCell { display:flex; flex-direction:column; gap:2px; }
+.priceMain { font-family: var(--mono); }
+.chg { font-size: 11px; }
+.chg.pos { color: var(--good); }
+.chg.neg { color: var(--bad); }
+.chg.flat { color: var(--muted); }
+
+.tickerCell { display:flex; flex-direction:column; gap:2px; }
+.tickerMain { display:flex; align-items:center; gap:8px; }
+.tinychip { display:inline-flex; align-items:center; padding: 2px 6px; border-radius: 999px; font-size: 10px; border: 1px solid rgba(148,163,184,.18); background: rgba(148,163,184,.08); color: #cbd5e1; }
+
+.chip { display:inline-flex; align-items:center; gap:6px; padding: 4px 8px; border-radius: 999px; background: var(--chip); border: 1px solid rgba(148,163,184,.15); font-size: 11px; }
+.chip.good { border-color: rgba(52,211,153,.25); color: #a7f3d0; }
+.chip.warn { border-color: rgba(251,191,36,.25); color: #fde68a; }
+.chip.bad  { border-color: rgba(251,113,133,.25); color: #fecdd3; }
+.chip.blue { border-color: rgba(96,165,250,.25); color: #bfdbfe; }
+
+
+/* Encoded recommendation signal pill (private code) */
+.sig { display:inline-flex; align-items:center; justify-content:center; min-width: 28px; padding: 2px 8px; border-radius: 999px; font-size: 10px; border: 1px solid rgba(148,163,184,.15); background: rgba(148,163,184,.10); color: #e2e8f0; }
+.sig.good { border-color: rgba(52,211,153,.25); color: #a7f3d0; background: rgba(52,211,153,.08); }
+.sig.warn { border-color: rgba(251,191,36,.25); color: #fde68a; background: rgba(251,191,36,.08); }
+.sig.bad  { border-color: rgba(251,113,133,.25); color: #fecdd3; background: rgba(251,113,133,.08); }
+.sig.blue { border-color: rgba(96,165,250,.25); color: #bfdbfe; background: rgba(96,165,250,.08); }
+
+/* Bucket matrix (Score  Risk) */
+.matrixPanel { padding: 12px 14px 14px; border-top: 1px solid var(--border); }
+.matrixHead { display:flex; justify-content: space-between; align-items:flex-end; gap: 12px; margin-bottom: 10px; }
+.matrixTitle { font-weight: 700; }
+.matrixLayout { display: grid; grid-template-columns: 1fr; gap: 12px; grid-auto-rows: minmax(0, 1fr); }
+@media (min-width: 980px) { .matrixLayout { grid-template-columns: minmax(0, .70fr) minmax(0, 1.30fr); align-items: stretch; grid-auto-rows: minmax(0, 1fr); } }
+.leftStack { display:flex; flex-direction:column; gap: 24px; min-width: 0; height: 100%; }
+.rightStack { display:flex; flex-direction:column; gap: 12px; min-width: 0; height: 100%; min-height: 0; }
+.rightTopGrid { display:grid; grid-template-columns: 1fr; gap: 12px; align-items: stretch; min-width: 0; height: 100%; min-height: 0; }
+.briefingRealityContent { max-height: 320px; overflow: auto; min-height: 0; }
+.briefingRealitySplit { display: grid; grid-template-columns: minmax(0, 0.85fr) minmax(0, 1.15fr); gap: 12px; }
+.briefingRealitySection { display: flex; flex-direction: column; }
+.sectionTitle { font-weight: 600; font-size: 12px; color: var(--text); margin-bottom: 6px; padding-bottom: 4px; border-bottom: 1px solid rgba(148,163,184,.15); }
+.briefingRealitySection .briefingText,
+.briefingRealitySection .reportText { max-height: none; margin: 0; }
+@media (min-width: 980px) { .briefingRealityContent { max-height: 280px; } }
+    @media (max-width: 1200px) { 
+  .briefingRealitySplit { grid-template-columns: 1fr; }
+}
+#segmentBox { flex: 1 1 auto; min-height: 0; }
+#segmentText { height: 100%; overflow-y: auto; overflow-x: hidden; }
+
+/* Segment Monitor layout: fill remaining height under Briefing, align with Heatmap */
+#segmentBox .cardBody { display:flex; flex-direction:column; min-height:0; }
+.card.is-collapsed #segmentBox .cardBody { display:none; }
+#segmentText { flex: 1 1 auto; min-height:0; }
+.segmentTables { height: 100%; }
+
+/* Mega-Trend Signal (compact table) */
+#macroChainText { margin-top: 8px; max-height: 220px; overflow: auto; }
+.macroTbl { width: 100%; border-collapse: collapse; font-size: 12px; line-height: 1.35; }
+.macroTbl th, .macroTbl td { padding: 8px 8px; border-bottom: 1px solid rgba(36,50,68,.55); text-align: left; vertical-align: top; }
+.macroTbl th { white-space: nowrap; background: rgba(15,23,42,.55); color: #cbd5e1; font-weight: 600; position: sticky; top: 0; z-index: 1; }
+.macroTbl tr:hover td { background: rgba(96,165,250,.07); }
+.macroTbl td:nth-child(1) { width: 22%; font-weight: 600; }
+.macroTbl td:nth-child(2) { width: 12%; }
+.macroTbl td:nth-child(3) { width: 12%; white-space: nowrap; }
+.macroTbl td:nth-child(4) { width: 12%; white-space: nowrap; }
+.macroTbl td:nth-child(5) { width: 42%; color: #cbd5e1; }
+.macroStat { font-family: var(--mono); font-size: 11px; color: #cbd5e1; white-space: nowrap; }
+.macroBadge { display:inline-flex; align-items:center; justify-content:center; padding: 3px 8px; border-radius: 999px; font-size: 10px; border: 1px solid rgba(148,163,184,.20); background: rgba(148,163,184,.08); color: #cbd5e1; text-transform: lowercase; }
+.macroBadge.inactive { border-color: rgba(148,163,184,.25); color: #cbd5e1; }
+.macroBadge.early { border-color: rgba(96,165,250,.35); color: #bfdbfe; background: rgba(96,165,250,.10); }
+.macroBadge.building { border-color: rgba(251,191,36,.35); color: #fde68a; background: rgba(251,191,36,.10); }
+.macroBadge.confirmed { border-color: rgba(52,211,153,.35); color: #a7f3d0; background: rgba(52,211,153,.10); }
+.macroBadge.extended { border-color: rgba(16,185,129,.45); color: #86efac; background: rgba(16,185,129,.16); }
+.macroHint { font-size: 11px; color: #cbd5e1; }
+
+/* Segment Monitor table: aligned with dashboard table style */
+.segmentTable { table-layout: fixed; width: 100%; border-collapse: collapse; font-size: 13px; line-height: 1.35; }
+.segmentTable th, .segmentTable td { padding: 8px 8px; border-bottom: 1px solid rgba(36,50,68,.55); text-align: left; }
+.segmentTable th { white-space: nowrap; background: rgba(15,23,42,.55); color: #cbd5e1; font-weight: 600; position: sticky; top: 0; z-index: 1; }
+.segmentTable tr:hover td { background: rgba(96,165,250,.07); }
+.segmentTable td { white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+.segmentTable th:nth-child(1), .segmentTable td:nth-child(1) { width: 40%; }
+.segmentTable th:nth-child(2), .segmentTable td:nth-child(2) { width: 14%; }
+.segmentTable th:nth-child(3), .segmentTable td:nth-child(3) { width: 12%; }
+.segmentTable th:nth-child(4), .segmentTable td:nth-child(4) { width: 12%; }
+.segmentTable th:nth-child(5), .segmentTable td:nth-child(5) { width: 12%; }
+.segmentTable th:nth-child(6), .segmentTable td:nth-child(6) { width: 4.5em; }
+
+/* Movers (Market Context)  1D + 1Y lines like old screenshot */
+.moversList { font-family: var(--mono); font-size: 11px; display:flex; flex-direction: column; gap: 8px; }
+.moversItem { display:grid; grid-template-columns: minmax(0, 1fr) auto; gap: 10px; align-items: start; }
+.moversItem .sym { white-space: nowrap; overflow: hidden; text-overflow: ellipsis; max-width: 220px; }
+.moversItem .mvVals { display:flex; flex-direction:column; gap: 2px; align-items: flex-end; }
+.moversItem .mvLine { white-space: nowrap; }
+.moversItem .mvLine.pos { color: var(--good); }
+.moversItem .mvLine.neg { color: var(--bad); }
+.moversItem .mvLine.flat { color: var(--muted); }
 
 .segmentTables { display: grid; grid-template-columns: 1fr 1fr; gap: 12px; height: 100%; }
-    @media (max-width: 1200px) { .segmentTables { grid-template-columns: 1fr; } }
-
-    .segmentDelta { font-weight: 600; }
-    .segmentDelta.pos { color: var(--good); }
-    .segmentDelta.neg { color: var(--bad); }
-    .segmentDelta.zero { color: var(--muted); }
-
-    .heatControls { display:flex; gap: 8px; align-items:center; }
-    .heatControls select { width: auto; min-width: 160px; padding: 8px 10px; border-radius: 10px; }
-    /* Insights (collapsed by default) */
-    details.insightsDetails { margin-top: 12px; }
-    details.insightsDetails > summary {
-      cursor: pointer;
-      list-style: none;
-      user-select: none;
-      padding: 10px 12px;
-      border-radius: 12px;
-      border: 1px solid rgba(148,163,184,.15);
-      background: rgba(15,23,42,.30);
-      color: var(--text);
-      font-weight: 600;
-    }
-    details.insightsDetails > summary::-webkit-details-marker { display: none; }
-    details.insightsDetails[open] > summary { background: rgba(15,23,42,.45); }
-    .insightsGrid { display: grid; grid-template-columns: 1fr; gap: 12px; margin-top: 12px; }
-    @media (min-width: 980px) { .insightsGrid { grid-template-columns: 1fr 1fr; align-items: start; } }
-
-
-    .matrixGrid { display: grid; grid-template-columns: 84px repeat(5, 1fr); gap: 4px; }
-    .matrixLabel { font-size: 10px; color: var(--muted); display:flex; flex-direction:column; align-items:center; justify-content:center; padding: 4px 0; line-height: 1.05; text-align: center; }
-    .matrixLabel .lbl { font-family: var(--mono); color: #cbd5e1; }
-    .matrixLabel .hint { font-size: 9px; color: var(--muted); }
-    .matrixAxis { display:flex; flex-direction:column; align-items:center; justify-content:center; gap:2px; padding: 6px 4px; border-radius: 10px; border: 1px dashed rgba(148,163,184,.18); background: rgba(148,163,184,.04); }
-    .matrixAxis .lbl { font-weight: 700; color: #e2e8f0; }
-    .matrixAxis .hint { font-size: 9px; color: var(--muted); font-family: var(--mono); }
-    .cell { background: rgba(148,163,184,.06); border: 1px solid rgba(148,163,184,.15); border-radius: 9px; min-height: 28px; display:flex; align-items:center; justify-content:center; cursor: pointer; user-select:none; transition: border-color .12s ease, transform .06s ease; }
-    .cell:hover { border-color: rgba(96,165,250,.45); }
-    .cell.active { box-shadow: 0 0 0 2px rgba(96,165,250,.25) inset; }
-    .cell.zero { opacity: .45; cursor: default; }
-    .cell .cnt { font-family: var(--mono); font-size: 11px; }
-    .matrixNote { margin-top: 8px; color: var(--muted); font-size: 11px; }
-
-    /* Heatmap styling like Bucket matrix */
-    .heatWrap .matrixGrid .cell { background: hsla(205, 70%, 50%, 0.06); }
-    .heatWrap .matrixGrid .cell:hover { border-color: rgba(96,165,250,.45); }
-    .heatWrap .matrixGrid .cell.active { box-shadow: 0 0 0 2px rgba(96,165,250,.25) inset; }
-
-    /* Info button and popover */
-    .iBtn { display:inline-flex; align-items:center; justify-content:center; width: 18px; height: 18px; border-radius: 999px; border: 1px solid rgba(148,163,184,.20); background: rgba(148,163,184,.08); color: #cbd5e1; font-size: 12px; font-weight: 700; cursor: pointer; user-select: none; transition: all .12s ease; }
-    .iBtn:hover { border-color: rgba(96,165,250,.45); background: rgba(96,165,250,.12); }
-    .iPop { position: absolute; top: 100%; right: 0; margin-top: 4px; min-width: 200px; max-width: 280px; padding: 8px 10px; border-radius: 8px; border: 1px solid rgba(148,163,184,.20); background: rgba(15,23,42,.95); color: var(--text); font-size: 11px; line-height: 1.4; z-index: 100; display: none; box-shadow: 0 4px 12px rgba(0,0,0,.3); }
-    .card.is-collapsed .cardBody { display:none; }
-    .debugInfo, .renderProof { display: none; }
+@media (max-width: 1200px) { .segmentTables { grid-template-columns: 1fr; } }
+
+.segmentDelta { font-weight: 600; }
+.segmentDelta.pos { color: var(--good); }
+.segmentDelta.neg { color: var(--bad); }
+.segmentDelta.zero { color: var(--muted); }
+
+.heatControls { display:flex; gap: 8px; align-items:center; }
+.heatControls select { width: auto; min-width: 160px; padding: 8px 10px; border-radius: 10px; }
+/* Insights (collapsed by default) */
+details.insightsDetails { margin-top: 12px; }
+details.insightsDetails > summary {
+  cursor: pointer;
+  list-style: none;
+  user-select: none;
+  padding: 10px 12px;
+  border-radius: 12px;
+  border: 1px solid rgba(148,163,184,.15);
+  background: rgba(15,23,42,.30);
+  color: var(--text);
+  font-weight: 600;
+}
+details.insightsDetails > summary::-webkit-details-marker { display: none; }
+details.insightsDetails[open] > summary { background: rgba(15,23,42,.45); }
+.insightsGrid { display: grid; grid-template-columns: 1fr; gap: 12px; margin-top: 12px; }
+@media (min-width: 980px) { .insightsGrid { grid-template-columns: 1fr 1fr; align-items: start; } }
+
+
+.matrixGrid { display: grid; grid-template-columns: 84px repeat(5, 1fr); gap: 4px; }
+.matrixLabel { font-size: 10px; color: var(--muted); display:flex; flex-direction:column; align-items:center; justify-content:center; padding: 4px 0; line-height: 1.05; text-align: center; }
+.matrixLabel .lbl { font-family: var(--mono); color: #cbd5e1; }
+.matrixLabel .hint { font-size: 9px; color: var(--muted); }
+.matrixAxis { display:flex; flex-direction:column; align-items:center; justify-content:center; gap:2px; padding: 6px 4px; border-radius: 10px; border: 1px dashed rgba(148,163,184,.18); background: rgba(148,163,184,.04); }
+.matrixAxis .lbl { font-weight: 700; color: #e2e8f0; }
+.matrixAxis .hint { font-size: 9px; color: var(--muted); font-family: var(--mono); }
+.cell { background: rgba(148,163,184,.06); border: 1px solid rgba(148,163,184,.15); border-radius: 9px; min-height: 28px; display:flex; align-items:center; justify-content:center; cursor: pointer; user-select:none; transition: border-color .12s ease, transform .06s ease; }
+.cell:hover { border-color: rgba(96,165,250,.45); }
+.cell.active { box-shadow: 0 0 0 2px rgba(96,165,250,.25) inset; }
+.cell.zero { opacity: .45; cursor: default; }
+.cell .cnt { font-family: var(--mono); font-size: 11px; }
+.matrixNote { margin-top: 8px; color: var(--muted); font-size: 11px; }
+
+/* Heatmap styling like Bucket matrix */
+.heatWrap .matrixGrid .cell { background: hsla(205, 70%, 50%, 0.06); }
+.heatWrap .matrixGrid .cell:hover { border-color: rgba(96,165,250,.45); }
+.heatWrap .matrixGrid .cell.active { box-shadow: 0 0 0 2px rgba(96,165,250,.25) inset; }
+
+/* Info button and popover */
+.iBtn { display:inline-flex; align-items:center; justify-content:center; width: 18px; height: 18px; border-radius: 999px; border: 1px solid rgba(148,163,184,.20); background: rgba(148,163,184,.08); color: #cbd5e1; font-size: 12px; font-weight: 700; cursor: pointer; user-select: none; transition: all .12s ease; }
+.iBtn:hover { border-color: rgba(96,165,250,.45); background: rgba(96,165,250,.12); }
+.iPop { position: absolute; top: 100%; right: 0; margin-top: 4px; min-width: 200px; max-width: 280px; padding: 8px 10px; border-radius: 8px; border: 1px solid rgba(148,163,184,.20); background: rgba(15,23,42,.95); color: var(--text); font-size: 11px; line-height: 1.4; z-index: 100; display: none; box-shadow: 0 4px 12px rgba(0,0,0,.3); }
+.card.is-collapsed .cardBody { display:none; }
+.debugInfo, .renderProof { display: none; }
 
 
 
@@ -804,294 +1015,294 @@ def _render_html(*, data_records: list[dict[str, Any]], presets: dict[str, Any],
 .heatCell { text-align: center; font-family: var(--mono); }
 .heatCell.zero { color: rgba(148,163,184,.55); }
 
-    /* KPI chips are clickable quick-filters */
-    button.chip { appearance: none; -webkit-appearance: none; display:inline-flex; align-items:center; gap:6px; padding: 4px 8px; border-radius: 999px; background: var(--chip); border: 1px solid rgba(148,163,184,.15); color: var(--text); font-size: 11px; cursor: pointer; white-space: nowrap; }
-    button.chip.kpi { cursor: pointer; }
-    button.chip.kpi:hover { border-color: rgba(96,165,250,.45); }
-    button.chip.kpi.active { box-shadow: 0 0 0 2px rgba(96,165,250,.25) inset; }
-
-    /* KPI chips same size as normal chips */
-    button.chip.kpi { padding: 4px 8px; font-size: 11px; line-height: 1.4; }
-
-    .jsError { display:none; margin: 10px 14px 0 14px; padding: 10px 12px; border-radius: 14px; background: rgba(251,113,133,.08); border: 1px solid rgba(251,113,133,.25); color: #fecdd3; font-family: var(--mono); font-size: 12px; }
-    .jsError.show { display:block; }
-
-    .scorebar { width: 120px; height: 10px; border-radius: 999px; background: rgba(148,163,184,.15); overflow: hidden; border: 1px solid rgba(148,163,184,.10); }
-    .scorebar > div { height: 100%; border-radius: 999px; background: linear-gradient(90deg, rgba(96,165,250,.9), rgba(52,211,153,.9)); }
-    .scorecell { display:flex; align-items:center; gap:10px; }
-
-    .right { text-align: right; }
-    .small { font-size: 11px; }
-
-    .footer { padding: 10px 14px; color: var(--muted); font-size: 12px; display:flex; justify-content: space-between; border-top: 1px solid var(--border); }
-    .kbd { font-family: var(--mono); background: rgba(148,163,184,.12); border: 1px solid rgba(148,163,184,.18); padding: 2px 6px; border-radius: 6px; }
-
-    .overlay { position: fixed; inset: 0; background: rgba(0,0,0,.6); display: none; align-items: flex-end; justify-content: center; padding: 18px; z-index: 90; }
-    .drawer { width: min(720px, 96vw); max-height: 88vh; overflow: auto; }
-    .drawer-head { display: flex; justify-content: space-between; align-items: flex-start; gap: 12px; padding: 14px; border-bottom: 1px solid var(--border); }
-    .drawer-actions { display: flex; gap: 8px; align-items: center; }
-    .drawer-title { font-weight: 700; }
-    .drawer-body { padding: 14px; }
-    .btn { display:inline-flex; align-items:center; gap:6px; padding: 4px 8px; border-radius: 999px; background: var(--chip); border: 1px solid rgba(148,163,184,.15); color: var(--text); font-size: 11px; cursor: pointer; white-space: nowrap; }
-    .btn:hover { border-color: rgba(96,165,250,.45); }
-    .kv { display: grid; grid-template-columns: 160px 1fr; gap: 6px 12px; }
-    .kv div { padding: 4px 0; border-bottom: 1px dashed rgba(148,163,184,.15); }
-    .kv .k { color: var(--muted); font-size: 12px; }
-    .kv .v { font-family: var(--mono); }
-    .why { margin-top: 12px; }
-    .why ul { margin: 6px 0 0 18px; padding: 0; }
-
-    @media (max-width: 860px) {
-      .controls { grid-template-columns: 1fr; }
-      #tbl thead th:nth-child(2),
-      #tbl tbody td:nth-child(2) { position: static; }
-      thead th { top: 0; }
-      .count { justify-self: start; }
-      .hide-sm { display:none; }
-    }
+/* KPI chips are clickable quick-filters */
+button.chip { appearance: none; -webkit-appearance: none; display:inline-flex; align-items:center; gap:6px; padding: 4px 8px; border-radius: 999px; background: var(--chip); border: 1px solid rgba(148,163,184,.15); color: var(--text); font-size: 11px; cursor: pointer; white-space: nowrap; }
+button.chip.kpi { cursor: pointer; }
+button.chip.kpi:hover { border-color: rgba(96,165,250,.45); }
+button.chip.kpi.active { box-shadow: 0 0 0 2px rgba(96,165,250,.25) inset; }
+
+/* KPI chips same size as normal chips */
+button.chip.kpi { padding: 4px 8px; font-size: 11px; line-height: 1.4; }
+
+.jsError { display:none; margin: 10px 14px 0 14px; padding: 10px 12px; border-radius: 14px; background: rgba(251,113,133,.08); border: 1px solid rgba(251,113,133,.25); color: #fecdd3; font-family: var(--mono); font-size: 12px; }
+.jsError.show { display:block; }
+
+.scorebar { width: 120px; height: 10px; border-radius: 999px; background: rgba(148,163,184,.15); overflow: hidden; border: 1px solid rgba(148,163,184,.10); }
+.scorebar > div { height: 100%; border-radius: 999px; background: linear-gradient(90deg, rgba(96,165,250,.9), rgba(52,211,153,.9)); }
+.scorecell { display:flex; align-items:center; gap:10px; }
+
+.right { text-align: right; }
+.small { font-size: 11px; }
+
+.footer { padding: 10px 14px; color: var(--muted); font-size: 12px; display:flex; justify-content: space-between; border-top: 1px solid var(--border); }
+.kbd { font-family: var(--mono); background: rgba(148,163,184,.12); border: 1px solid rgba(148,163,184,.18); padding: 2px 6px; border-radius: 6px; }
+
+.overlay { position: fixed; inset: 0; background: rgba(0,0,0,.6); display: none; align-items: flex-end; justify-content: center; padding: 18px; z-index: 90; }
+.drawer { width: min(720px, 96vw); max-height: 88vh; overflow: auto; }
+.drawer-head { display: flex; justify-content: space-between; align-items: flex-start; gap: 12px; padding: 14px; border-bottom: 1px solid var(--border); }
+.drawer-actions { display: flex; gap: 8px; align-items: center; }
+.drawer-title { font-weight: 700; }
+.drawer-body { padding: 14px; }
+.btn { display:inline-flex; align-items:center; gap:6px; padding: 4px 8px; border-radius: 999px; background: var(--chip); border: 1px solid rgba(148,163,184,.15); color: var(--text); font-size: 11px; cursor: pointer; white-space: nowrap; }
+.btn:hover { border-color: rgba(96,165,250,.45); }
+.kv { display: grid; grid-template-columns: 160px 1fr; gap: 6px 12px; }
+.kv div { padding: 4px 0; border-bottom: 1px dashed rgba(148,163,184,.15); }
+.kv .k { color: var(--muted); font-size: 12px; }
+.kv .v { font-family: var(--mono); }
+.why { margin-top: 12px; }
+.why ul { margin: 6px 0 0 18px; padding: 0; }
+
+@media (max-width: 860px) {
+  .controls { grid-template-columns: 1fr; }
+  #tbl thead th:nth-child(2),
+  #tbl tbody td:nth-child(2) { position: static; }
+  thead th { top: 0; }
+  .count { justify-self: start; }
+  .hide-sm { display:none; }
+}
 
-    /* Briefing & Reality Check Panel Styles */
-    .briefingPick {
-      border: 1px solid rgba(148,163,184,.15);
-      border-radius: 14px;
-      padding: 10px 12px;
-      margin-bottom: 10px;
-      background: rgba(15,23,42,.35);
-      box-shadow: 0 2px 8px rgba(0,0,0,.15);
-    }
-    .briefingPickHeader {
-      display: flex;
-      gap: 8px;
-      align-items: baseline;
-      padding: 6px 8px;
-      border: 1px solid rgba(251,191,36,.28);
-      background: rgba(251,191,36,.06);
-      border-radius: 8px;
-      margin-bottom: 8px;
-    }
-    .briefingPickRank {
-      font-weight: 700;
-      color: var(--warn);
-      font-family: var(--mono);
-    }
-    .briefingPickSymbol {
-      font-weight: 600;
-      color: var(--text);
-      font-family: var(--mono);
-    }
-    .briefingPickName {
-      color: var(--text);
-    }
-    .briefingPickBadges {
-      display: flex;
-      flex-wrap: wrap;
-      gap: 6px;
-      margin-top: 8px;
-      align-items: center;
-    }
-    .briefingBadge {
-      display: inline-flex;
-      align-items: center;
-      padding: 3px 6px;
-      border-radius: 6px;
-      font-size: 10px;
-      font-weight: 600;
-      background: rgba(15,23,42,.55);
-      color: var(--muted);
-      border: 1px solid rgba(148,163,184,.15);
-      max-width: 100%;
-      white-space: normal;
-      overflow-wrap: anywhere;
-      word-break: break-word;
-    }
-    .briefingPickReasons {
-      margin: 0;
-      padding: 0;
-      list-style: none;
-    }
-    .briefingPickReasons li {
-      position: relative;
-      padding-left: 12px;
-      margin-bottom: 2px;
-      font-size: 11px;
-      color: var(--muted);
-      line-height: 1.3;
-    }
-    .briefingPickReasons li:before {
-      content: "";
-      position: absolute;
-      left: 0;
-      color: var(--accent);
-    }
-    .briefingFallback {
-      border: 1px solid rgba(148,163,184,.15);
-      border-radius: 12px;
-      padding: 10px;
-      background: rgba(15,23,42,.35);
-    }
-    .briefingLine {
-      margin-bottom: 6px;
-      line-height: 1.4;
-    }
-    .briefingBullet {
-      margin-bottom: 4px;
-      padding-left: 12px;
-      position: relative;
-      font-size: 11px;
-      color: var(--muted);
-    }
-    .briefingBullet:before {
-      content: "";
-      position: absolute;
-      left: 0;
-      color: var(--accent);
-    }
-    .realityTable {
-      width: 100%;
-      border-collapse: collapse;
-      table-layout: fixed;
-      margin-top: 8px;
-    }
-    .realityTable th,
-    .realityTable td {
-      padding: 8px;
-      border-bottom: 1px solid rgba(36,50,68,.55);
-      text-align: left;
-      font-size: 11px;
-    }
-    .realityTable th {
-      background: rgba(15,23,42,.55);
-      color: #cbd5e1;
-      font-weight: 600;
-      position: sticky;
-      top: 0;
-    }
-    .realityTable tr:hover td {
-      background: rgba(96,165,250,.07);
-    }
-    /* Responsive improvements for small screens */
-    @media (max-width: 1200px) {
-      .realityTable th,
-      .realityTable td {
-        line-height: 1.4;
-      }
-      .realityTable th {
-        white-space: nowrap;
-        overflow: hidden;
-        text-overflow: ellipsis;
-      }
-    }
-    @media (max-width: 900px) {
-      .realityTable th,
-      .realityTable td {
-        padding: 6px;
-        font-size: 10px;
-      }
-    }
-    .signalBadge {
-      display: inline-flex;
-      align-items: center;
-      padding: 2px 6px;
-      border-radius: 999px;
-      font-size: 10px;
-      font-weight: 600;
-      white-space: nowrap;
-    }
-    .signalBadge.positive {
-      background: rgba(52,211,153,.08);
-      border: 1px solid rgba(52,211,153,.25);
-      color: #a7f3d0;
-    }
-    .signalBadge.neutral {
-      background: rgba(251,191,36,.08);
-      border: 1px solid rgba(251,191,36,.25);
-      color: #fde68a;
-    }
-    .signalBadge.contra {
-      background: rgba(251,113,133,.08);
-      border: 1px solid rgba(251,113,133,.25);
-      color: #fecdd3;
-    }
-    .realitySummary {
-      display: flex;
-      gap: 6px;
-      margin-bottom: 8px;
-    }
-    .summaryChip {
-      display: inline-flex;
-      align-items: center;
-      padding: 2px 6px;
-      border-radius: 999px;
-      font-size: 10px;
-      font-weight: 600;
-    }
-    .summaryChip.ok {
-      background: rgba(52,211,153,.08);
-      border: 1px solid rgba(52,211,153,.25);
-      color: #a7f3d0;
-    }
-    .summaryChip.warn {
-      background: rgba(251,191,36,.08);
-      border: 1px solid rgba(251,191,36,.25);
-      color: #fde68a;
-    }
-    .summaryChip.error {
-      background: rgba(251,113,133,.08);
-      border: 1px solid rgba(251,113,133,.25);
-      color: #fecdd3;
-    }
+/* Briefing & Reality Check Panel Styles */
+.briefingPick {
+  border: 1px solid rgba(148,163,184,.15);
+  border-radius: 14px;
+  padding: 10px 12px;
+  margin-bottom: 10px;
+  background: rgba(15,23,42,.35);
+  box-shadow: 0 2px 8px rgba(0,0,0,.15);
+}
+.briefingPickHeader {
+  display: flex;
+  gap: 8px;
+  align-items: baseline;
+  padding: 6px 8px;
+  border: 1px solid rgba(251,191,36,.28);
+  background: rgba(251,191,36,.06);
+  border-radius: 8px;
+  margin-bottom: 8px;
+}
+.briefingPickRank {
+  font-weight: 700;
+  color: var(--warn);
+  font-family: var(--mono);
+}
+.briefingPickSymbol {
+  font-weight: 600;
+  color: var(--text);
+  font-family: var(--mono);
+}
+.briefingPickName {
+  color: var(--text);
+}
+.briefingPickBadges {
+  display: flex;
+  flex-wrap: wrap;
+  gap: 6px;
+  margin-top: 8px;
+  align-items: center;
+}
+.briefingBadge {
+  display: inline-flex;
+  align-items: center;
+  padding: 3px 6px;
+  border-radius: 6px;
+  font-size: 10px;
+  font-weight: 600;
+  background: rgba(15,23,42,.55);
+  color: var(--muted);
+  border: 1px solid rgba(148,163,184,.15);
+  max-width: 100%;
+  white-space: normal;
+  overflow-wrap: anywhere;
+  word-break: break-word;
+}
+.briefingPickReasons {
+  margin: 0;
+  padding: 0;
+  list-style: none;
+}
+.briefingPickReasons li {
+  position: relative;
+  padding-left: 12px;
+  margin-bottom: 2px;
+  font-size: 11px;
+  color: var(--muted);
+  line-height: 1.3;
+}
+.briefingPickReasons li:before {
+  content: "";
+  position: absolute;
+  left: 0;
+  color: var(--accent);
+}
+.briefingFallback {
+  border: 1px solid rgba(148,163,184,.15);
+  border-radius: 12px;
+  padding: 10px;
+  background: rgba(15,23,42,.35);
+}
+.briefingLine {
+  margin-bottom: 6px;
+  line-height: 1.4;
+}
+.briefingBullet {
+  margin-bottom: 4px;
+  padding-left: 12px;
+  position: relative;
+  font-size: 11px;
+  color: var(--muted);
+}
+.briefingBullet:before {
+  content: "";
+  position: absolute;
+  left: 0;
+  color: var(--accent);
+}
+.realityTable {
+  width: 100%;
+  border-collapse: collapse;
+  table-layout: fixed;
+  margin-top: 8px;
+}
+.realityTable th,
+.realityTable td {
+  padding: 8px;
+  border-bottom: 1px solid rgba(36,50,68,.55);
+  text-align: left;
+  font-size: 11px;
+}
+.realityTable th {
+  background: rgba(15,23,42,.55);
+  color: #cbd5e1;
+  font-weight: 600;
+  position: sticky;
+  top: 0;
+}
+.realityTable tr:hover td {
+  background: rgba(96,165,250,.07);
+}
+/* Responsive improvements for small screens */
+@media (max-width: 1200px) {
+  .realityTable th,
+  .realityTable td {
+    line-height: 1.4;
+  }
+  .realityTable th {
+    white-space: nowrap;
+    overflow: hidden;
+    text-overflow: ellipsis;
+  }
+}
+@media (max-width: 900px) {
+  .realityTable th,
+  .realityTable td {
+    padding: 6px;
+    font-size: 10px;
+  }
+}
+.signalBadge {
+  display: inline-flex;
+  align-items: center;
+  padding: 2px 6px;
+  border-radius: 999px;
+  font-size: 10px;
+  font-weight: 600;
+  white-space: nowrap;
+}
+.signalBadge.positive {
+  background: rgba(52,211,153,.08);
+  border: 1px solid rgba(52,211,153,.25);
+  color: #a7f3d0;
+}
+.signalBadge.neutral {
+  background: rgba(251,191,36,.08);
+  border: 1px solid rgba(251,191,36,.25);
+  color: #fde68a;
+}
+.signalBadge.contra {
+  background: rgba(251,113,133,.08);
+  border: 1px solid rgba(251,113,133,.25);
+  color: #fecdd3;
+}
+.realitySummary {
+  display: flex;
+  gap: 6px;
+  margin-bottom: 8px;
+}
+.summaryChip {
+  display: inline-flex;
+  align-items: center;
+  padding: 2px 6px;
+  border-radius: 999px;
+  font-size: 10px;
+  font-weight: 600;
+}
+.summaryChip.ok {
+  background: rgba(52,211,153,.08);
+  border: 1px solid rgba(52,211,153,.25);
+  color: #a7f3d0;
+}
+.summaryChip.warn {
+  background: rgba(251,191,36,.08);
+  border: 1px solid rgba(251,191,36,.25);
+  color: #fde68a;
+}
+.summaryChip.error {
+  background: rgba(251,113,133,.08);
+  border: 1px solid rgba(251,113,133,.25);
+  color: #fecdd3;
+}
 
-    /* Unified Help Popover System */
-    .helpPop {
-      position: fixed;
-      z-index: 9999;
-      max-width: 360px;
-      background: rgba(15,23,42,.95);
-      border: 1px solid rgba(148,163,184,.20);
-      border-radius: 12px;
-      box-shadow: 0 8px 24px rgba(0,0,0,.4);
-      padding: 0;
-    }
-    .helpPopInner {
-      padding: 12px 14px;
-    }
-    .helpPopTitle {
-      font-weight: 700;
-      color: var(--text);
-      margin-bottom: 8px;
-      font-size: 13px;
-    }
-    .helpPopBody {
-      color: var(--text);
-      font-size: 12px;
-      line-height: 1.5;
-    }
-    .helpPopBody ul {
-      margin: 8px 0 0 16px;
-      padding: 0;
-    }
-    .helpPopBody li {
-      margin-bottom: 4px;
-    }
-    .hidden {
-      display: none;
-    }
-    .helpPop.show {
-      display: block;
-    }
+/* Unified Help Popover System */
+.helpPop {
+  position: fixed;
+  z-index: 9999;
+  max-width: 360px;
+  background: rgba(15,23,42,.95);
+  border: 1px solid rgba(148,163,184,.20);
+  border-radius: 12px;
+  box-shadow: 0 8px 24px rgba(0,0,0,.4);
+  padding: 0;
+}
+.helpPopInner {
+  padding: 12px 14px;
+}
+.helpPopTitle {
+  font-weight: 700;
+  color: var(--text);
+  margin-bottom: 8px;
+  font-size: 13px;
+}
+.helpPopBody {
+  color: var(--text);
+  font-size: 12px;
+  line-height: 1.5;
+}
+.helpPopBody ul {
+  margin: 8px 0 0 16px;
+  padding: 0;
+}
+.helpPopBody li {
+  margin-bottom: 4px;
+}
+.hidden {
+  display: none;
+}
+.helpPop.show {
+  display: block;
+}
 
-    /* Dark scrollbars */
-    ::-webkit-scrollbar { width: 8px; height: 8px; }
-    ::-webkit-scrollbar-track { background: rgba(15,23,42,.3); border-radius: 4px; }
-    ::-webkit-scrollbar-thumb { background: rgba(148,163,184,.3); border-radius: 4px; }
-    ::-webkit-scrollbar-thumb:hover { background: rgba(148,163,184,.5); }
-    
-    /* Let the briefing breathe a bit more on larger screens */
-    @media (min-width: 980px) {
-      .briefingText { max-height: 520px; }
-    }
+/* Dark scrollbars */
+::-webkit-scrollbar { width: 8px; height: 8px; }
+::-webkit-scrollbar-track { background: rgba(15,23,42,.3); border-radius: 4px; }
+::-webkit-scrollbar-thumb { background: rgba(148,163,184,.3); border-radius: 4px; }
+::-webkit-scrollbar-thumb:hover { background: rgba(148,163,184,.5); }
+
+/* Let the briefing breathe a bit more on larger screens */
+@media (min-width: 980px) {
+  .briefingText { max-height: 520px; }
+}
 
-    /* History Delta (Market Context): strukturiert + scanbar */
+/* History Delta (Market Context): strukturiert + scanbar */
 #historyCard #historyText { white-space: normal; }
 
 .hdWrap { display:flex; flex-direction:column; gap: 10px; }
@@ -1125,55 +1336,68 @@ def _render_html(*, data_records: list[dict[str, Any]], presets: dict[str, Any],
 
 @media (max-width: 980px) { .hdGrid { grid-template-columns: 1fr; } }
 
-    /* MOVERS_LAYOUT_v4_2: Symbol | 1D/1Y | Segment pill (right) */
-    .moversList { font-family: var(--mono); font-size: 11px; display:flex; flex-direction:column; gap:8px; }
+/* MOVERS_LAYOUT_v4_2: Symbol | 1D/1Y | Segment pill (right) */
+.moversList { font-family: var(--mono); font-size: 11px; display:flex; flex-direction:column; gap:8px; }
 
-    .moversItem {
-      display: grid;
-      grid-template-columns: 72px 78px 40px;
-      gap: 4px;
-      align-items: center;
-    }
+.moversItem {
+  display: grid;
+  grid-template-columns: 72px 78px 40px;
+  gap: 4px;
+  align-items: center;
+}
 
-    .moversItem .mvSym { white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
-    .moversItem .mvVals { display:flex; flex-direction:column; gap:2px; align-items:flex-end; line-height:1.15; }
-    .moversItem .mvLine { white-space: nowrap; }
-    .moversItem .mvLine.pos { color: var(--good); }
-    .moversItem .mvLine.neg { color: var(--bad); }
-    .moversItem .mvLine.flat { color: var(--muted); }
-
-    .moversItem .mvSeg {
-      justify-self: end;
-      width: 40px; max-width: 40px;
-      overflow: hidden; text-overflow: ellipsis; white-space: nowrap;
-      padding: 2px 6px;
-      border-radius: 999px;
-      border: 1px solid rgba(148,163,184,.18);
-      background: rgba(15,23,42,.55);
-      color: rgba(226,232,240,.85);
-      font-size: 10px;
-    }
+.moversItem .mvSym { white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+.moversItem .mvVals { display:flex; flex-direction:column; gap:2px; align-items:flex-end; line-height:1.15; }
+.moversItem .mvLine { white-space: nowrap; }
+.moversItem .mvLine.pos { color: var(--good); }
+.moversItem .mvLine.neg { color: var(--bad); }
+.moversItem .mvLine.flat { color: var(--muted); }
+
+.moversItem .mvSeg {
+  justify-self: end;
+  width: 40px; max-width: 40px;
+  overflow: hidden; text-overflow: ellipsis; white-space: nowrap;
+  padding: 2px 6px;
+  border-radius: 999px;
+  border: 1px solid rgba(148,163,184,.18);
+  background: rgba(15,23,42,.55);
+  color: rgba(226,232,240,.85);
+  font-size: 10px;
+}
 
-    /* Dezente Trennlinie zwischen Top und Weak */
-    .moversSection {
-      position: relative;
-    }
-    .moversSection:not(:last-child)::after {
-      content: '';
-      position: absolute;
-      bottom: -4px;
-      left: 0;
-      right: 0;
-      height: 1px;
-      background: rgba(148,163,184,.15);
-    }
+/* Dezente Trennlinie zwischen Top und Weak */
+.moversSection {
+  position: relative;
+}
+.moversSection:not(:last-child)::after {
+  content: '';
+  position: absolute;
+  bottom: -4px;
+  left: 0;
+  right: 0;
+  height: 1px;
+  background: rgba(148,163,184,.15);
+}
 
-    /* Mobile: Segment unter die Zeile */
-    @media (max-width: 900px) {
-      .moversItem { grid-template-columns: 1fr 82px; grid-template-rows: auto auto; }
-      .moversItem .mvSeg { grid-column: 1 / -1; justify-self: start; width:auto; max-width:100%; }
-    }
-  </style>
+/* Mobile: Segment unter die Zeile */
+@media (max-width: 900px) {
+  .moversItem { grid-template-columns: 1fr 82px; grid-template-rows: auto auto; }
+  .moversItem .mvSeg { grid-column: 1 / -1; justify-self: start; width:auto; max-width:100%; }
+}
+"""
+# Content hash as cache-buster, so browsers refetch only when the CSS changes.
+_APP_CSS_HREF = "app.css?v=" + hashlib.sha256(_APP_CSS.encode("utf-8")).hexdigest()[:12]
+
+
+# NOTE: We intentionally avoid Python f-strings for the HTML template because the
+# embedded CSS/JS contains many curly braces. We inject values via simple tokens.
+_TEMPLATE = """<!doctype html>
+<html lang="de">
+<head>
+  <meta charset="utf-8"/>
+  <meta name="viewport" content="width=device-width, initial-scale=1"/>
+  <title>Scanner_vNext  Research Dashboard</title>
+  <link rel="stylesheet" href="__APP_CSS_HREF__"/>
 </head>
 <body>
   <header>
@@ -1463,8 +1687,27 @@ def _render_html(*, data_records: list[dict[str, Any]], presets: dict[str, Any],
               <th data-k="is_crypto" class="hide-sm" title="Assetklasse">Art</th>
             </tr>
           </thead>
-          <tbody>__FALLBACK_TBODY__</tbody>
+          <tbody></tbody>
         </table>
+        <noscript>
+          <table>
+            <thead>
+              <tr>
+                <th>Symbol</th>
+                <th>Name</th>
+                <th class="right">Kurs</th>
+                <th class="right">Score</th>
+                <th class="hide-sm right">Konf</th>
+                <th class="hide-sm right">Zyklus</th>
+                <th>Trend</th>
+                <th>Liq</th>
+                <th>Status</th>
+                <th class="hide-sm">Art</th>
+              </tr>
+            </thead>
+            <tbody>__FALLBACK_TBODY__</tbody>
+          </table>
+        </noscript>
       </div>
 
       <div class="footer">
@@ -1474,6 +1717,7 @@ def _render_html(*, data_records: list[dict[str, Any]], presets: dict[str, Any],
     </div>
   </div>
 
+  <template id="drawerTpl">
   <div id="drawerOverlay" class="overlay" aria-hidden="true">
     <div class="drawer panel" role="dialog" aria-modal="true" aria-label="Why Score">
       <div class="drawer-head">
@@ -1489,6 +1733,7 @@ def _render_html(*, data_records: list[dict[str, Any]], presets: dict[str, Any],
       <div class="drawer-body" id="drawerBody"></div>
     </div>
   </div>
+  </template>
 
   <script id="DATA" type="application/json">__DATA_JSON__</script>
   <script id="PRESETS" type="application/json">__PRESETS_JSON__</script>
@@ -1530,7 +1775,22 @@ def _render_html(*, data_records: list[dict[str, Any]], presets: dict[str, Any],
   <script>
   (function() {
     try {
-    const DATA = JSON.parse((document.getElementById('DATA')?.textContent) || '[]');
+    // DATA ships column-major as {cols, n, data} (keys once, one array per column);
+    // rebuild the row objects here.
+    const DATA = (function() {
+      const t = JSON.parse((document.getElementById('DATA')?.textContent) || '{}');
+      const cols = Array.isArray(t.cols) ? t.cols : [];
+      const data = Array.isArray(t.data) ? t.data : [];
+      const n = Number(t.n) || 0;
+      const out = new Array(n);
+      for (let i = 0; i < n; i++) out[i] = {};
+      for (let j = 0; j < cols.length; j++) {
+        const k = cols[j];
+        const col = data[j] || [];
+        for (let i = 0; i < n; i++) out[i][k] = col[i];
+      }
+      return out;
+    })();
     const PRESETS = JSON.parse((document.getElementById('PRESETS')?.textContent) || '{}');
     const BRIEFING = JSON.parse((document.getElementById('BRIEFING')?.textContent) || '{"text":""}');
     const briefing = BRIEFING;
@@ -1564,15 +1824,12 @@ def _render_html(*, data_records: list[dict[str, Any]], presets: dict[str, Any],
       return normStr(r.asset_id) || normStr(r.symbol) || normStr(r.ticker_display) || normStr(r.ticker);
     }
 
-    function attachDScore(rows) {
-      if (!rows) return rows;
-      for (const r of rows) {
-        const k = historyKey(r);
-        const rec = k ? HD_BY[k] : null;
-        const d = rec ? (rec.score_delta ?? rec.scoreDelta ?? rec.delta ?? null) : null;
-        r.dscore_1d = (d === null || d === undefined) ? null : Number(d);
-      }
-      return rows;
+    // History delta is static for the page's lifetime, so it is resolved once per row at load.
+    function dscoreOf(r) {
+      const k = historyKey(r);
+      const rec = k ? HD_BY[k] : null;
+      const d = rec ? (rec.score_delta ?? rec.scoreDelta ?? rec.delta ?? null) : null;
+      return (d === null || d === undefined) ? null : Number(d);
     }
 
 
@@ -1614,12 +1871,13 @@ const elHeatMode = document.getElementById('heatMode');
     const btnSegmentToggle = document.getElementById('segmentToggle');
     const elHistory = document.getElementById('historyText');
     const btnHistoryToggle = document.getElementById('historyToggle');
-    const drawerOverlay = document.getElementById('drawerOverlay');
-    const drawerClose = document.getElementById('drawerClose');
-    const drawerTitle = document.getElementById('drawerTitle');
-    const drawerSub = document.getElementById('drawerSub');
-    const drawerBody = document.getElementById('drawerBody');
-    const drawerActions = document.getElementById('drawerActions');
+    // The "Why" drawer ships inert in <template id="drawerTpl"> and is mounted on first open.
+    let drawerOverlay = null;
+    let drawerClose = null;
+    let drawerTitle = null;
+    let drawerSub = null;
+    let drawerBody = null;
+    let drawerActions = null;
 
     // Flow info popover (Preset  Quick-Filter) - REMOVED: Now using unified help system
 
@@ -1677,8 +1935,8 @@ let heatFilter = { cat: null, sb: null, mode: null };
 
     // Bucket-matrix filter (Score  Risk)
     let matrix = { sb: null, rb: null };
-    const DEFAULT_MATRIX = { sb: null, rb: null };
-    const DEFAULT_HEAT_FILTER = { cat: null, sb: null, mode: null };
+    const DEFAULT_MATRIX = Object.freeze({ sb: null, rb: null });
+    const DEFAULT_HEAT_FILTER = Object.freeze({ cat: null, sb: null, mode: null });
 
     const DEFAULT_QUICK = {
       hideAvoid: true,
@@ -1712,7 +1970,20 @@ let heatFilter = { cat: null, sb: null, mode: null };
       }
     }
 
+    // Persistence is batched: handlers call saveState() freely, at most one write happens per
+    // SAVE_STATE_DELAY_MS window (or when the page is hidden/unloaded) and only if the serialized
+    // state changed. A pending write is not re-armed, so a burst of clicks cannot postpone it.
+    const SAVE_STATE_DELAY_MS = 500;
+    let _saveTimer = 0;
+    let _lastSaved = '';
     function saveState() {
+      if (_saveTimer) return;
+      _saveTimer = setTimeout(_saveStateNow, SAVE_STATE_DELAY_MS);
+    }
+
+    function _saveStateNow() {
+      clearTimeout(_saveTimer);
+      _saveTimer = 0;
       try {
         const st = {
           preset: activePreset,
@@ -1726,11 +1997,25 @@ let heatFilter = { cat: null, sb: null, mode: null };
           heatMode: heatMode,
           heatFilter: heatFilter,
         };
-        localStorage.setItem(STORAGE_KEY, JSON.stringify(st));
+        const raw = JSON.stringify(st);
+        if (raw === _lastSaved) return;
+        localStorage.setItem(STORAGE_KEY, raw);
+        _lastSaved = raw;
       } catch (e) {}
     }
 
+    function _flushState() {
+      if (_saveTimer) _saveStateNow();
+    }
+    window.addEventListener('pagehide', _flushState);
+    document.addEventListener('visibilitychange', () => {
+      if (document.visibilityState === 'hidden') _flushState();
+    });
+
     function clearState() {
+      clearTimeout(_saveTimer);
+      _saveTimer = 0;
+      _lastSaved = '';
       try { localStorage.removeItem(STORAGE_KEY); } catch (e) {}
     }
 
@@ -1754,8 +2039,8 @@ let heatFilter = { cat: null, sb: null, mode: null };
       quick = uiState.quick;
       uiState.selPillars.clear();
       uiState.selClusters.clear();
-      matrix = Object.assign({}, DEFAULT_MATRIX);
-      heatFilter = Object.assign({}, DEFAULT_HEAT_FILTER);
+      matrix = {...DEFAULT_MATRIX};
+      heatFilter = {...DEFAULT_HEAT_FILTER};
       if (elSearch) elSearch.value = '';
       syncSelectionArrays();
       if (elClusterSel) elClusterSel.value = '';
@@ -1763,7 +2048,7 @@ let heatFilter = { cat: null, sb: null, mode: null };
       if (elPreset) elPreset.value = activePreset;
       syncFilterButtons();
       clearState();
-      refresh();
+      scheduleRefresh();
     }
 
     // ---- info popover (Preset  Quick-Filter) - REMOVED: Now using unified help system
@@ -1828,14 +2113,14 @@ if (st.heatMode !== undefined && st.heatMode !== null) {
       if (st.matrix && typeof st.matrix === 'object') {
         const sb = (st.matrix.sb === null || st.matrix.sb === undefined) ? null : Number(st.matrix.sb);
         const rb = (st.matrix.rb === null || st.matrix.rb === undefined) ? null : Number(st.matrix.rb);
-        matrix = Object.assign({}, DEFAULT_MATRIX, {sb: Number.isFinite(sb) ? sb : null, rb: Number.isFinite(rb) ? rb : null});
+        matrix = {sb: Number.isFinite(sb) ? sb : null, rb: Number.isFinite(rb) ? rb : null};
       }
 
       if (st.heatFilter && typeof st.heatFilter === 'object') {
         const cat = (st.heatFilter.cat ?? '').toString().trim() || null;
         const sb = (st.heatFilter.sb === null || st.heatFilter.sb === undefined) ? null : Number(st.heatFilter.sb);
         const mode = (st.heatFilter.mode ?? '').toString();
-        heatFilter = Object.assign({}, DEFAULT_HEAT_FILTER, {
+        heatFilter = {
           cat,
           sb: Number.isFinite(sb) ? sb : null,
           mode: (
@@ -1848,7 +2133,7 @@ if (st.heatMode !== undefined && st.heatMode !== null) {
             mode === 'playground' ||
             mode === 'pillar_base'
           ) ? ((mode === 'pillar_base' || mode === 'pillar') ? 'tech_focus' : mode) : null,
-        });
+        };
       }
 
       if (st.sort && typeof st.sort === 'object' && st.sort.k) {
@@ -1884,24 +2169,28 @@ if (elHeatMode) {
       v === 'fin_stack' ||
       v === 'playground'
     ) ? v : heatMode;
-    heatFilter = Object.assign({}, DEFAULT_HEAT_FILTER);
+    heatFilter = {...DEFAULT_HEAT_FILTER};
     saveState();
-    refresh();
+    scheduleRefresh();
   });
 }
 
     // ---- helpers ----
     function asNum(v) {
+      // Most payload values are already numbers; skip the Number() coercion for them.
+      if (typeof v === 'number') return Number.isFinite(v) ? v : null;
       const n = Number(v);
       return Number.isFinite(n) ? n : null;
     }
     function asBool(v) {
       if (v === true || v === false) return v;
       if (v === 1 || v === 0) return !!v;
-      const s = (v ?? '').toString().trim().toLowerCase();
-      if (['true','t','yes','y','1'].includes(s)) return true;
-      if (['false','f','no','n','0'].includes(s)) return false;
-      return null;
+      if (v === null || v === undefined) return null;
+      switch (v.toString().trim().toLowerCase()) {
+        case 'true': case 't': case 'yes': case 'y': case '1': return true;
+        case 'false': case 'f': case 'no': case 'n': case '0': return false;
+        default: return null;
+      }
     }
     function normStr(v) {
       return (v ?? '').toString().trim();
@@ -1922,7 +2211,11 @@ if (elHeatMode) {
 })();
 
 // ---- cluster / sektor helpers (UI-only; never affects scoring) ----
+// Cluster/pillar labels depend only on static row fields: computed once per row, cached on it.
 function clusterLabel(r) {
+  return r._cluster ?? (r._cluster = _clusterLabelOf(r));
+}
+function _clusterLabelOf(r) {
   const isC = asBool(r.is_crypto) === true;
   if (isC) return 'Krypto';
   const derived = normStr(r.cluster_official);
@@ -1938,7 +2231,32 @@ function computeClusterCounts(rows) {
     if (!c) continue;
     m.set(c, (m.get(c) || 0) + 1);
   }
-  const arr = Array.from(m.entries()).map(([k,v]) => ({k, v}));
+  return _clusterCountList(m);
+}
+// Count lists are filled into per-facet scratch arrays (refilled on every call, consumed
+// immediately by the renderers), so steady-state refreshes allocate no list arrays.
+const _clusterScratch = [];
+const _pillarScratch = [];
+function _fillCountList(arr, m) {
+  arr.length = 0;
+  for (const [k, v] of m) arr.push({k, v});
+  return arr;
+}
+// Facet panels are pure functions of (counts, selection): each renderer keeps the
+// signature of its last draw and skips the DOM rebuild when nothing changed.
+let _facetSigs = {};
+function _countsSig(counts) {
+  let s = '';
+  for (const x of (counts || [])) s += x.k + '\\t' + x.v + '\\n';
+  return s;
+}
+function _facetUnchanged(slot, sig) {
+  if (_facetSigs[slot] === sig) return true;
+  _facetSigs[slot] = sig;
+  return false;
+}
+function _clusterCountList(m) {
+  const arr = _fillCountList(_clusterScratch, m);
   arr.sort((a,b) => b.v - a.v || a.k.localeCompare(b.k));
   return arr;
 }
@@ -1946,53 +2264,110 @@ function computeClusterCounts(rows) {
 function renderClusterOptions(counts) {
   if (!elClusterSel) return;
   const cur = (Array.isArray(clusterPick) ? (clusterPick.length===1 ? clusterPick[0] : '') : (clusterPick || '') ) || '';
-  elClusterSel.innerHTML = '';
+  if (_facetUnchanged('clusterOpt', _countsSig(counts))) {
+    elClusterSel.value = cur;
+    return;
+  }
+  const frag = document.createDocumentFragment();
   const opt0 = document.createElement('option');
   opt0.value = '';
   opt0.textContent = 'Alle';
-  elClusterSel.appendChild(opt0);
+  frag.appendChild(opt0);
   for (const x of counts) {
     const opt = document.createElement('option');
     opt.value = x.k;
     opt.textContent = `${x.k} (${x.v})`;
-    elClusterSel.appendChild(opt);
+    frag.appendChild(opt);
   }
+  elClusterSel.replaceChildren(frag);
   elClusterSel.value = cur;
 }
 
+// Chip rows are built as DOM nodes (textContent/dataset, no HTML re-parse); clicks are
+// handled by the delegated [data-chip] listener on document.
+function _chipLabel(text) {
+  const el = document.createElement('span');
+  el.className = 'label';
+  el.textContent = text;
+  return el;
+}
+function _chipButton(type, val, kind, title, text, count) {
+  const b = document.createElement('button');
+  b.type = 'button';
+  b.className = `chip kpi ${kind}`;
+  b.dataset.chip = type;
+  b.dataset.val = val;
+  b.title = title;
+  b.textContent = text;
+  if (count !== undefined) {
+    b.append(' ');
+    const n = document.createElement('span');
+    n.className = 'mono';
+    n.textContent = `(${count})`;
+    b.appendChild(n);
+  }
+  return b;
+}
+
 function renderClusterChips(counts) {
   if (!elClusters) return;
   const top = (counts || []).slice(0, 12);
   const activeSet = uiState.selClusters;
-  let html = '<span class="label">Cluster:</span>';
-  
+  if (_facetUnchanged('clusterChips', _countsSig(top) + Array.from(activeSet).join('\\t'))) return;
+  const frag = document.createDocumentFragment();
+  frag.appendChild(_chipLabel('Cluster:'));
+
   // "Alle" chip
   const allActive = activeSet.size === 0;
-  html += `<button type="button" class="chip kpi ${allActive ? 'blue active' : 'blue'}" data-chip="cluster" data-val="__ALL__" title="Alle Cluster anzeigen">Alle</button>`;
-  
+  frag.appendChild(_chipButton('cluster', '__ALL__', allActive ? 'blue active' : 'blue', 'Alle Cluster anzeigen', 'Alle'));
+
   if (activeSet.size) {
     const label = activeSet.size + ' selected';
     const tip = Array.from(activeSet).join(', ');
-    html += `<button type="button" class="chip kpi warn active" data-chip="cluster" data-val="__CLEAR__" title="Cluster-Filter lÃ¶schen: ${esc(tip)}"> ${esc(label)}</button>`;
+    frag.appendChild(_chipButton('cluster', '__CLEAR__', 'warn active', `Cluster-Filter lÃ¶schen: ${tip}`, ` ${label}`));
   }
   for (const x of top) {
     const isOn = activeSet.has(x.k);
     const kind = isOn ? 'warn active' : 'blue';
-    html += `<button type="button" class="chip kpi ${kind}" data-chip="cluster" data-val="${esc(x.k)}" title="Filter: nur Cluster ${esc(x.k)}">${esc(x.k)} <span class="mono">(${x.v})</span></button>`;
+    frag.appendChild(_chipButton('cluster', x.k, kind, `Filter: nur Cluster ${x.k}`, x.k, x.v));
+  }
+  if (!top.length) {
+    const none = document.createElement('span');
+    none.className = 'muted';
+    none.textContent = '';
+    frag.appendChild(none);
   }
-  if (!top.length) html += '<span class="muted"></span>';
-  elClusters.innerHTML = html;
+  elClusters.replaceChildren(frag);
 }
 
-function applyClusterFilter(rows) {
-  if (uiState.selClusters.size === 0) return rows;
-  return (rows || []).filter(r => uiState.selClusters.has(clusterLabel(r)));
+function clusterPred() {
+  const sel = uiState.selClusters;
+  if (sel.size === 0) return null;
+  return (r) => sel.has(clusterLabel(r));
 }
 
 // ---- 5SÃ¤ulen / Playground helpers (UI-only; private metadata; never affects scoring) ----
 const PILLAR_ORDER = ['Gehirn','Hardware','Energie','Fundament','Recycling','Playground'];
+const _PILLAR_RANK = new Map(PILLAR_ORDER.map((k, i) => [k, i]));
+function _pillarRank(k) {
+  const i = _PILLAR_RANK.get(k);
+  return (i === undefined) ? -1 : i;
+}
+
+// Legacy categories repeat heavily across rows: classify each distinct raw string once.
+const _PILLAR_CACHE = new Map();
 
 function _derivePillarFromLegacy(catRaw) {
+  const key = (catRaw || '').toString();
+  let hit = _PILLAR_CACHE.get(key);
+  if (hit === undefined) {
+    hit = _classifyLegacyPillar(key);
+    _PILLAR_CACHE.set(key, hit);
+  }
+  return hit;
+}
+
+function _classifyLegacyPillar(catRaw) {
   const cat = (catRaw || '').toString().trim();
   if (!cat) return '';
   const s = cat.toLowerCase();
@@ -2013,6 +2388,9 @@ function _derivePillarFromLegacy(catRaw) {
 }
 
 function pillarLabel(r) {
+  return r._pillar ?? (r._pillar = _pillarLabelOf(r));
+}
+function _pillarLabelOf(r) {
   const p = normStr(r.pillar_primary);
   if (p) return p;
   // fallback for older universes: derive from legacy categories so the concept is still visible in UI
@@ -2051,6 +2429,15 @@ function heatConceptLabel(r, mode) {
   if (mode === 'fin_stack') return (n !== null && n >= 21) ? `S${n}` : '';
   return '';
 }
+// Heat labels depend only on row data and mode: one lazily filled label column per mode.
+const _HEAT_LABELS = new Map();
+function heatLabelOf(r, mode) {
+  let col = _HEAT_LABELS.get(mode);
+  if (!col) _HEAT_LABELS.set(mode, col = new Array(DATA.length).fill(null));
+  let v = col[r._i];
+  if (v === null) v = col[r._i] = heatConceptLabel(r, mode);
+  return v;
+}
 function fixedHeatCategories(mode) {
   if (mode === 'tech_focus') return ['S1', 'S2', 'S3', 'S4', 'S5', 'Krypto'];
   if (mode === 'tech_stack') return ['S1','S2','S3','S4','S5','S6','S7','S8','S9','S10','Krypto'];
@@ -2067,74 +2454,87 @@ function computePillarCounts(rows) {
     if (!p) continue;
     m.set(p, (m.get(p) || 0) + 1);
   }
-  const arr = Array.from(m.entries()).map(([k,v]) => ({k, v}));
+  return _pillarCountList(m);
+}
+function _pillarCountList(m) {
+  const arr = _fillCountList(_pillarScratch, m);
   // stable order
-  arr.sort((a,b) => PILLAR_ORDER.indexOf(a.k) - PILLAR_ORDER.indexOf(b.k));
+  arr.sort((a,b) => _pillarRank(a.k) - _pillarRank(b.k));
   return arr;
 }
 
+// Cluster + pillar counts in one pass (refresh needs both for the same universe).
+function computeFacetCounts(rows) {
+  const cm = new Map();
+  const pm = new Map();
+  for (const k of PILLAR_ORDER) pm.set(k, 0);
+  for (const r of rows || []) {
+    const c = clusterLabel(r);
+    if (c) cm.set(c, (cm.get(c) || 0) + 1);
+    const p = pillarLabel(r);
+    if (p) pm.set(p, (pm.get(p) || 0) + 1);
+  }
+  return {cluster: _clusterCountList(cm), pillar: _pillarCountList(pm)};
+}
+
 function renderPillarOptions(counts) {
   if (!elPillarSel) return;
   const cur = (Array.isArray(pillarPick) ? (pillarPick.length===1 ? pillarPick[0] : '') : (pillarPick || '') ) || '';
-  elPillarSel.innerHTML = '';
+  if (_facetUnchanged('pillarOpt', _countsSig(counts))) {
+    elPillarSel.value = cur;
+    return;
+  }
+  const frag = document.createDocumentFragment();
   const opt0 = document.createElement('option');
   opt0.value = '';
   opt0.textContent = 'Alle';
-  elPillarSel.appendChild(opt0);
+  frag.appendChild(opt0);
   for (const x of (counts || [])) {
     // keep all options visible even if zero to make the model explicit
     const opt = document.createElement('option');
     opt.value = x.k;
     opt.textContent = `${x.k} (${x.v})`;
-    elPillarSel.appendChild(opt);
+    frag.appendChild(opt);
   }
+  elPillarSel.replaceChildren(frag);
   elPillarSel.value = cur;
 }
 
 function renderPillarChips(counts) {
   if (!elPillars) return;
   const activeSet = uiState.selPillars;
-  let html = '<span class="label">SÃ¤ulen:</span>';
-  
+  if (_facetUnchanged('pillarChips', _countsSig(counts) + Array.from(activeSet).join('\\t'))) return;
+  const frag = document.createDocumentFragment();
+  frag.appendChild(_chipLabel('SÃ¤ulen:'));
+
   // "Alle" chip
   const allActive = activeSet.size === 0;
-  html += `<button type="button" class="chip kpi ${allActive ? 'blue active' : 'blue'}" data-chip="pillar" data-val="__ALL__" title="Alle SÃ¤ulen anzeigen">Alle</button>`;
-  
+  frag.appendChild(_chipButton('pillar', '__ALL__', allActive ? 'blue active' : 'blue', 'Alle SÃ¤ulen anzeigen', 'Alle'));
+
   if (activeSet.size) {
     const label = activeSet.size + ' selected';
     const tip = Array.from(activeSet).join(', ');
-    html += `<button type="button" class="chip kpi warn active" data-chip="pillar" data-val="__CLEAR__" title="SÃ¤ulen-Filter lÃ¶schen: ${esc(tip)}"> ${esc(label)}</button>`;
+    frag.appendChild(_chipButton('pillar', '__CLEAR__', 'warn active', `SÃ¤ulen-Filter lÃ¶schen: ${tip}`, ` ${label}`));
   }
   for (const x of (counts || [])) {
     const isOn = activeSet.has(x.k);
     const kind = isOn ? 'warn active' : 'blue';
-    const dis = (x.v || 0) <= 0 ? 'disabled aria-disabled="true"' : '';
-    html += `<button type="button" class="chip kpi ${kind}" data-chip="pillar" data-val="${esc(x.k)}" ${dis} title="Filter: nur SÃ¤ule ${esc(x.k)}">${esc(x.k)} <span class="mono">(${x.v})</span></button>`;
+    const b = _chipButton('pillar', x.k, kind, `Filter: nur SÃ¤ule ${x.k}`, x.k, x.v);
+    if ((x.v || 0) <= 0) {
+      b.disabled = true;
+      b.setAttribute('aria-disabled', 'true');
+    }
+    frag.appendChild(b);
   }
-  elPillars.innerHTML = html;
+  elPillars.replaceChildren(frag);
 }
 
-function applyPillarFilter(rows) {
-  if (uiState.selPillars.size === 0) return rows;
-  return (rows || []).filter(r => uiState.selPillars.has(pillarLabel(r)));
+function pillarPred() {
+  const sel = uiState.selPillars;
+  if (sel.size === 0) return null;
+  return (r) => sel.has(pillarLabel(r));
 }
 
-    function percentileRank(sorted, v) {
-      // sorted: ascending array, v: number
-      if (!sorted || sorted.length === 0 || v === null || v === undefined) return null;
-      const n = sorted.length;
-      if (n === 1) return 100.0;
-      // upper bound index
-      let lo = 0, hi = n;
-      while (lo < hi) {
-        const mid = (lo + hi) >> 1;
-        if (sorted[mid] <= v) lo = mid + 1;
-        else hi = mid;
-      }
-      const idx = Math.max(0, Math.min(n - 1, lo - 1));
-      return (idx / (n - 1)) * 100.0;
-    }
-
     function riskRaw(r) {
       const v = asNum(r.volatility);
       if (v !== null) return Math.abs(v);
@@ -2145,16 +2545,130 @@ function applyPillarFilter(rows) {
       return null;
     }
 
-    // Precompute score / risk percentiles for stable buckets & signal codes
-    const SCORE_SORTED = DATA.map(r => asNum(r.score)).filter(v => v !== null).sort((a,b) => a-b);
-    const RISK_SORTED = DATA.map(r => riskRaw(r)).filter(v => v !== null).sort((a,b) => a-b);
+    // Percentiles (0..100) of a packed value column (NaN = missing); ties share the highest rank.
+    // Present values are copied into a Float64Array and sorted natively (numeric, no comparator);
+    // each row's rank is then the upper bound of its value in that sorted array.
+    // Self-contained: its source is also the worker body.
+    function percentilesOf(vals) {
+      const m = vals.length;
+      const buf = new Float64Array(m);
+      let n = 0;
+      for (let i = 0; i < m; i++) if (vals[i] === vals[i]) buf[n++] = vals[i];
+      const sorted = buf.subarray(0, n).sort();
+      const out = new Float64Array(m);
+      for (let i = 0; i < m; i++) {
+        const v = vals[i];
+        if (v !== v) { out[i] = NaN; continue; }
+        let lo = 0;
+        let len = n;
+        while (len > 0) {
+          const half = len >>> 1;
+          if (sorted[lo + half] <= v) { lo += half + 1; len -= half + 1; } else { len = half; }
+        }
+        out[i] = (n === 1) ? 100.0 : ((lo - 1) / (n - 1)) * 100.0;
+      }
+      return out;
+    }
+
+    function applyPercentiles(score, risk) {
+      for (let i = 0; i < DATA.length; i++) {
+        DATA[i].score_pctl = Number.isNaN(score[i]) ? null : score[i];
+        DATA[i].risk_pctl = Number.isNaN(risk[i]) ? null : risk[i];
+        ROW_RISK_BKT[i] = riskBucket(DATA[i].risk_pctl);
+      }
+      _SORT_COLS.delete('score_pctl');
+      _SORT_COLS.delete('risk_pctl');
+    }
+
+    // Quick-filter/KPI inputs packed per row (indexed by r._i): status code + boolean bitmap.
+    const ST_OTHER = 0, ST_OK = 1, ST_AVOID = 2, ST_NA = 3, ST_ERROR = 4;
+    const F_TREND_OK = 1, F_TREND_FAIL = 2, F_LIQ_OK = 4, F_LIQ_FAIL = 8, F_CRYPTO = 16, F_AVOID_ANY = 32;
+    const ROW_STATUS = new Uint8Array(DATA.length);
+    const ROW_FLAGS = new Uint8Array(DATA.length);
+    function statusCode(r) {
+      const st = normStr(r.score_status);
+      if (st === 'OK') return ST_OK;
+      if (isAvoidStatus(st)) return ST_AVOID;
+      if (st === 'NA') return ST_NA;
+      if (st === 'ERROR') return ST_ERROR;
+      return ST_OTHER;
+    }
+    function rowFlags(r) {
+      const t = asBool(r.trend_ok);
+      const l = asBool(r.liquidity_ok);
+      return (t === true ? F_TREND_OK : 0) | (t === false ? F_TREND_FAIL : 0)
+        | (l === true ? F_LIQ_OK : 0) | (l === false ? F_LIQ_FAIL : 0)
+        | (asBool(r.is_crypto) === true ? F_CRYPTO : 0)
+        | (normStr(r.score_status).startsWith('AVOID') ? F_AVOID_ANY : 0);
+    }
 
-    for (const r of DATA) {
-      r.score_pctl = percentileRank(SCORE_SORTED, asNum(r.score));
+    // Packed sort-key columns by field name (see sortColumn()).
+    const _SORT_COLS = new Map();
+
+    // Precompute per-row fields once per dataset so refresh-time code compares packed ints/numbers
+    // instead of re-parsing strings; score/risk are also packed for the percentile pass.
+    const SCORE_VALS = new Float64Array(DATA.length);
+    const RISK_VALS = new Float64Array(DATA.length);
+    const ROW_SCORE_BKT = new Uint8Array(DATA.length);
+    const ROW_RISK_BKT = new Uint8Array(DATA.length);  // filled by applyPercentiles()
+    const ROW_BLOOM = new Int32Array(DATA.length * 2);  // 64-bit bigram mask per row, see bigramMask()
+    let RISK_COUNT = 0;
+    for (let i = 0; i < DATA.length; i++) {
+      const r = DATA[i];
+      r._i = i;
+      ROW_STATUS[i] = statusCode(r);
+      ROW_FLAGS[i] = rowFlags(r);
       r.risk_raw = riskRaw(r);
-      r.risk_pctl = percentileRank(RISK_SORTED, r.risk_raw);
+      r.score_pctl = null;
+      r.risk_pctl = null;
+      r.dscore_1d = dscoreOf(r);
+      r._searchBlob = searchBlob(r);
+      r._searchTokens = searchTokens(r._searchBlob);
+      bigramMask(r._searchBlob, ROW_BLOOM, i * 2);
+      r._ySym = pickYahooSymbol(r);
+      r._dispSym = pickDisplaySymbol(r);
+      r._yHref = yahooHref(r._ySym || r._dispSym);
+      clusterLabel(r);
+      pillarLabel(r);
+      const sv = asNum(r.score);
+      SCORE_VALS[i] = (sv === null) ? NaN : sv;
+      ROW_SCORE_BKT[i] = scoreBucket(sv);
+      RISK_VALS[i] = (r.risk_raw === null) ? NaN : r.risk_raw;
+      if (r.risk_raw !== null) RISK_COUNT++;
     }
 
+    // Large universes rank score/risk in a Web Worker so the first paint isn't blocked; the table
+    // renders immediately and refreshes once percentiles (buckets, matrix) arrive. Small ones, or
+    // browsers without Worker/blob URLs, compute synchronously.
+    const PCTL_WORKER_MIN_ROWS = 2000;
+    (function computePercentiles() {
+      const sync = () => applyPercentiles(percentilesOf(SCORE_VALS), percentilesOf(RISK_VALS));
+      if (DATA.length < PCTL_WORKER_MIN_ROWS || typeof Worker === 'undefined') { sync(); return; }
+      let url = '';
+      let w = null;
+      try {
+        const src = percentilesOf.toString() +
+          '\\nonmessage = (e) => { const s = percentilesOf(e.data.score); const r = percentilesOf(e.data.risk);' +
+          ' postMessage({score: s, risk: r}, [s.buffer, r.buffer]); };';
+        url = URL.createObjectURL(new Blob([src], {type: 'application/javascript'}));
+        w = new Worker(url);
+      } catch (e) {
+        if (url) URL.revokeObjectURL(url);
+        sync();
+        return;
+      }
+      const done = (score, risk) => {
+        w.terminate();
+        URL.revokeObjectURL(url);
+        if (score) applyPercentiles(score, risk); else sync();
+        invalidateRefresh();
+        scheduleRefresh();
+      };
+      w.onmessage = (e) => done(e.data.score, e.data.risk);
+      w.onerror = (e) => { e.preventDefault(); done(null, null); };
+      w.postMessage({score: SCORE_VALS, risk: RISK_VALS});
+    })();
+
     function scoreBucket(score) {
       const s = Math.max(0, Math.min(100, asNum(score) ?? 0));
       return Math.min(4, Math.floor(s / 20));
@@ -2178,29 +2692,43 @@ function applyPillarFilter(rows) {
     }
 
 
+    // Price formatters are built once; toLocaleString would set up a formatter per cell.
+    const _PRICE_FMT = {};
+    try {
+      for (const d of [2, 4, 6]) _PRICE_FMT[d] = new Intl.NumberFormat('de-DE', { maximumFractionDigits: d });
+    } catch (e) {}
+
     function fmtPrice(n) {
       if (n === null || n === undefined) return '';
       const ax = Math.abs(n);
       let maxFrac = 2;
       if (ax < 1) maxFrac = 4;
       if (ax < 0.1) maxFrac = 6;
-      try {
-        return n.toLocaleString('de-DE', { maximumFractionDigits: maxFrac });
-      } catch (e) {
-        return n.toFixed(maxFrac);
-      }
+      const fmt = _PRICE_FMT[maxFrac];
+      return fmt ? fmt.format(n) : n.toFixed(maxFrac);
+    }
+
+    // Same text as x.toFixed(0); non-negative values take the much cheaper Math.round path.
+    function fmtInt(x) {
+      return (x >= 0) ? String(Math.round(x)) : x.toFixed(0);
     }
 
+    // Opening markup per sign, built once; only the number varies per row.
+    const _PERF_OPEN = {
+      pos: '<div class="sub chg pos"> ',
+      neg: '<div class="sub chg neg"> ',
+      flat: '<div class="sub chg flat"> ',
+    };
     function perfLine(p) {
       if (p === null || p === undefined) return '<div class="sub muted"></div>';
-      const dir = (p > 0) ? 'pos' : (p < 0) ? 'neg' : 'flat';
-      const arrow = (p > 0) ? '' : (p < 0) ? '' : '';
-      return `<div class="sub chg ${dir}">${arrow} ${p.toFixed(2)}%</div>`;
+      const open = (p > 0) ? _PERF_OPEN.pos : (p < 0) ? _PERF_OPEN.neg : _PERF_OPEN.flat;
+      return `${open}${p.toFixed(2)}%</div>`;
     }
 
     function looksLikeISIN(s) {
       s = normStr(s);
-      return /^[A-Z]{2}[A-Z0-9]{9}[0-9]$/.test(s);
+      // ISINs are exactly 12 chars; most symbols are rejected by length without running the regex.
+      return s.length === 12 && /^[A-Z]{2}[A-Z0-9]{9}[0-9]$/.test(s);
     }
 
     function pickYahooSymbol(r) {
@@ -2275,13 +2803,14 @@ function applyPillarFilter(rows) {
       return 'https://finance.yahoo.com/quote/' + encodeURIComponent(s);
     }
 
+    // Single-pass escaper (one regex scan, shared map/replacer) instead of five replaceAll passes.
+    const _ESC_RX = /[&<>"']/g;
+    const _ESC_TEST = /[&<>"']/;
+    const _ESC_MAP = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'};
+    function _escChar(c) { return _ESC_MAP[c]; }
     function esc(v) {
-      return (v ?? '').toString()
-        .replaceAll('&','&amp;')
-        .replaceAll('<','&lt;')
-        .replaceAll('>','&gt;')
-        .replaceAll('"','&quot;')
-        .replaceAll("'",'&#39;');
+      const s = (v ?? '').toString();
+      return _ESC_TEST.test(s) ? s.replace(_ESC_RX, _escChar) : s;
     }
 
     function chip(text, kind, title) {
@@ -2297,26 +2826,33 @@ function applyPillarFilter(rows) {
       return `<button type="button" class="${cls}"${k}${t} aria-pressed="${active ? 'true' : 'false'}">${text}</button>`;
     }
 
+    // Signal codes are a fixed set; each record carries its badge markup, built once.
+    const SIG = {};
+    for (const [code, cls] of [['R?', 'bad'], ['R0', 'warn'], ['R1', 'bad'], ['R2', 'warn'], ['R3', 'blue'], ['R4', 'good'], ['R5', 'good']]) {
+      SIG[code] = {code, cls, html: `<span class="sig ${cls}" title="SignalCode">${esc(code)}</span>`};
+    }
+
     function recFor(r) {
-      const st = normStr(r.score_status);
-      if (st === 'NA' || st === 'ERROR') return {code: 'R?', cls: 'bad'};
-      if (st && st.startsWith('AVOID')) return {code: 'R0', cls: 'warn'};
-
-      const p = asNum(r.score_pctl);
-      const tr = asBool(r.trend_ok) === true;
-      const liq = asBool(r.liquidity_ok) === true;
-
-      if (p !== null && p >= 90 && tr && liq) return {code: 'R5', cls: 'good'};
-      if (p !== null && p >= 75 && liq) return {code: 'R4', cls: 'good'};
-      if (p !== null && p >= 45) return {code: 'R3', cls: 'blue'};
-      if (p !== null && p >= 20) return {code: 'R2', cls: 'warn'};
-      return {code: 'R1', cls: 'bad'};
+      const st = ROW_STATUS[r._i];
+      const fl = ROW_FLAGS[r._i];
+      if (st === ST_NA || st === ST_ERROR) return SIG['R?'];
+      if (fl & F_AVOID_ANY) return SIG.R0;
+
+      const p = r.score_pctl;  // number or null (applyPercentiles)
+      const tr = (fl & F_TREND_OK) !== 0;
+      const liq = (fl & F_LIQ_OK) !== 0;
+
+      if (p !== null && p >= 90 && tr && liq) return SIG.R5;
+      if (p !== null && p >= 75 && liq) return SIG.R4;
+      if (p !== null && p >= 45) return SIG.R3;
+      if (p !== null && p >= 20) return SIG.R2;
+      return SIG.R1;
     }
 
     function scoreCell(r) {
       const s = Math.max(0, Math.min(100, asNum(r.score) ?? 0));
       const rec = recFor(r);
-      const sig = rec ? `<span class="sig ${rec.cls}" title="SignalCode">${esc(rec.code)}</span>` : '';
+      const sig = rec ? rec.html : '';
       return `<div class="scorecell"><div class="scorebar"><div style="width:${s}%;"></div></div><span class="mono">${s.toFixed(2)}</span>${sig}</div>`;
     }
 
@@ -2329,48 +2865,71 @@ function applyPillarFilter(rows) {
     }
 
     // ---- preset logic (mirrors scanner.presets.apply) ----
-    function applyFilters(rows, preset) {
-      const filters = preset.filters || [];
-      if (!Array.isArray(filters) || filters.length === 0) return rows;
-
-      return rows.filter(r => {
-        for (const f of filters) {
-          const field = f.field || f.key || f.name;
-          if (!field) continue;
-          const onMissing = (f.on_missing || 'skip').toLowerCase();
+    // Each preset's filter list is compiled once (field lookup, on_missing and the min/max/eq/in
+    // dispatch are resolved up front) and cached per preset object. A compiled filter is bound per
+    // pass to the packed sortColumn() arrays, so range and bool checks read r._i slots instead of
+    // coercing the raw value; binding late keeps percentile columns current.
+    const _FILTER_CACHE = new WeakMap();
+
+    function compileFilter(f) {
+      const field = f.field || f.key || f.name;
+      if (!field) return null;
+      const skip = (f.on_missing || 'skip').toLowerCase() === 'skip';
+      const hasRange = (f.min !== undefined || f.max !== undefined);
+      const min = (f.min !== undefined) ? Number(f.min) : null;
+      const max = (f.max !== undefined) ? Number(f.max) : null;
+      const hasEq = f.eq !== undefined;
+      const target = f.eq;
+      const boolEq = typeof target === 'boolean';
+      const inList = Array.isArray(f.in) ? f.in : null;
+      const boolCode = target ? 1 : 0;
+
+      return () => {
+        const col = (hasRange || (hasEq && boolEq)) ? sortColumn(field) : null;
+        const num = col && col.num;
+        const bool = col && col.bool;
+        return (r) => {
           const v = r[field];
-          const missing = (v === null || v === undefined || v === '');
-          if (missing) {
-            if (onMissing === 'skip') continue;
-            return false;
-          }
+          if (v === null || v === undefined || v === '') return skip;
 
-          if (f.min !== undefined || f.max !== undefined) {
-            const n = asNum(v);
-            if (n === null) {
-              if (onMissing === 'skip') continue;
-              return false;
-            }
-            if (f.min !== undefined && n < Number(f.min)) return false;
-            if (f.max !== undefined && n > Number(f.max)) return false;
+          if (hasRange) {
+            const n = num[r._i];
+            if (n !== n) return skip;
+            if (min !== null && n < min) return false;
+            if (max !== null && n > max) return false;
           }
 
-          if (f.eq !== undefined) {
-            const target = f.eq;
+          if (hasEq) {
             // bool-aware compare
-            if (typeof target === 'boolean') {
-              const b = asBool(v);
-              if (b === null) return false;
-              if (b !== target) return false;
-            } else {
-              if (v !== target) return false;
+            if (boolEq) {
+              if (bool[r._i] !== boolCode) return false;
+            } else if (v !== target) {
+              return false;
             }
           }
 
-          if (Array.isArray(f.in)) {
-            if (!f.in.includes(v)) return false;
-          }
-        }
+          if (inList && !inList.includes(v)) return false;
+          return true;
+        };
+      };
+    }
+
+    function compiledFilters(preset) {
+      let preds = _FILTER_CACHE.get(preset);
+      if (!preds) {
+        const filters = Array.isArray(preset.filters) ? preset.filters : [];
+        preds = filters.map(compileFilter).filter(Boolean);
+        _FILTER_CACHE.set(preset, preds);
+      }
+      return preds;
+    }
+
+    function applyFilters(rows, preset) {
+      const binders = compiledFilters(preset);
+      if (binders.length === 0) return rows;
+      const preds = binders.map(bind => bind());
+      return rows.filter(r => {
+        for (let i = 0; i < preds.length; i++) if (!preds[i](r)) return false;
         return true;
       });
     }
@@ -2385,38 +2944,121 @@ function applyPillarFilter(rows) {
       }).filter(x => x.k);
     }
 
-    function compareBy(specs) {
-      return (a, b) => {
-        for (const s of specs) {
-          const ka = a[s.k];
-          const kb = b[s.k];
+    // Sort keys packed per field (SoA, indexed by r._i): numeric value (NaN = not numeric),
+    // bool code (0/1, 2 = not a bool) and the lower-cased string. Comparators read flat arrays
+    // instead of re-parsing boxed values on every comparison. Built once per field and cached in
+    // _SORT_COLS; applyPercentiles() drops the percentile columns when their values change.
+    function sortColumn(k) {
+      let col = _SORT_COLS.get(k);
+      if (col) return col;
+      const n = DATA.length;
+      col = {num: new Float64Array(n), bool: new Uint8Array(n), str: new Array(n), allNum: true};
+      for (let i = 0; i < n; i++) {
+        const v = DATA[i][k];
+        const x = asNum(v);
+        const b = asBool(v);
+        col.num[i] = (x === null) ? NaN : x;
+        if (x === null) col.allNum = false;
+        col.bool[i] = (b === null) ? 2 : (b ? 1 : 0);
+        col.str[i] = normStr(v).toLowerCase();
+      }
+      _SORT_COLS.set(k, col);
+      return col;
+    }
 
-          // number first
-          const na = asNum(ka);
-          const nb = asNum(kb);
+    // Same ordering rules as before: number first, then bool, then string; per spec direction.
+    // Directions are resolved to signs up front; a single fully numeric key gets its own comparator.
+    function compareIdx(cols, specs) {
+      const sign = specs.map(s => (s.dir === 'asc') ? 1 : -1);
+      if (cols.length === 1 && cols[0].allNum) {
+        const num = cols[0].num;
+        const sg = sign[0];
+        return (a, b) => {
+          const na = num[a];
+          const nb = num[b];
+          return na === nb ? 0 : (na < nb ? -sg : sg);
+        };
+      }
+      return (a, b) => {
+        for (let j = 0; j < specs.length; j++) {
+          const col = cols[j];
           let c = 0;
-          if (na !== null && nb !== null) {
+          const na = col.num[a];
+          const nb = col.num[b];
+          if (na === na && nb === nb) {
             c = na === nb ? 0 : (na < nb ? -1 : 1);
           } else {
-            // bool
-            const ba = asBool(ka);
-            const bb = asBool(kb);
-            if (ba !== null && bb !== null) {
+            const ba = col.bool[a];
+            const bb = col.bool[b];
+            if (ba !== 2 && bb !== 2) {
               c = (ba === bb) ? 0 : (ba ? 1 : -1);
             } else {
-              // string
-              const sa = normStr(ka).toLowerCase();
-              const sb = normStr(kb).toLowerCase();
+              const sa = col.str[a];
+              const sb = col.str[b];
               c = sa === sb ? 0 : (sa < sb ? -1 : 1);
             }
           }
-
-          if (c !== 0) return s.dir === 'asc' ? c : -c;
+          if (c !== 0) return c * sign[j];
         }
         return 0;
       };
     }
 
+    // Ascending rank of every DATA row for field k (ties share a rank), computed once per column
+    // with the full comparator. Sorting any subset then only compares integers.
+    function sortRank(k) {
+      const col = sortColumn(k);
+      if (col.rank) return col.rank;
+      const n = DATA.length;
+      const ord = new Uint32Array(n);
+      for (let i = 0; i < n; i++) ord[i] = i;
+      const cmp = compareIdx([col], [{k, dir: 'asc'}]);
+      ord.sort(cmp);
+      const rank = new Uint32Array(n);
+      let r = 0;
+      for (let p = 0; p < n; p++) {
+        if (p > 0 && cmp(ord[p - 1], ord[p]) !== 0) r = p;
+        rank[ord[p]] = r;
+      }
+      return (col.rank = rank);
+    }
+
+    // Sorts rows by their per-field ranks; ties keep input order. A single key packs
+    // (rank, position) into one float per row and uses the native typed-array sort.
+    function sortRows(rows, specs) {
+      const m = rows.length;
+      const n = DATA.length;
+      const out = new Array(m);
+      const ranks = specs.map(s => sortRank(s.k));
+      const sign = specs.map(s => (s.dir === 'asc') ? 1 : -1);
+      if (specs.length === 1) {
+        const rank = ranks[0];
+        const asc = sign[0] > 0;
+        const keys = new Float64Array(m);
+        for (let p = 0; p < m; p++) {
+          const r = rank[rows[p]._i];
+          keys[p] = (asc ? r : (n - 1 - r)) * m + p;
+        }
+        keys.sort();
+        for (let p = 0; p < m; p++) out[p] = rows[keys[p] % m];
+        return out;
+      }
+      const ix = new Uint32Array(m);
+      const ord = new Uint32Array(m);
+      for (let p = 0; p < m; p++) { ix[p] = rows[p]._i; ord[p] = p; }
+      ord.sort((p, q) => {
+        const a = ix[p];
+        const b = ix[q];
+        for (let j = 0; j < ranks.length; j++) {
+          const d = ranks[j][a] - ranks[j][b];
+          if (d !== 0) return d * sign[j];
+        }
+        return p - q;
+      });
+      for (let p = 0; p < m; p++) out[p] = rows[ord[p]];
+      return out;
+    }
+
     function applyPreset(rows, presetName) {
       const preset = PRESETS[presetName] || PRESETS.CORE || {filters:[], sort:[], limit:200};
       let out = rows.slice();
@@ -2424,7 +3066,7 @@ function applyPillarFilter(rows) {
 
       const specs = parseSortSpecs(preset.sort || []);
       const eff = (specs.length > 0) ? specs : DEFAULT_SORT;
-      out.sort(compareBy(eff));
+      out = sortRows(out, eff);
 
       const limit = Number(preset.limit || 0);
       if (Number.isFinite(limit) && limit > 0) out = out.slice(0, limit);
@@ -2432,14 +3074,96 @@ function applyPillarFilter(rows) {
       return {rows: out, preset};
     }
 
+    // Lower-cased haystack for the search box; rows never mutate these fields, so it is
+    // built once per row at load time instead of on every keystroke.
+    function searchBlob(r) {
+      return [r.ticker, r.ticker_display, r.yahoo_symbol, r.YahooSymbol, r.symbol, r.isin, r.name, r.sector, r.Sector, r.category, r.Sektor, r.Kategorie, r.Industry, r.industry, r.country, r.currency, r["WÃ¤hrung"], r.quote_currency, r.score_status]
+        .map(normStr).join(' ').toLowerCase();
+    }
+
+    // Whole alphanumeric words of the haystack, for O(1) hits on complete-word query tokens.
+    // Partial words (typing "gol" for "gold") still fall back to the substring scan.
+    function searchTokens(blob) {
+      return new Set(blob.split(/[^a-z0-9]+/).filter(Boolean));
+    }
+
+    // OR the 2-gram hashes of s into a 64-bit mask stored as two int32 slots out[at], out[at+1].
+    // Every bigram of a substring is a bigram of the haystack, so a row whose mask does not cover
+    // the query mask cannot match and is dropped before any string scan.
+    function bigramMask(s, out, at) {
+      let lo = 0, hi = 0;
+      for (let i = 0; i + 1 < s.length; i++) {
+        const h = (s.charCodeAt(i) * 131 + s.charCodeAt(i + 1)) & 63;
+        if (h < 32) lo |= 1 << h; else hi |= 1 << (h - 32);
+      }
+      out[at] |= lo;
+      out[at + 1] |= hi;
+    }
+
+    // Large universes also get a trigram -> row-index posting index, built on the first search that
+    // has a token of 3+ chars. Every trigram of a query token must occur in a matching row, so the
+    // shortest posting list over all query trigrams bounds the candidate rows.
+    const SEARCH_INDEX_MIN_ROWS = 2000;
+    let _triIndex = null;
+    function triKey(s, k) {
+      return s.charCodeAt(k) * 4294967296 + s.charCodeAt(k + 1) * 65536 + s.charCodeAt(k + 2);
+    }
+    function trigramIndex() {
+      if (_triIndex) return _triIndex;
+      const idx = new Map();
+      for (let i = 0; i < DATA.length; i++) {
+        const b = DATA[i]._searchBlob;
+        for (let k = 0; k + 3 <= b.length; k++) {
+          const key = triKey(b, k);
+          let a = idx.get(key);
+          if (!a) idx.set(key, a = []);
+          if (a[a.length - 1] !== i) a.push(i);
+        }
+      }
+      return (_triIndex = idx);
+    }
+    // Row marks for the shortest posting list of the query, [] when a trigram never occurs, or
+    // null when the index does not apply (small universe or no 3+ char token).
+    function trigramCandidates(rows, tokens) {
+      if (DATA.length < SEARCH_INDEX_MIN_ROWS || rows.length < SEARCH_INDEX_MIN_ROWS) return null;
+      let best = null;
+      for (const t of tokens) {
+        if (t.length < 3) continue;
+        const idx = trigramIndex();
+        for (let k = 0; k + 3 <= t.length; k++) {
+          const a = idx.get(triKey(t, k));
+          if (!a) return [];
+          if (!best || a.length < best.length) best = a;
+        }
+      }
+      if (!best) return null;
+      const mark = new Uint8Array(DATA.length);
+      for (let j = 0; j < best.length; j++) mark[best[j]] = 1;
+      return mark;
+    }
+
     function applySearch(rows, q) {
       q = (q || '').trim().toLowerCase();
       if (!q) return rows;
       const tokens = q.split(/\\s+/).filter(Boolean);
+      const isWord = tokens.map(t => /^[a-z0-9]+$/.test(t));
+      const mark = trigramCandidates(rows, tokens);
+      if (mark && !mark.length) return [];
+      const qm = new Int32Array(2);
+      for (const t of tokens) bigramMask(t, qm, 0);
+      const qlo = qm[0], qhi = qm[1];
       return rows.filter(r => {
-        const hay = [r.ticker, r.ticker_display, r.yahoo_symbol, r.YahooSymbol, r.symbol, r.isin, r.name, r.sector, r.Sector, r.category, r.Sektor, r.Kategorie, r.Industry, r.industry, r.country, r.currency, r["WÃ¤hrung"], r.quote_currency, r.score_status]
-          .map(normStr).join(' ').toLowerCase();
-        return tokens.every(t => hay.includes(t));
+        if (mark && !mark[r._i]) return false;
+        const i = r._i * 2;
+        if ((ROW_BLOOM[i] & qlo) !== qlo || (ROW_BLOOM[i + 1] & qhi) !== qhi) return false;
+        const hay = r._searchBlob ?? (r._searchBlob = searchBlob(r));
+        const words = r._searchTokens ?? (r._searchTokens = searchTokens(hay));
+        for (let j = 0; j < tokens.length; j++) {
+          const t = tokens[j];
+          if (isWord[j] && words.has(t)) continue;
+          if (hay.indexOf(t) === -1) return false;
+        }
+        return true;
       });
     }
 
@@ -2452,30 +3176,31 @@ function applyPillarFilter(rows) {
       const out = {total:0, ok:0, avoid:0, na:0, error:0, trendFail:0, liqFail:0, crypto:0, stock:0};
       out.total = rows.length;
       for (const r of rows) {
-        const st = normStr(r.score_status);
-        if (st === 'OK') out.ok++;
-        else if (isAvoidStatus(st)) out.avoid++;
-        else if (st === 'NA') out.na++;
-        else if (st === 'ERROR') out.error++;
+        const st = ROW_STATUS[r._i];
+        const fl = ROW_FLAGS[r._i];
+        if (st === ST_OK) out.ok++;
+        else if (st === ST_AVOID) out.avoid++;
+        else if (st === ST_NA) out.na++;
+        else if (st === ST_ERROR) out.error++;
 
-        if (asBool(r.trend_ok) === false) out.trendFail++;
-        if (asBool(r.liquidity_ok) === false) out.liqFail++;
+        if (fl & F_TREND_FAIL) out.trendFail++;
+        if (fl & F_LIQ_FAIL) out.liqFail++;
 
-        const isC = asBool(r.is_crypto) === true;
-        if (isC) out.crypto++; else out.stock++;
+        if (fl & F_CRYPTO) out.crypto++; else out.stock++;
       }
       return out;
     }
 
     function renderKpis(allRows, visibleRows) {
       if (!elKpis) return;
-      const a = summarize(allRows);
+      // Only the universe size is shown for allRows; counts come from the visible rows.
+      const total = allRows.length;
       const v = summarize(visibleRows);
 
       // KPI chips double as quick filters (intuitive). Preset applies first, then search, then quick filters.
-      elKpis.innerHTML =
+      const html =
         `<span class="label">KPI</span>`
-        + kpiChip(`Sichtbar ${v.total}/${a.total}`, 'blue', 'Sichtbar nach Preset  Suche  Quick-Filter / Gesamt', '', false)
+        + kpiChip(`Sichtbar ${v.total}/${total}`, 'blue', 'Sichtbar nach Preset  Suche  Quick-Filter / Gesamt', '', false)
         + kpiChip(`OK ${v.ok}`, 'good', 'Filter: nur score_status == OK', 'ok', !!quick.onlyOK)
         + kpiChip(`AVOID ${v.avoid}`, 'warn', 'Filter: nur score_status beginnt mit AVOID_', 'avoid', !!quick.onlyAvoid)
         + kpiChip(`NA ${v.na}`, 'bad', 'Filter: nur score_status == NA', 'na', !!quick.onlyNA)
@@ -2484,6 +3209,8 @@ function applyPillarFilter(rows) {
         + kpiChip(`LiqFail ${v.liqFail}`, v.liqFail ? 'warn' : 'good', 'Filter: nur liquidity_ok == false', 'liqFail', !!quick.onlyLiqFail)
         + kpiChip(`Aktien ${v.stock}`, 'blue', 'Filter: nur is_crypto == false', 'stock', !!quick.onlyStock)
         + kpiChip(`Krypto ${v.crypto}`, 'warn', 'Filter: nur is_crypto == true', 'crypto', !!quick.onlyCrypto);
+      if (_facetUnchanged('kpis', html)) return;
+      elKpis.innerHTML = html;
     }
 
     
@@ -2564,59 +3291,80 @@ function applyPillarFilter(rows) {
 
       syncFilterButtons();
       saveState();
-      refresh();
+      scheduleRefresh();
     }
 
-function applyQuickFilters(rows) {
-      return rows.filter(r => {
-        const status = normStr(r.score_status);
-        const isAvoid = isAvoidStatus(status);
-
-        // status-only filters (from KPI chips)
-        if (uiState.quick.onlyOK && status !== 'OK') return false;
-        if (uiState.quick.onlyAvoid && !isAvoid) return false;
-        if (uiState.quick.onlyNA && status !== 'NA') return false;
-        if (uiState.quick.onlyERR && status !== 'ERROR') return false;
-
-        // Hide AVOID applies only when we're not explicitly filtering for AVOID
-        if (uiState.quick.hideAvoid && !uiState.quick.onlyAvoid && isAvoid) return false;
-
-        // pass/fail filters
-        if (uiState.quick.trendOK && asBool(r.trend_ok) !== true) return false;
-        if (uiState.quick.onlyTrendFail && asBool(r.trend_ok) !== false) return false;
+// Run several row predicates in one pass (null = inactive); returns the input when none apply.
+function filterRows(rows, preds) {
+  const ps = preds.filter(Boolean);
+  if (ps.length === 0) return rows;
+  if (ps.length === 1) return rows.filter(ps[0]);
+  return rows.filter(r => {
+    for (let i = 0; i < ps.length; i++) if (!ps[i](r)) return false;
+    return true;
+  });
+}
 
-        if (uiState.quick.liqOK && asBool(r.liquidity_ok) !== true) return false;
-        if (uiState.quick.onlyLiqFail && asBool(r.liquidity_ok) !== false) return false;
+function applyQuickFilters(rows) {
+      const q = uiState.quick;
+      // The toggles fold into a status whitelist plus a flag mask/want pair, so each row costs
+      // one table lookup and one mask test.
+      const allow = new Uint8Array(5).fill(1);
+      const only = (code) => { for (let c = 0; c < allow.length; c++) if (c !== code) allow[c] = 0; };
+
+      // status-only filters (from KPI chips)
+      if (q.onlyOK) only(ST_OK);
+      if (q.onlyAvoid) only(ST_AVOID);
+      if (q.onlyNA) only(ST_NA);
+      if (q.onlyERR) only(ST_ERROR);
+
+      // Hide AVOID applies only when we're not explicitly filtering for AVOID
+      if (q.hideAvoid && !q.onlyAvoid) allow[ST_AVOID] = 0;
+
+      // pass/fail + class filters: bits in mask are tested, want holds their required values
+      let mask = 0;
+      let want = 0;
+      if (q.trendOK) { mask |= F_TREND_OK; want |= F_TREND_OK; }
+      if (q.onlyTrendFail) { mask |= F_TREND_FAIL; want |= F_TREND_FAIL; }
+      if (q.liqOK) { mask |= F_LIQ_OK; want |= F_LIQ_OK; }
+      if (q.onlyLiqFail) { mask |= F_LIQ_FAIL; want |= F_LIQ_FAIL; }
+      if (q.onlyCrypto) { mask |= F_CRYPTO; want |= F_CRYPTO; }
+      if (q.onlyStock) {
+        if (want & F_CRYPTO) return []; // onlyCrypto + onlyStock: nothing can match
+        mask |= F_CRYPTO;
+      }
 
-        // class filters
-        const isCrypto = asBool(r.is_crypto) === true;
-        if (uiState.quick.onlyCrypto && !isCrypto) return false;
-        if (uiState.quick.onlyStock && isCrypto) return false;
-        return true;
-      });
+      const out = [];
+      for (let k = 0; k < rows.length; k++) {
+        const r = rows[k];
+        const i = r._i;
+        if (allow[ROW_STATUS[i]] === 1 && (ROW_FLAGS[i] & mask) === want) out.push(r);
+      }
+      return out;
     }
 
-    function applyMatrixFilter(rows) {
+    function matrixPred() {
       const sb = (matrix && matrix.sb !== undefined) ? matrix.sb : null;
       const rb = (matrix && matrix.rb !== undefined) ? matrix.rb : null;
-      if (sb === null && rb === null) return rows;
-      return rows.filter(r => {
-        const okS = (sb === null) ? true : (scoreBucket(r.score) === sb);
-        const okR = (rb === null) ? true : (riskBucket(r.risk_pctl) === rb);
+      if (sb === null && rb === null) return null;
+      return (r) => {
+        const okS = (sb === null) ? true : (ROW_SCORE_BKT[r._i] === sb);
+        const okR = (rb === null) ? true : (ROW_RISK_BKT[r._i] === rb);
         return okS && okR;
-      });
+      };
     }
 
     function renderMatrix(rows) {
       if (!elMatrix) return;
 
       // Grid layout: rows = Risk buckets (y), cols = Score buckets (x)
-      const counts = Array.from({length:5}, () => Array(5).fill(0)); // [rb][sb]
+      const counts = new Int32Array(25); // [rb*5 + sb]
       for (const r of rows) {
-        const sb = scoreBucket(r.score);
-        const rb = riskBucket(r.risk_pctl);
-        counts[rb][sb] += 1;
+        const sb = ROW_SCORE_BKT[r._i];
+        const rb = ROW_RISK_BKT[r._i];
+        counts[rb * 5 + sb]++;
       }
+      if (_facetUnchanged('matrix', counts.join(',') + '|' + (matrix ? `${matrix.sb},${matrix.rb}` : ''))) return;
 
       const parts = [];
       // header row: Score buckets (x). Corner shows axis directions.
@@ -2630,7 +3378,7 @@ function applyQuickFilters(rows) {
         const rtxt = riskBucketText(rb);
         parts.push(`<div class="matrixLabel" title="RiskBucket (Perzentil; hÃ¶her = riskanter)"><div class="lbl">${esc(rtxt.range)}</div><div class="hint">${esc(rtxt.hint)}</div></div>`);
         for (let sb = 0; sb < 5; sb++) {
-          const c = counts[rb][sb] || 0;
+          const c = counts[rb * 5 + sb];
           const active = (matrix && matrix.sb === sb && matrix.rb === rb) ? 'active' : '';
           const zero = c === 0 ? 'zero' : '';
 
@@ -2650,31 +3398,32 @@ function applyQuickFilters(rows) {
 
       elMatrix.innerHTML = parts.join('');
 
-      // Click  toggle matrix filter
-      elMatrix.querySelectorAll('.cell').forEach(cell => {
-        cell.addEventListener('click', () => {
-          if (cell.classList.contains('zero')) return;
-          const sb = Number(cell.getAttribute('data-sb'));
-          const rb = Number(cell.getAttribute('data-rb'));
-          if (matrix.sb === sb && matrix.rb === rb) {
-            matrix = Object.assign({}, DEFAULT_MATRIX);
-          } else {
-            matrix = {sb, rb};
-          }
-          refresh();
-          saveState();
-        });
-      });
-
       const sb = (matrix && matrix.sb !== undefined) ? matrix.sb : null;
       const rb = (matrix && matrix.rb !== undefined) ? matrix.rb : null;
       if (elMatrixNote) {
-        const metric = (RISK_SORTED && RISK_SORTED.length) ? 'RiskProxy aus volatility/downside_dev/max_drawdown (Perzentil)' : 'RiskProxy fehlt (keine RiskSpalten im CSV)';
+        const metric = RISK_COUNT ? 'RiskProxy aus volatility/downside_dev/max_drawdown (Perzentil)' : 'RiskProxy fehlt (keine RiskSpalten im CSV)';
         const sel = (sb !== null && rb !== null) ? ` Â· aktiv: Score ${bucketRange(sb)}  ${riskBucketText(rb).hint}` : '';
         elMatrixNote.textContent = metric + sel;
       }
     }
 
+    // Click  toggle matrix filter (one delegated listener; cells are re-rendered when counts/selection change)
+    if (elMatrix) {
+      elMatrix.addEventListener('click', (e) => {
+        const cell = e.target.closest('.cell[data-sb]');
+        if (!cell || cell.classList.contains('zero')) return;
+        const sb = Number(cell.getAttribute('data-sb'));
+        const rb = Number(cell.getAttribute('data-rb'));
+        if (matrix.sb === sb && matrix.rb === rb) {
+          matrix = {...DEFAULT_MATRIX};
+        } else {
+          matrix = {sb, rb};
+        }
+        scheduleRefresh();
+        saveState();
+      });
+    }
+
 // ---- Market Context (passive; derived from current universe; no scoring influence) ----
 function parsePct(v) {
   if (v === null || v === undefined) return null;
@@ -2744,13 +3493,13 @@ function renderBreadth(rows) {
   function quantile(sorted, q) {
     if (!sorted.length) return null;
     const pos = (sorted.length - 1) * q;
-    const base = Math.floor(pos);
+    const base = pos | 0;  // pos >= 0, so truncation == floor
     const rest = pos - base;
     if (sorted[base + 1] === undefined) return sorted[base];
     return sorted[base] + rest * (sorted[base + 1] - sorted[base]);
   }
   function medIqr(values) {
-    const a = values.filter(Number.isFinite).slice().sort((x, y) => x - y);
+    const a = Float64Array.from(values.filter(Number.isFinite)).sort();
     if (!a.length) return { med: null, iqr: null };
     const q25 = quantile(a, 0.25);
     const q50 = quantile(a, 0.50);
@@ -2856,21 +3605,40 @@ function renderMovers(rows) {
     );
   }
 
-  const arr = [];
+  // Bounded top-k buffer kept sorted by `better`; ties keep the earlier row
+  // (same order as a stable sort + slice).
+  function keepTop(buf, k, x, better) {
+    if (buf.length === k) {
+      if (!better(x, buf[k - 1])) return;
+      buf.pop();
+    }
+    let i = buf.length;
+    buf.push(x);
+    while (i > 0 && better(x, buf[i - 1])) { buf[i] = buf[i - 1]; i--; }
+    buf[i] = x;
+  }
+
+  const higher = (a, b) => a.p > b.p;
+  const lower = (a, b) => a.p < b.p;
+  const up = [];
+  const dn = [];
+  let seen = 0;
   for (const r of rows || []) {
     const p = perfPct(r);
     if (p === null) continue;
-    arr.push({ r, p, y: perf1yPct(r) });
+    seen++;
+    if (p > 0) keepTop(up, 10, { r, p }, higher);
+    else if (p < 0) keepTop(dn, 10, { r, p }, lower);
   }
 
-  if (!arr.length) {
+  if (!seen) {
     elMoversUp.innerHTML = `<span class="muted"></span>`;
     elMoversDown.innerHTML = `<span class="muted"></span>`;
     return;
   }
 
-  const up = arr.slice().sort((a,b) => b.p - a.p).filter(x => x.p > 0).slice(0, 10);
-  const dn = arr.slice().sort((a,b) => a.p - b.p).filter(x => x.p < 0).slice(0, 10);
+  for (const x of up) x.y = perf1yPct(x.r);
+  for (const x of dn) x.y = perf1yPct(x.r);
 
   function segShort(r) {
     const full = normStr(clusterLabel(r)) || (asBool(r.is_crypto) === true ? 'Krypto' : '');
@@ -2899,9 +3667,8 @@ function renderMovers(rows) {
 
   function itemHtml(x) {
     const r = x.r;
-    const sym = pickDisplaySymbol(r);
-    const yh  = pickYahooSymbol(r) || sym;
-    const href = yahooHref(yh);
+    const sym = r._dispSym;
+    const href = r._yHref;
     const symHtml = href
       ? `<a class="yf" href="${href}" target="_blank" rel="noopener">${esc(sym)}</a>` 
       : esc(sym);
@@ -2931,21 +3698,20 @@ function renderMovers(rows) {
 
 function renderHeatmap(rows) {
   if (!elHeatmap) return;
-  const fn = (r) => heatConceptLabel(r, heatMode);
   const fixedCats = fixedHeatCategories(heatMode);
-  const scopedRows = (rows || []).filter(r => !!normStr(fn(r)));
 
-  // counts[cat][sb] -> number
+  // counts[cat][sb] -> number (Int32Array(5) per category)
   const m = new Map();
   if (Array.isArray(fixedCats)) {
-    for (const c of fixedCats) m.set(c, [0,0,0,0,0]);
+    for (const c of fixedCats) m.set(c, new Int32Array(5));
   }
-  for (const r of scopedRows) {
-    const cat = (fn(r) || '').toString().trim();
+  for (const r of (rows || [])) {
+    const cat = heatLabelOf(r, heatMode);
     if (!cat) continue;
-    const sb = scoreBucket(r.score);
-    if (!m.has(cat)) m.set(cat, [0,0,0,0,0]);
-    m.get(cat)[sb] += 1;
+    const sb = ROW_SCORE_BKT[r._i];
+    let arr = m.get(cat);
+    if (!arr) m.set(cat, arr = new Int32Array(5));
+    arr[sb]++;
   }
   if (!m.size) {
     elHeatmap.innerHTML = `<div class="muted">Keine Daten fÃ¼r Heatmap (keine Kategorie im aktuellen Universe).</div>`;
@@ -2955,7 +3721,10 @@ function renderHeatmap(rows) {
   // choose top categories
   let top = [];
   if (Array.isArray(fixedCats)) {
-    top = fixedCats.map(k => ({k, arr: (m.get(k) || [0,0,0,0,0]), tot: (m.get(k) || [0,0,0,0,0]).reduce((a,b)=>a+b,0)}));
+    top = fixedCats.map(k => {
+      const arr = m.get(k) || new Int32Array(5);
+      return {k, arr, tot: arr.reduce((a,b)=>a+b,0)};
+    });
   } else if (heatMode === 'pillar_all') {
     const allP = Array.from(m.entries()).map(([k, arr]) => ({k, arr, tot: arr.reduce((a,b)=>a+b,0)}));
     allP.sort((a,b) => {
@@ -2984,10 +3753,21 @@ function renderHeatmap(rows) {
     });
     top = allFin;
   } else {
-    const all = Array.from(m.entries()).map(([k, arr]) => ({k, arr, tot: arr.reduce((a,b)=>a+b,0)}));
-    all.sort((a,b) => b.tot - a.tot || a.k.localeCompare(b.k));
+    // Only the largest `limit` categories are shown: keep a small sorted buffer instead of
+    // sorting every category (order: count desc, then name).
     const limit = (heatMode === 'cluster') ? 8 : 12;
-    top = all.slice(0, limit);
+    const ahead = (a, b) => a.tot > b.tot || (a.tot === b.tot && a.k.localeCompare(b.k) < 0);
+    for (const [k, arr] of m) {
+      const x = {k, arr, tot: arr.reduce((a,b)=>a+b,0)};
+      if (top.length === limit) {
+        if (!ahead(x, top[limit - 1])) continue;
+        top.pop();
+      }
+      let i = top.length;
+      top.push(x);
+      while (i > 0 && ahead(x, top[i - 1])) { top[i] = top[i - 1]; i--; }
+      top[i] = x;
+    }
   }
 
   let vmax = 0;
@@ -2999,7 +3779,7 @@ function renderHeatmap(rows) {
   const rowsHtml = top.map(x => {
     const rowOn = heatFilter.mode === heatMode && heatFilter.cat === x.k;
 
-    const tds = x.arr.map((v, sb) => {
+    const tds = Array.from(x.arr, (v, sb) => {
       const zero = v === 0 ? ' zero' : '';
       const rel = vmax ? (v / vmax) : 0;
       const alpha = 0.06 + rel * 0.28; // subtle
@@ -3032,7 +3812,7 @@ function renderHeatmap(rows) {
         const parts = [];
         parts.push(`<div class="matrixLabel${rowOn ? ' active' : ''}" data-hcat="${esc(x.k)}" title="Filter: ${esc(x.k)}"><div class="lbl">${esc(x.k)}</div></div>`);
         for (let sb = 0; sb < 5; sb++) {
-          const v = x.arr[sb] || 0;
+          const v = x.arr[sb];
           const rel = vmax ? (v / vmax) : 0;
           const alpha = 0.06 + rel * 0.28;
           const bg = `background: hsla(205, 70%, 50%, ${alpha});`;
@@ -3047,265 +3827,457 @@ function renderHeatmap(rows) {
     <div class="muted small" style="margin-top:6px;">Zahl = Anzahl Werte pro ScoreBucket.</div>
   `;
 
-  elHeatmap.querySelectorAll('[data-hcat]').forEach(node => {
-    node.addEventListener('click', () => {
-      const cat = (node.getAttribute('data-hcat') || '').toString();
-      const sbAttr = node.getAttribute('data-sb');
-      const sb = (sbAttr === null || sbAttr === undefined) ? null : Number(sbAttr);
-      if (!cat) return;
+}
 
-      if (sb === null) {
-        if (heatFilter.mode === heatMode && heatFilter.cat === cat && heatFilter.sb === null) {
-          heatFilter = Object.assign({}, DEFAULT_HEAT_FILTER);
-        } else {
-          heatFilter = { cat, sb: null, mode: heatMode };
-        }
+// Heatmap row/cell clicks: one delegated listener instead of per-node handlers on every render.
+if (elHeatmap) {
+  elHeatmap.addEventListener('click', (e) => {
+    const node = e.target.closest('[data-hcat]');
+    if (!node) return;
+    const cat = (node.getAttribute('data-hcat') || '').toString();
+    const sbAttr = node.getAttribute('data-sb');
+    const sb = (sbAttr === null || sbAttr === undefined) ? null : Number(sbAttr);
+    if (!cat) return;
+
+    if (sb === null) {
+      if (heatFilter.mode === heatMode && heatFilter.cat === cat && heatFilter.sb === null) {
+        heatFilter = {...DEFAULT_HEAT_FILTER};
       } else {
-        if (heatFilter.mode === heatMode && heatFilter.cat === cat && heatFilter.sb === sb) {
-          heatFilter = Object.assign({}, DEFAULT_HEAT_FILTER);
-        } else {
-          heatFilter = { cat, sb, mode: heatMode };
-        }
+        heatFilter = { cat, sb: null, mode: heatMode };
       }
-      refresh();
-      saveState();
-    });
+    } else {
+      if (heatFilter.mode === heatMode && heatFilter.cat === cat && heatFilter.sb === sb) {
+        heatFilter = {...DEFAULT_HEAT_FILTER};
+      } else {
+        heatFilter = { cat, sb, mode: heatMode };
+      }
+    }
+    scheduleRefresh();
+    saveState();
   });
 }
 
+// Market-context panels are redrawn only when their inputs change: breadth/movers depend on the
+// row set alone, the heatmap also on its mode/filter, the history panel only on the static
+// HISTORY_DELTA payload. Matrix clicks, user sorting etc. leave the row set (not the array) equal.
+let _ctxRows = null;
+let _ctxHeatKey = '';
+let _ctxHistoryDone = false;
+function resetMarketContext() {
+  _ctxRows = null;
+  _ctxHeatKey = '';
+  _ctxHistoryDone = false;
+}
+function sameRows(a, b) {
+  if (a === b) return true;
+  if (!a || !b || a.length !== b.length) return false;
+  for (let i = 0; i < a.length; i++) if (a[i] !== b[i]) return false;
+  return true;
+}
 function renderMarketContext(rows) {
   if (!elMarketPanel) return;
-  renderBreadth(rows);
-  renderMovers(rows);
-  renderHeatmap(rows);
-  renderHistoryDeltaPanel(rows);
+  const same = sameRows(rows, _ctxRows);
+  _ctxRows = rows;
+  if (!same) {
+    renderBreadth(rows);
+    renderMovers(rows);
+  }
+  const heatKey = JSON.stringify([heatMode, heatFilter]);
+  if (!same || heatKey !== _ctxHeatKey) {
+    _ctxHeatKey = heatKey;
+    renderHeatmap(rows);
+  }
+  if (!_ctxHistoryDone) {
+    _ctxHistoryDone = true;
+    renderHistoryDeltaPanel(rows);
+  }
 }
 
-function applyHeatFilter(rows) {
-  if (!heatFilter || !heatFilter.cat) return rows;
-  return (rows || []).filter(r => {
-    const mode = (heatFilter.mode === 'pillar_base') ? 'tech_focus' : (heatFilter.mode || heatMode);
-    const label = heatConceptLabel(r, mode);
-    if (label !== heatFilter.cat) return false;
-    if (heatFilter.sb === null || heatFilter.sb === undefined) return true;
-    return scoreBucket(r.score) === Number(heatFilter.sb);
-  });
+function heatPred() {
+  if (!heatFilter || !heatFilter.cat) return null;
+  const mode = (heatFilter.mode === 'pillar_base') ? 'tech_focus' : (heatFilter.mode || heatMode);
+  const cat = heatFilter.cat;
+  const sb = (heatFilter.sb === null || heatFilter.sb === undefined) ? null : Number(heatFilter.sb);
+  return (r) => {
+    if (heatLabelOf(r, mode) !== cat) return false;
+    return sb === null || ROW_SCORE_BKT[r._i] === sb;
+  };
 }
 
 
-    function render(rows) {
-      tbody.innerHTML = '';
+    // ---- virtualized results table ----
+    // Only rows inside the .table-wrap viewport (+ overscan) are in the DOM; two spacer rows
+    // stand in for the rest, so render/scroll cost is O(viewport) instead of O(rows).
+    const tableWrap = document.querySelector('.table-wrap');
+    const VROW_OVERSCAN = 12;
+    let rowNodes = new WeakMap();    // row object -> built <tr>, reused when scrolling back
+    const rowOfNode = new WeakMap(); // built <tr> -> row object (delegated row clicks)
+    let vRows = [];
+    let vRowH = 0;                   // measured once from the first real row
+    let vStart = -1;
+    let vEnd = -1;
+    let vScrollRaf = 0;
+
+    // The two spacer rows are created once and only resized per window.
+    function spacerRow() {
+      const tr = document.createElement('tr');
+      tr.className = 'vspacer';
+      tr.setAttribute('aria-hidden', 'true');
+      tr.innerHTML = '<td colspan="11"></td>';
+      return tr;
+    }
+    const vSpacerTop = spacerRow();
+    const vSpacerBottom = spacerRow();
+
+    // Rows not built yet are rendered to one HTML string and parsed in a single innerHTML pass
+    // (one parser run per window instead of one per row); the parsed <tr>s are then cached.
+    const rowParser = document.createElement('tbody');
+    function buildRows(list) {
+      rowParser.innerHTML = list.map(rowHtml).join('');
+      const trs = Array.from(rowParser.children);
+      for (let j = 0; j < trs.length; j++) {
+        rowNodes.set(list[j], trs[j]);
+        rowOfNode.set(trs[j], list[j]);
+      }
+    }
+
+    function rowNode(r) {
+      if (!rowNodes.has(r)) buildRows([r]);
+      return rowNodes.get(r);
+    }
+
+    function renderWindow(force) {
+      const n = vRows.length;
+      if (!vRowH && n) {
+        // Measure one real row; stays 0 while the table is hidden and is retried next render.
+        const probe = rowNode(vRows[0]);
+        tbody.replaceChildren(probe);
+        vRowH = probe.getBoundingClientRect().height;
+      }
+      const h = vRowH || 44;
+      const top = tableWrap ? tableWrap.scrollTop : 0;
+      // The wrap only grows to its max-height once filled, so never size the window below the viewport.
+      const viewH = Math.max(tableWrap ? tableWrap.clientHeight : 0, window.innerHeight);
+      const end = Math.min(n, Math.ceil((top + viewH) / h) + VROW_OVERSCAN);
+      const start = Math.min(end, Math.max(0, Math.floor(top / h) - VROW_OVERSCAN));
+      if (!force && start === vStart && end === vEnd) return;
+      vStart = start;
+      vEnd = end;
+
+      const missing = [];
+      for (let i = start; i < end; i++) if (!rowNodes.has(vRows[i])) missing.push(vRows[i]);
+      if (missing.length) buildRows(missing);
+
       const frag = document.createDocumentFragment();
+      if (start > 0) {
+        vSpacerTop.style.height = `${start * h}px`;
+        frag.appendChild(vSpacerTop);
+      }
+      for (let i = start; i < end; i++) frag.appendChild(rowNode(vRows[i]));
+      if (end < n) {
+        vSpacerBottom.style.height = `${(n - end) * h}px`;
+        frag.appendChild(vSpacerBottom);
+      }
+      tbody.replaceChildren(frag);
+    }
 
-      for (const r of rows) {
-        const tr = document.createElement('tr');
-
-        const tRaw = normStr(r.ticker);
-        const isC = asBool(r.is_crypto) === true;
-
-        const disp = pickDisplaySymbol(r);
-        const yh = pickYahooSymbol(r) || disp;
-        const href = yahooHref(yh);
-
-        const isinRaw = normStr(r.isin);
-        const isin = (!isC) ? (isinRaw || (looksLikeISIN(tRaw) ? tRaw : '')) : '';
-
-        const curr = normStr(r.quote_currency) || normStr(r.currency) || normStr(r["WÃ¤hrung"]);
-        const currChip = curr ? `<span class="tinychip" title="WÃ¤hrung">${esc(curr)}</span>` : '';
-
-        const main = href ? `<a class="yf" href="${href}" target="_blank" rel="noopener">${esc(disp)}</a>` : esc(disp);
-        // subline for the left "Symbol/ISIN" cell: for crypto show the Yahoo pair (e.g. BTC-USD),
-        // for stocks show ISIN. Use a distinct variable name so we don't collide with other "sub" vars.
-        const subTicker = isC ? (yh || '') : (isin || '');
-        const subLabel = isC ? 'YahooSymbol' : 'ISIN';
-        const subLine = `<div class="sub mono" title="${subLabel}">${esc(subTicker)}</div>`;
-        const tCell = `<div class="tickerCell"><div class="tickerMain">${main}${currChip}</div>${subLine}</div>`;
-
-        const n = normStr(r.name);
-
-        // Official taxonomy (prefer industry, fallback sector). Manual fantasy sectors are not shown here.
-        const sectorOfficial = normStr(r.sector) || normStr(r.Sector);
-        const industryOfficial = normStr(r.industry) || normStr(r.Industry) || normStr(r.cluster_official);
-
-        // Private pillars (5-sÃ¤ulen + playground) are metadata only (never affect scoring)
-        // Use UI fallback derivation so older universes still show the concept.
-        const pillar = pillarLabel(r);
-        const bucketType = normStr(r.bucket_type);
-
-        let taxLabel = '';
-        let taxTitle = '';
-        if (asBool(r.is_crypto)) {
-          taxLabel = 'Krypto';
-          taxTitle = 'Assetklasse (Krypto)';
-        } else if (industryOfficial) {
-          taxLabel = industryOfficial;
-          taxTitle = 'Industrie (offiziell, Yahoo)';
-        } else if (sectorOfficial) {
-          taxLabel = sectorOfficial;
-          taxTitle = 'Sektor (offiziell, Yahoo)';
-        }
+    function scheduleWindow() {
+      if (vScrollRaf) return;
+      vScrollRaf = requestAnimationFrame(() => { vScrollRaf = 0; renderWindow(false); });
+    }
+    if (tableWrap) tableWrap.addEventListener('scroll', scheduleWindow, { passive: true });
+    window.addEventListener('resize', scheduleWindow, { passive: true });
+
+    // Row clicks open the drawer; the Yahoo link keeps its own navigation.
+    tbody.addEventListener('click', (e) => {
+      if (e.target.closest('a.yf')) return;
+      const tr = e.target.closest('tr');
+      const r = tr ? rowOfNode.get(tr) : undefined;
+      if (r) openDrawer(r);
+    });
 
-        const ctry = normStr(r.country);
-        const subParts = [];
-        if (taxLabel) subParts.push(`<span title="${esc(taxTitle)}">${esc(taxLabel)}</span>`);
-        if (pillar) subParts.push(`<span class="muted" title="SÃ¤ule (privat, Metadaten)">SÃ¤ule: ${esc(pillar)}</span>`);
-        if (bucketType && bucketType !== 'pillar' && bucketType !== 'none') subParts.push(`<span class="muted" title="Bucket-Type (privat)">(${esc(bucketType)})</span>`);
-        if (ctry) subParts.push(esc(ctry));
-        const subName = subParts.join(' Â· ');
-
-        const price = asNum(r.price) ?? asNum(r["Akt. Kurs"]);
-        const perf = perfPct(r);
-        const priceMain = (price === null) ? '' : `${fmtPrice(price)}${curr ? ' ' + esc(curr) : ''}`;
-        const pCell = `<div class="priceCell"><div class="priceMain">${priceMain}</div>${perfLine(perf)}</div>`;
-
-        const trend = asBool(r.trend_ok) ? chip('OK', 'good') : chip('NO', 'bad');
-        const liq = asBool(r.liquidity_ok) ? chip('OK', 'good') : chip('LOW', 'warn');
-
-        const status = normStr(r.score_status);
-        let statusKind = 'blue';
-        if (status === 'OK') statusKind = 'good';
-        if (status.startsWith('AVOID')) statusKind = 'warn';
-        if (status === 'ERROR' || status === 'NA') statusKind = 'bad';
-
-        const cls = asBool(r.is_crypto) ? chip('Krypto', 'warn') : chip('Aktie', 'blue');
-
-        tr.innerHTML = `
-          <td class="mono">${tCell}</td>
-          <td>
-            <div class="row-title">
-              <div class="name">${n}</div>
-              <div class="sub">${subName || ''}</div>
-            </div>
-          </td>
-          <td class="right">${pCell}</td>
-          <td>${scoreCell(r)}</td>
-          <td class="hide-sm right mono">${dScoreCell(r)}</td>
-          <td class="hide-sm right mono">${(asNum(r.confidence) ?? 0).toFixed(1)}</td>
-          <td class="hide-sm right mono">${(cyclePct(r) ?? 0).toFixed(0)}%</td>
-          <td>${trend}</td>
-          <td>${liq}</td>
-          <td>${chip(status || '', statusKind)}</td>
-          <td class="hide-sm">${cls}</td>
-        `;
+    function render(rows) {
+      vRows = rows || [];
+      renderWindow(true);
+    }
 
-        const a = tr.querySelector('a.yf');
-        if (a) {
-          a.addEventListener('click', (e) => { e.stopPropagation(); });
-        }
+    // Fixed per-row chips, built once instead of per row. Body cells carry no title tooltips
+    // (the column headers explain them); only the signal badge keeps one.
+    const ROW_CHIP = {
+      ok: chip('OK', 'good'),
+      no: chip('NO', 'bad'),
+      low: chip('LOW', 'warn'),
+      crypto: chip('Krypto', 'warn'),
+      stock: chip('Aktie', 'blue'),
+    };
+
+    function rowHtml(r) {
+      const tRaw = normStr(r.ticker);
+      const isC = asBool(r.is_crypto) === true;
+
+      const disp = r._dispSym;
+      const yh = r._ySym || disp;
+      const href = r._yHref;
+
+      const isinRaw = normStr(r.isin);
+      const isin = (!isC) ? (isinRaw || (looksLikeISIN(tRaw) ? tRaw : '')) : '';
+
+      const curr = normStr(r.quote_currency) || normStr(r.currency) || normStr(r["WÃ¤hrung"]);
+      const currChip = curr ? `<span class="tinychip">${esc(curr)}</span>` : '';
+
+      const main = href ? `<a class="yf" href="${href}" target="_blank" rel="noopener">${esc(disp)}</a>` : esc(disp);
+      // subline for the left "Symbol/ISIN" cell: for crypto show the Yahoo pair (e.g. BTC-USD),
+      // for stocks show ISIN. Use a distinct variable name so we don't collide with other "sub" vars.
+      const subTicker = isC ? (yh || '') : (isin || '');
+      const subLine = `<div class="sub mono">${esc(subTicker)}</div>`;
+      const tCell = `<div class="tickerCell"><div class="tickerMain">${main}${currChip}</div>${subLine}</div>`;
+
+      const n = normStr(r.name);
+
+      // Official taxonomy (prefer industry, fallback sector). Manual fantasy sectors are not shown here.
+      const sectorOfficial = normStr(r.sector) || normStr(r.Sector);
+      const industryOfficial = normStr(r.industry) || normStr(r.Industry) || normStr(r.cluster_official);
 
-        tr.style.cursor = 'pointer';
-        tr.addEventListener('click', () => openDrawer(r));
+      // Private pillars (5-sÃ¤ulen + playground) are metadata only (never affect scoring)
+      // Use UI fallback derivation so older universes still show the concept.
+      const pillar = pillarLabel(r);
+      const bucketType = normStr(r.bucket_type);
 
-        frag.appendChild(tr);
+      let taxLabel = '';
+      if (isC) {
+        taxLabel = 'Krypto';
+      } else if (industryOfficial) {
+        taxLabel = industryOfficial;
+      } else if (sectorOfficial) {
+        taxLabel = sectorOfficial;
       }
 
-      tbody.appendChild(frag);
+      const ctry = normStr(r.country);
+      const subParts = [];
+      if (taxLabel) subParts.push(`<span>${esc(taxLabel)}</span>`);
+      if (pillar) subParts.push(`<span class="muted">SÃ¤ule: ${esc(pillar)}</span>`);
+      if (bucketType && bucketType !== 'pillar' && bucketType !== 'none') subParts.push(`<span class="muted">(${esc(bucketType)})</span>`);
+      if (ctry) subParts.push(esc(ctry));
+      const subName = subParts.join(' Â· ');
+
+      const price = asNum(r.price) ?? asNum(r["Akt. Kurs"]);
+      const perf = perfPct(r);
+      const priceMain = (price === null) ? '' : `${fmtPrice(price)}${curr ? ' ' + esc(curr) : ''}`;
+      const pCell = `<div class="priceCell"><div class="priceMain">${priceMain}</div>${perfLine(perf)}</div>`;
+
+      const trend = asBool(r.trend_ok) ? ROW_CHIP.ok : ROW_CHIP.no;
+      const liq = asBool(r.liquidity_ok) ? ROW_CHIP.ok : ROW_CHIP.low;
+
+      const status = normStr(r.score_status);
+      const st = ROW_STATUS[r._i];
+      let statusKind = 'blue';
+      if (st === ST_OK) statusKind = 'good';
+      else if (ROW_FLAGS[r._i] & F_AVOID_ANY) statusKind = 'warn';
+      else if (st === ST_ERROR || st === ST_NA) statusKind = 'bad';
+
+      const cls = isC ? ROW_CHIP.crypto : ROW_CHIP.stock;
+
+      return `<tr>
+        <td class="mono">${tCell}</td>
+        <td>
+          <div class="row-title">
+            <div class="name">${n}</div>
+            <div class="sub">${subName || ''}</div>
+          </div>
+        </td>
+        <td class="right">${pCell}</td>
+        <td>${scoreCell(r)}</td>
+        <td class="hide-sm right mono">${dScoreCell(r)}</td>
+        <td class="hide-sm right mono">${(asNum(r.confidence) ?? 0).toFixed(1)}</td>
+        <td class="hide-sm right mono">${fmtInt(cyclePct(r) ?? 0)}%</td>
+        <td>${trend}</td>
+        <td>${liq}</td>
+        <td>${chip(status || '', statusKind)}</td>
+        <td class="hide-sm">${cls}</td>
+      </tr>`;
+    }
+
+    function mountDrawer() {
+      if (drawerOverlay) return;
+      const tpl = document.getElementById('drawerTpl');
+      if (tpl) tpl.replaceWith(tpl.content.cloneNode(true));
+      drawerOverlay = document.getElementById('drawerOverlay');
+      drawerClose = document.getElementById('drawerClose');
+      drawerTitle = document.getElementById('drawerTitle');
+      drawerSub = document.getElementById('drawerSub');
+      drawerBody = document.getElementById('drawerBody');
+      drawerActions = document.getElementById('drawerActions');
+      drawerClose.addEventListener('click', closeDrawer);
+      drawerOverlay.addEventListener('click', (e) => {
+        if (e.target === drawerOverlay) closeDrawer();
+      });
     }
 
     function closeDrawer() {
+      if (!drawerOverlay) return;
       drawerOverlay.classList.remove('show');
       drawerOverlay.setAttribute('aria-hidden', 'true');
       document.body.style.overflow = '';
     }
 
+    // Drawer content depends only on the row, so it is built once per row and reused on re-open.
+    let _drawerCache = new WeakMap();
     function openDrawer(r) {
+      mountDrawer();
+      let c = _drawerCache.get(r);
+      if (!c) _drawerCache.set(r, c = drawerContent(r));
+      drawerTitle.textContent = c.title;
+      drawerSub.textContent = c.sub;
+      if (drawerActions) drawerActions.innerHTML = c.actions;
+      drawerBody.innerHTML = c.body;
+
+      drawerOverlay.classList.add('show');
+      drawerOverlay.setAttribute('aria-hidden', 'false');
+      document.body.style.overflow = 'hidden';
+    }
+
+    // Optional drawer fields in display order: [label, row field]; null = the resolved currency.
+    const _DRAWER_OPT = [
+      ['Price', 'price'],
+      ['Currency', null],
+      ['Perf %', 'perf_pct'],
+      ['RS3M', 'rs3m'],
+      ['CRV', 'crv'],
+      ['MC Chance', 'mc_chance'],
+      ['Elliott', 'elliott_signal'],
+      ['CycleStatus', 'cycle_status'],
+      ['DollarVolume', 'dollar_volume'],
+      ['Volatility', 'volatility'],
+      ['MaxDrawdown', 'max_drawdown'],
+      ['MarketDate', 'market_date'],
+    ];
+
+    function drawerContent(r) {
       const t = pickDisplayTicker(r) || normStr(r.ticker);
       const n = normStr(r.name);
-      drawerTitle.textContent = `${t}  ${n}`.trim();
+      const title = `${t}  ${n}`.trim();
       const sectorOfficial = normStr(r.sector) || normStr(r.Sector);
       const categoryManual = normStr(r.category) || normStr(r.Sektor) || normStr(r.Kategorie);
       const cat = asBool(r.is_crypto) ? 'Krypto' : (categoryManual ? `Cluster: ${categoryManual}` : (sectorOfficial || ''));
       const curr = normStr(r.quote_currency) || normStr(r.currency) || normStr(r["WÃ¤hrung"]);
       const sub = [cat, normStr(r.country), curr, normStr(r.isin)].filter(Boolean).join(' Â· ');
-      drawerSub.textContent = sub || '';
 
       // Quick action: open on Yahoo Finance if we can determine a valid symbol
-      if (drawerActions) {
-        const sym = pickYahooSymbol(r);
-        const href = yahooHref(sym);
-        drawerActions.innerHTML = href ? `<a class="btn" href="${href}" target="_blank" rel="noopener" title="Auf Yahoo Finance Ã¶ffnen">Yahoo</a>` : '';
-      }
-
-      const items = [
-        ['Score', (asNum(r.score) ?? 0).toFixed(2)],
-        ['Confidence', (asNum(r.confidence) ?? 0).toFixed(1)],
-        ['Cycle', `${(cyclePct(r) ?? 0).toFixed(0)}%`],
-        ['ScoreStatus', normStr(r.score_status) || ''],
-        ['Trend OK', String(asBool(r.trend_ok))],
-        ['Liquidity OK', String(asBool(r.liquidity_ok))],
-        ['AssetClass', asBool(r.is_crypto) ? 'Krypto' : 'Aktie'],
-      ];
+      const href = r._ySym ? r._yHref : '';
+      const actions = href ? `<a class="btn" href="${href}" target="_blank" rel="noopener" title="Auf Yahoo Finance Ã¶ffnen">Yahoo</a>` : '';
+
+      let kv = '';
+      const kvAdd = (k, v) => { kv += `<div class="k">${esc(k)}</div><div class="v">${esc(v)}</div>`; };
+      kvAdd('Score', (asNum(r.score) ?? 0).toFixed(2));
+      kvAdd('Confidence', (asNum(r.confidence) ?? 0).toFixed(1));
+      kvAdd('Cycle', `${fmtInt(cyclePct(r) ?? 0)}%`);
+      kvAdd('ScoreStatus', normStr(r.score_status) || '');
+      kvAdd('Trend OK', String(asBool(r.trend_ok)));
+      kvAdd('Liquidity OK', String(asBool(r.liquidity_ok)));
+      kvAdd('AssetClass', asBool(r.is_crypto) ? 'Krypto' : 'Aktie');
 
       // optional interesting fields
-      const opt = [
-        ['Price', r.price],
-        ['Currency', curr],
-        ['Perf %', r.perf_pct],
-        ['RS3M', r.rs3m],
-        ['CRV', r.crv],
-        ['MC Chance', r.mc_chance],
-        ['Elliott', r.elliott_signal],
-        ['CycleStatus', r.cycle_status],
-        ['DollarVolume', r.dollar_volume],
-        ['Volatility', r.volatility],
-        ['MaxDrawdown', r.max_drawdown],
-        ['MarketDate', r.market_date],
-      ];
-      for (const [k, v] of opt) {
-        const s = normStr(v);
-        if (s) items.push([k, s]);
+      for (const [k, field] of _DRAWER_OPT) {
+        const s = (field === null) ? curr : normStr(r[field]);
+        if (s) kvAdd(k, s);
       }
 
       const status = normStr(r.score_status);
-      const why = [];
-      if (status === 'OK') why.push('Score>0 & keine harten Filter verletzt.');
-      if (status === 'AVOID_CRYPTO_BEAR') why.push('Crypto im Bear-Trend  Score=0 (bewusstes Avoid).');
-      if (status === 'AVOID') why.push('Score==0  Avoid (non-crypto).');
-      if (status === 'NA') why.push('Zu wenig / nicht konsistente Daten  NA.');
-      if (status === 'ERROR') why.push('Scoring hat einen Fehler gemeldet (ScoreError).');
-      if (asBool(r.trend_ok) === false) why.push('Trend-Filter: trend_ok=false.');
-      if (asBool(r.liquidity_ok) === false) why.push('Liquidity-Filter: liquidity_ok=false.');
-      if (why.length === 0) why.push('Noch kein detaillierter Factor-Breakdown (kommt in Phase B3).');
-
-      drawerBody.innerHTML = `
+      let why = '';
+      const whyAdd = (x) => { why += `<li>${esc(x)}</li>`; };
+      if (status === 'OK') whyAdd('Score>0 & keine harten Filter verletzt.');
+      if (status === 'AVOID_CRYPTO_BEAR') whyAdd('Crypto im Bear-Trend  Score=0 (bewusstes Avoid).');
+      if (status === 'AVOID') whyAdd('Score==0  Avoid (non-crypto).');
+      if (status === 'NA') whyAdd('Zu wenig / nicht konsistente Daten  NA.');
+      if (status === 'ERROR') whyAdd('Scoring hat einen Fehler gemeldet (ScoreError).');
+      if (asBool(r.trend_ok) === false) whyAdd('Trend-Filter: trend_ok=false.');
+      if (asBool(r.liquidity_ok) === false) whyAdd('Liquidity-Filter: liquidity_ok=false.');
+      if (!why) whyAdd('Noch kein detaillierter Factor-Breakdown (kommt in Phase B3).');
+
+      const body = `
         <div class="kv">
-          ${items.map(([k,v]) => `<div class="k">${esc(k)}</div><div class="v">${esc(v)}</div>`).join('')}
+          ${kv}
         </div>
         <div class="why">
           <div style="font-weight:700; margin-top: 12px;">Why Score</div>
           <ul>
-            ${why.map(x => `<li>${esc(x)}</li>`).join('')}
+            ${why}
           </ul>
         </div>
       `;
 
-      drawerOverlay.classList.add('show');
-      drawerOverlay.setAttribute('aria-hidden', 'false');
-      document.body.style.overflow = 'hidden';
+      return {title, sub: sub || '', actions, body};
+    }
+
+    // UI events route through scheduleRefresh(): bursts of clicks/keystrokes coalesce into
+    // at most one full filter/sort/render pass per animation frame.
+    let _refreshRaf = 0;
+    function scheduleRefresh() {
+      if (_refreshRaf) return;
+      _refreshRaf = requestAnimationFrame(() => { _refreshRaf = 0; refresh(); });
+    }
+
+    // Everything the rows pipeline reads. A refresh whose inputs match the last completed pass
+    // (e.g. Escape on an empty search, a filter toggled twice within one frame) is skipped;
+    // invalidateRefresh() forces the next pass (and rebuilds cached rows) when row data changed.
+    let _lastFilterKey = '';
+    function _filterKey() {
+      return JSON.stringify([
+        activePreset, elSearch.value, uiState.quick, matrix, userSort,
+        Array.from(uiState.selClusters), Array.from(uiState.selPillars), heatMode, heatFilter,
+      ]);
+    }
+    function invalidateRefresh() {
+      _lastFilterKey = '';
+      _presetMemo = null;
+      _searchMemo = null;
+      resetMarketContext();
+      rowNodes = new WeakMap();
+      _drawerCache = new WeakMap();
+      _facetSigs = {};
+    }
+
+    // Typing only changes the search box: reuse the preset pass (filter + sort over all of DATA)
+    // while the preset is unchanged, and when the new query extends the previous one (every old
+    // token is still a substring of a new token) search only within the previous matches.
+    let _presetMemo = null;
+    let _searchMemo = null;
+    function presetRows(name) {
+      if (!_presetMemo || _presetMemo.name !== name) _presetMemo = {name, ...applyPreset(DATA, name)};
+      return _presetMemo;
+    }
+    function searchRows(rows, q) {
+      q = (q || '').trim().toLowerCase();
+      const m = _searchMemo;
+      const from = (m && m.src === rows && m.q && q.startsWith(m.q)) ? m.rows : rows;
+      const out = applySearch(from, q);
+      _searchMemo = {src: rows, q, rows: out};
+      return out;
     }
 
     function refresh() {
+      const key = _filterKey();
+      if (key === _lastFilterKey) return;
+      _lastFilterKey = key;
       const base = DATA;
-      const {rows: presetRows, preset} = applyPreset(base, activePreset);
+      const {rows: pRows, preset} = presetRows(activePreset);
 
-      const q = elSearch.value;
-      let rowsSQ = applySearch(presetRows, q);
+      let rowsSQ = searchRows(pRows, elSearch.value);
       rowsSQ = applyQuickFilters(rowsSQ);
 
-      // cluster counts reflect the current universe (after Preset+Search+Quick)
-      const cc = computeClusterCounts(rowsSQ);
+      // cluster + pillar (5-sÃ¤ulen + playground) counts reflect the current universe
+      // (after Preset+Search+Quick); both come from one pass over the rows.
+      const facets = computeFacetCounts(rowsSQ);
+      const cc = facets.cluster;
       renderClusterOptions(cc);
       renderClusterChips(cc);
 
-      // pillar counts (5-sÃ¤ulen + playground) reflect the same universe
-      const pc = computePillarCounts(rowsSQ);
+      const pc = facets.pillar;
       renderPillarOptions(pc);
       renderPillarChips(pc);
 
       // cluster + pillar filters (string)
-      let rows = applyClusterFilter(rowsSQ);
-      rows = applyPillarFilter(rows);
-      rows = attachDScore(rows);
+      let rows = filterRows(rowsSQ, [clusterPred(), pillarPred()]);
 
       // matrix counts always reflect the current (pre-matrix) universe (after cluster filter)
       renderMatrix(rows);
@@ -3313,14 +4285,12 @@ function applyHeatFilter(rows) {
       renderMacroChain();
       renderSegmentMonitor(rows);
 
-      rows = applyHeatFilter(rows);
-
-      // matrix filter (if active)
-      rows = applyMatrixFilter(rows);
+      // heat + matrix filters (if active), fused into one pass
+      rows = filterRows(rows, [heatPred(), matrixPred()]);
 
       // user override sort
       if (userSort && userSort.k) {
-        rows = rows.slice().sort(compareBy([userSort]));
+        rows = sortRows(rows, [userSort]);
       }
 
       render(rows);
@@ -3416,24 +4386,18 @@ function applyHeatFilter(rows) {
         if (type === 'pillar') {
           toggleSet(uiState.selPillars, val);
           syncSelectionArrays();
-          const base = DATA;
-          const {rows: presetRows} = applyPreset(base, activePreset);
-          const q = elSearch.value;
-          let rowsSQ = applySearch(presetRows, q);
+          let rowsSQ = searchRows(presetRows(activePreset).rows, elSearch.value);
           rowsSQ = applyQuickFilters(rowsSQ);
           renderPillarChips(computePillarCounts(rowsSQ));
         } else if (type === 'cluster') {
           toggleSet(uiState.selClusters, val);
           syncSelectionArrays();
-          const base = DATA;
-          const {rows: presetRows} = applyPreset(base, activePreset);
-          const q = elSearch.value;
-          let rowsSQ = applySearch(presetRows, q);
+          let rowsSQ = searchRows(presetRows(activePreset).rows, elSearch.value);
           rowsSQ = applyQuickFilters(rowsSQ);
           renderClusterChips(computeClusterCounts(rowsSQ));
         }
         
-        refresh();
+        scheduleRefresh();
         return;
       }
 
@@ -3451,8 +4415,8 @@ function applyHeatFilter(rows) {
       }
 
       if (e.target.closest('#heatmapClear')) {
-        heatFilter = Object.assign({}, DEFAULT_HEAT_FILTER);
-        refresh();
+        heatFilter = {...DEFAULT_HEAT_FILTER};
+        scheduleRefresh();
         saveState();
         return;
       }
@@ -3471,7 +4435,7 @@ function applyHeatFilter(rows) {
             resetAll();
           } else if (key === 'resetSort') {
             userSort = null;
-            refresh();
+            scheduleRefresh();
             saveState();
           } else if (key === 'onlyCrypto') {
             uiState.quick.onlyCrypto = !uiState.quick.onlyCrypto;
@@ -3484,7 +4448,7 @@ function applyHeatFilter(rows) {
           }
           
           syncFilterButtons();
-          refresh();
+          scheduleRefresh();
           saveState();
         } else if (action === 'togglePanel' && target) {
           if (target === 'market') {
@@ -3497,7 +4461,7 @@ function applyHeatFilter(rows) {
           }
         } else if (action === 'resetSort') {
           userSort = null;
-          refresh();
+          scheduleRefresh();
           saveState();
         } else if (action === 'resetAll') {
           resetAll();
@@ -3514,7 +4478,7 @@ function applyHeatFilter(rows) {
         uiState.selClusters.clear();
         if (v) uiState.selClusters.add(v);
         syncSelectionArrays();
-        refresh();
+        scheduleRefresh();
         saveState();
       });
     }
@@ -3526,7 +4490,7 @@ function applyHeatFilter(rows) {
         uiState.selPillars.clear();
         if (v) uiState.selPillars.add(v);
         syncSelectionArrays();
-        refresh();
+        scheduleRefresh();
         saveState();
       });
     }
@@ -3556,15 +4520,22 @@ function applyHeatFilter(rows) {
       // Get content from button
       const title = button.getAttribute('data-help-title') || 'Hilfe';
       const html = button.getAttribute('data-help-html') || button.getAttribute('data-help') || '';
-      // Set content
-      helpPopTitle.textContent = title;
-      helpPopBody.innerHTML = html;
 
-      // Position popover relative to button
+      // Read the anchor rect before touching the DOM so it comes from the already-clean layout.
       const rect = button.getBoundingClientRect();
       const popoverWidth = 360; // max-width from CSS
       const viewportWidth = window.innerWidth;
       const viewportHeight = window.innerHeight;
+
+      // Set content
+      helpPopTitle.textContent = title;
+      helpPopBody.innerHTML = html;
+
+      // A hidden popover (display:none) has no height, so only measure when switching between
+      // open popovers; opening from closed therefore never forces a synchronous reflow.
+      const shownHeight = helpPop.classList.contains('show') ? helpPop.offsetHeight : 0;
+
+      // Position popover relative to button
       // Work in viewport coordinates first, then convert once to page coordinates.
       let left = rect.right + 8;
       let top = rect.bottom + 8;
@@ -3574,7 +4545,7 @@ function applyHeatFilter(rows) {
       }
       if (left < 12) left = 12;
 
-      const estimatedHeight = Math.min(260, Math.max(140, helpPop.offsetHeight || 200));
+      const estimatedHeight = Math.min(260, Math.max(140, shownHeight || 200));
       if (top + estimatedHeight > viewportHeight - 12) {
         top = rect.top - estimatedHeight - 8;
       }
@@ -3616,29 +4587,16 @@ function applyHeatFilter(rows) {
     });
 
     // ESC key closes popover
-    document.addEventListener('keydown', (e) => {
-      if (e.key === 'Escape') {
-        closeHelp();
-      }
-    });
-
-    // Close popover on scroll/resize (optional UX)
-    let activeAnchor = null;
-    const observer = new MutationObserver((mutations) => {
-      mutations.forEach((mutation) => {
-        mutation.removedNodes.forEach((node) => {
-          if (activeAnchor && (node === activeAnchor || node.contains && node.contains(activeAnchor))) {
-            activeAnchor = null;
-            closeHelp();
-          }
-        });
-      });
-    });
-    observer.observe(document.body, { childList: true, subtree: true });
+    // Escape is handled by the single global keydown listener below (help first, then drawer/search).
 
-    // Close on resize/scroll
-    window.addEventListener('resize', closeHelp);
-    window.addEventListener('scroll', closeHelp, true);
+    // Close on resize/scroll (capture: also catches the table's own scroll container). Passive,
+    // and a no-op unless the popover is open, so scrolling never waits on this handler.
+    function closeHelpIfOpen() {
+      const { pop } = getHelpEls();
+      if (pop && pop.classList.contains('show')) closeHelp();
+    }
+    window.addEventListener('resize', closeHelpIfOpen, { passive: true });
+    window.addEventListener('scroll', closeHelpIfOpen, { capture: true, passive: true });
 
     if (elBriefing) {
       const hasTop = Array.isArray(briefing.top) && briefing.top.length > 0;
@@ -3855,9 +4813,8 @@ function applyHeatFilter(rows) {
           const rd = asNum(rec.rank_delta  ?? rec.rankDelta  ?? rec.dr    ?? rec.rank_change);
           if (sd === null && rd === null) return null;
 
-          const sym = row ? pickDisplaySymbol(row) : normStr(rec.symbol || rec.name || '');
-          const yh  = row ? (pickYahooSymbol(row) || sym) : normStr(rec.symbol || '');
-          const href = yahooHref(yh);
+          const sym = row ? row._dispSym : normStr(rec.symbol || rec.name || '');
+          const href = row ? row._yHref : yahooHref(normStr(rec.symbol || ''));
 
           const segFull = row
             ? (normStr(clusterLabel(row)) || (asBool(row.is_crypto) === true ? 'Krypto' : ''))
@@ -4178,28 +5135,23 @@ function applyHeatFilter(rows) {
       elReality.innerHTML = renderReality(REALITY_CHECK);
     }
 
-    refresh();
+    refresh();  // initial load stays synchronous
     try { document.documentElement.dataset.jsok = '1'; } catch (e) {}
 
-    drawerClose.addEventListener('click', closeDrawer);
-    drawerOverlay.addEventListener('click', (e) => {
-      if (e.target === drawerOverlay) closeDrawer();
-    });
-
     elPreset.addEventListener('change', () => {
       activePreset = elPreset.value;
       userSort = null;
-      refresh();
+      scheduleRefresh();
       saveState();
     });
 
-    let _searchTimer = null;
+    let _searchTimer = 0;
     elSearch.addEventListener('input', () => {
-      if (_searchTimer) clearTimeout(_searchTimer);
+      clearTimeout(_searchTimer);
       _searchTimer = setTimeout(() => {
-        refresh();
+        scheduleRefresh();
         saveState();
-      }, 80);
+      }, 150);
     });
 
     document.addEventListener('keydown', (e) => {
@@ -4214,29 +5166,29 @@ function applyHeatFilter(rows) {
           resetAll();
           return;
         }
-        if (drawerOverlay.classList.contains('show')) {
+        if (drawerOverlay && drawerOverlay.classList.contains('show')) {
           closeDrawer();
         } else {
           elSearch.value = '';
-          refresh();
+          scheduleRefresh();
           saveState();
         }
       }
     });
 
-    // header click sort
-    document.querySelectorAll('#tbl thead th').forEach(th => {
-      th.addEventListener('click', () => {
-        const k = th.getAttribute('data-k');
-        if (!k) return;
-        if (!userSort || userSort.k !== k) {
-          userSort = {k, dir: 'desc'};
-        } else {
-          userSort.dir = (userSort.dir === 'desc') ? 'asc' : 'desc';
-        }
-        refresh();
-        saveState();
-      });
+    // header click sort (one delegated listener on thead)
+    const elThead = document.querySelector('#tbl thead');
+    if (elThead) elThead.addEventListener('click', (e) => {
+      const th = e.target.closest('th[data-k]');
+      if (!th) return;
+      const k = th.getAttribute('data-k');
+      if (!userSort || userSort.k !== k) {
+        userSort = {k, dir: 'desc'};
+      } else {
+        userSort.dir = (userSort.dir === 'desc') ? 'asc' : 'desc';
+      }
+      scheduleRefresh();
+      saveState();
     });
     } catch (err) {
       const msg = (err && err.message) ? err.message : String(err);
@@ -4260,27 +5212,91 @@ function applyHeatFilter(rows) {
 </html>
 """
 
-    return (
-        template
-        .replace("__DATA_JSON__", data_json)
-        .replace("__PRESETS_JSON__", presets_json)
-        .replace("__PRESET_OPTIONS__", preset_options_html)
-        .replace("__BRIEFING_JSON__", briefing_json)
-        .replace("__HISTORY_DELTA_JSON__", history_delta_json)
-        .replace("__SEGMENT_MONITOR_JSON__", segment_monitor_json)
-        .replace("__REALITY_CHECK_JSON__", reality_check_json)
-        .replace("__MACRO_CHAIN_JSON__", macro_chain_json)
-        .replace("__BRIEFING_REALITIES_JSON__", briefing_realities_json)
-        .replace("__FALLBACK_TBODY__", fallback_tbody_html)
-        .replace("__VERSION__", str(version))
-        .replace("__BUILD__", str(build))
-        .replace("__RUN_AT__", str(run_at or ""))
-        .replace("__RUN_SRC__", str(run_src or ""))
-        .replace("__RUN_UNIVERSE__", str(run_universe or ""))
-        .replace("__SOURCE_CSV__", str(source_csv))
+# Literal segments at even indexes, __TOKEN__ names at odd indexes; rendering is one join.
+_TEMPLATE_PARTS = re.split(r"(__[A-Z][A-Z0-9_]*__)", _TEMPLATE)
+
+
+# UI labels for the built-in presets (server-side <option> fallback).
+_PRESET_LABELS = {
+    "ALL": "Alle Werte",
+    "CORE": "bersicht",
+    "SCORED": "Bewertet",
+    "TOP": "Top",
+    "TOP_RELAXED": "Top (entspannt)",
+    "AVOID": "Vermeiden",
+    "BROKEN": "Fehler/NA",
+}
+
+_PRESET_LABELS_ESC = {k: _esc(v) for k, v in _PRESET_LABELS.items()}
+
+# Pinned presets first (ALL, then CORE); everything else alphabetically after them.
+_PRESET_RANK = {"ALL": 0, "CORE": 1}
+
+
+def _preset_sort_key(name: str) -> tuple[int, str]:
+    return (_PRESET_RANK.get(name, 2), name)
+
+
+# Presets are static per process; avoid re-reading presets.json on every build_ui call.
+_cached_presets = functools.lru_cache(maxsize=1)(load_presets)
+
+
+def _preset_options_key(presets: dict[str, Any]) -> tuple[tuple[str, str], ...]:
+    """Hashable (name, description) snapshot of the presets, used as the options cache key."""
+    return tuple(
+        (str(n), str(((presets.get(n, {}) or {}).get("description", ""))).strip())
+        for n in (presets or {})
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _preset_options_html(key: tuple[tuple[str, str], ...]) -> str:
+    # Escaping is per character, so escaped parts can be concatenated as-is.
+    items = sorted(key, key=lambda item: _preset_sort_key(item[0]))
+    names = [_esc(n) for n, _ in items]
+    labels = [_PRESET_LABELS_ESC.get(n, en) for (n, _), en in zip(items, names)]
+    descs = [f"  {_esc(desc)}" if desc else "" for _, desc in items]
+    return "\n".join(
+        f'<option value="{en}">{lb} ({en}){ds}</option>' for en, lb, ds in zip(names, labels, descs)
     )
 
 
+def _render_html(*, data_table: dict[str, Any], presets: dict[str, Any], source_csv: str, version: str, build: str, briefing_text: str, briefing_source: str, history_delta: dict[str, Any], segment_monitor: dict[str, Any], reality_check: dict[str, Any], macro_chain_signal: dict[str, Any], briefing_realities_text: str, briefing_realities_source: str, run_at: str, run_src: str, run_universe: str, fallback_tbody_html: str) -> str:
+    data_json = _jdumps(data_table)
+    presets_json = _jdumps(presets)
+    briefing_json = _jdumps({"text": briefing_text, "source": briefing_source})
+    history_delta_json = _jdumps(history_delta or {})
+    segment_monitor_json = _jdumps(segment_monitor or {})
+    reality_check_json = _jdumps(reality_check or {})
+    macro_chain_json = _jdumps(macro_chain_signal or {})
+    briefing_realities_json = _jdumps({"text": briefing_realities_text, "source": briefing_realities_source})
+
+    # Server-side preset <option> fallback (so UI isn't empty if JS fails)
+    preset_options_html = _preset_options_html(_preset_options_key(presets))
+
+    values = {
+        "__DATA_JSON__": data_json,
+        "__PRESETS_JSON__": presets_json,
+        "__PRESET_OPTIONS__": preset_options_html,
+        "__BRIEFING_JSON__": briefing_json,
+        "__HISTORY_DELTA_JSON__": history_delta_json,
+        "__SEGMENT_MONITOR_JSON__": segment_monitor_json,
+        "__REALITY_CHECK_JSON__": reality_check_json,
+        "__MACRO_CHAIN_JSON__": macro_chain_json,
+        "__BRIEFING_REALITIES_JSON__": briefing_realities_json,
+        "__FALLBACK_TBODY__": fallback_tbody_html,
+        "__APP_CSS_HREF__": _APP_CSS_HREF,
+        "__VERSION__": str(version),
+        "__BUILD__": str(build),
+        "__RUN_AT__": str(run_at or ""),
+        "__RUN_SRC__": str(run_src or ""),
+        "__RUN_UNIVERSE__": str(run_universe or ""),
+        "__SOURCE_CSV__": str(source_csv),
+    }
+    # Unknown tokens (e.g. the JS sentinels __ALL__/__CLEAR__) pass through unchanged.
+    return "".join([values.get(part, part) for part in _TEMPLATE_PARTS])
+
+
 def _render_help_html_legacy_inline(*, version: str, build: str) -> str:
     """Generate a static help / project description page.
 
@@ -4584,8 +5600,12 @@ TELEGRAM_CHAT_ID=...</code></pre>
 </html>
 """
 
+_HELP_TEMPLATE_PATH = Path(__file__).resolve().parent / "templates" / "help.html"
+
+
+@functools.lru_cache(maxsize=4)
 def _render_help_html(*, version: str, build: str) -> str:
-    template_path = Path(__file__).resolve().parent / "templates" / "help.html"
+    template_path = _HELP_TEMPLATE_PATH
     try:
         template = template_path.read_text(encoding="utf-8")
     except FileNotFoundError as exc:
@@ -4593,19 +5613,49 @@ def _render_help_html(*, version: str, build: str) -> str:
 
     return (
         template
-        .replace("__VERSION__", html.escape(str(version)))
-        .replace("__BUILD__", html.escape(str(build)))
+        .replace("__VERSION__", _esc(str(version)))
+        .replace("__BUILD__", _esc(str(build)))
     )
 
 
+def _write_app_css(css_path: Path) -> None:
+    """Write app.css unless the file already holds exactly these bytes."""
+    data = _APP_CSS.encode("utf-8")
+    try:
+        if css_path.read_bytes() == data:
+            return
+    except OSError:
+        pass
+    css_path.write_bytes(data)
+
+
+def _write_help_html(help_path: Path, *, version: str, build: str) -> None:
+    """Write help.html unless the file already holds exactly the rendered bytes."""
+    data = _repair_mojibake_text(_render_help_html(version=version, build=build)).encode("utf-8-sig")
+    try:
+        if help_path.read_bytes() == data:
+            return
+    except OSError:
+        pass
+    help_path.write_bytes(data)
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--csv", default=r"artifacts/watchlist/watchlist_ALL.csv")
     ap.add_argument("--contract", default=r"configs/watchlist_contract.json")
     ap.add_argument("--out", default=r"artifacts/ui/index.html")
+    ap.add_argument("--fallback-rows", type=int, default=20, help="rows pre-rendered for browsers without JS (0 = none)")
+    ap.add_argument("--precompress", action="store_true", help="also write index.html.gz (and .br with brotli) for static servers")
     args = ap.parse_args()
 
-    out = build_ui(csv_path=args.csv, out_html=args.out, contract_path=args.contract)
+    out = build_ui(
+        csv_path=args.csv,
+        out_html=args.out,
+        contract_path=args.contract,
+        fallback_rows=args.fallback_rows,
+        precompress=args.precompress,
+    )
     print(f" UI wrote: {out.as_posix()}")
     print(f" Help wrote: {(out.parent / 'help.html').as_posix()}")
     return 0